@@ -0,0 +1,90 @@
+"""Ledger aggregates at 1M rows: the dict-row Python loops the screens used against analytics.LedgerAnalytics."""
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "component"))
+
+import numpy
+from analytics import LedgerAnalytics, INCOME, EXPENSE
+
+ROWS = 1_000_000
+SOURCES = 50
+
+
+def make_rows():
+    rng = random.Random(5)
+    start = date(2000, 1, 1)
+    dates = [(start + timedelta(days=day)).strftime("%b %d %Y") for day in range(ROWS // 100 + 1)]
+    return [{'flag': str(rng.randint(0, 1)), 'Date': dates[i // 100], 'Source': f"source {rng.randrange(SOURCES)}",
+             'Amount': str(rng.randrange(1, 10_000))} for i in range(ROWS)]
+
+
+def loop_totals(rows):
+    totals = {0: 0.0, 1: 0.0}
+    for row in rows:
+        totals[int(row['flag'])] += float(row['Amount'])
+    return totals
+
+
+def loop_by_source(rows):
+    by_source = {0: {}, 1: {}}
+    for row in rows:
+        sums = by_source[int(row['flag'])]
+        sums[row['Source']] = sums.get(row['Source'], 0) + float(row['Amount'])
+    return by_source
+
+
+def loop_by_day_and_source(rows):
+    summary = {}
+    for row in rows:
+        day = summary.setdefault(row['Date'], {})
+        day[row['Source']] = day.get(row['Source'], 0) + float(row['Amount'])
+    return summary
+
+
+def loop_running_balance(rows):
+    balance, running = 0.0, []
+    for row in rows:
+        balance += float(row['Amount']) if row['flag'] == '1' else -float(row['Amount'])
+        running.append(balance)
+    return running
+
+
+def loop_top_k(rows):
+    sums = loop_by_source(rows)[0]
+    ranked = sorted(sums.items(), key=lambda item: item[1], reverse=True)
+    return dict(ranked[:4]), sum(value for _, value in ranked[4:])
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    rows = make_rows()
+    sources = sorted({row['Source'] for row in rows})
+    ids = {source: index for index, source in enumerate(sources)}
+    start = date(2000, 1, 1).toordinal()
+    analytics = LedgerAnalytics(
+        numpy.array([int(row['flag']) for row in rows]), numpy.arange(ROWS) // 100 + start,
+        numpy.array([ids[row['Source']] for row in rows]), numpy.array([int(row['Amount']) * 100 for row in rows]),
+        sources)
+    cases = [
+        ("totals", loop_totals, analytics.totals),
+        ("by source", loop_by_source, lambda: (analytics.by_source(INCOME), analytics.by_source(EXPENSE))),
+        ("by day and source", loop_by_day_and_source, analytics.by_day_and_source),
+        ("running balance", loop_running_balance, analytics.running_balance),
+        ("top 4 expenses", loop_top_k, lambda: analytics.top_k(EXPENSE, 4)),
+    ]
+    print(f"{ROWS} rows, {SOURCES} sources{'':<6}python loops      numpy")
+    for label, loop, vectorised in cases:
+        print(f"  {label:<26}{timed(loop, rows):9.1f} ms{timed(vectorised):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cold dashboard and summary loads from data.csv against the columnar store, at 500k rows."""
+import csv
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+COMPONENT_PATH = Path(__file__).parent.parent / "component"
+sys.path.append(str(COMPONENT_PATH / "Dashboard"))
+sys.path.append(str(COMPONENT_PATH / "summary"))
+
+from aggregates import LedgerAggregates
+from columnar import ColumnarLedger, load_numpy
+from DataManager import DataManager
+
+ROWS = 500_000
+
+
+def write_ledger(path):
+    rng = random.Random(3)
+    start = date(2000, 1, 1)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["flag", "Date", "Source", "Amount"])
+        for i in range(ROWS):
+            writer.writerow([rng.randint(0, 1), (start + timedelta(days=i // 50)).strftime("%b %d %Y"),
+                             f"source {rng.randrange(2000)}", rng.randrange(1, 10_000)])
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    function()
+    print(f"  {label:<34}{(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.csv"
+        write_ledger(path)
+        ledger = ColumnarLedger(path)
+        print(f"{ROWS} rows, numpy {'available' if load_numpy() is not None else 'not installed'}")
+        timed("dashboard totals from CSV", LedgerAggregates(path).update)
+        timed("summary ledger from CSV", DataManager(path).get_data)
+        timed("columnar compact", ledger.compact)
+        timed("dashboard totals from columns", LedgerAggregates(path).update)
+        timed("summary ledger from columns", DataManager(path).get_data)
+        timed("column load (array.fromfile)", lambda: ledger.load(use_numpy=False))
+        shutil.rmtree(ledger.store_path)
+
+
+if __name__ == "__main__":
+    main()
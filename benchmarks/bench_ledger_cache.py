@@ -0,0 +1,66 @@
+"""Summary ledger loads at 100k rows: re-reading and re-sorting per call against the DataManager cache."""
+import csv
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "component" / "summary"))
+
+from DataManager import DataManager
+
+ROWS = 100_000
+
+
+def write_ledger(path, rows, start):
+    rng = random.Random(1)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["flag", "Date", "Source", "Amount"])
+        for i in range(rows):
+            day = start + timedelta(days=i // 50)
+            writer.writerow([rng.randint(0, 1), day.strftime("%b %d %Y"), f"source {rng.randrange(500)}",
+                             rng.randrange(1, 10_000)])
+    return start + timedelta(days=rows // 50)
+
+
+def strptime_date(row):
+    try:
+        return datetime.strptime(row[1], "%b %d %Y")
+    except ValueError:
+        return datetime.strptime(row[1], "%b %d %y")
+
+
+def uncached(path):
+    with open(path, "r", newline="") as file:
+        data = list(csv.reader(file))
+        return data[:1] + sorted(data[1:], key=strptime_date)
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.csv"
+        last = write_ledger(path, ROWS, date(2000, 1, 1))
+        manager = DataManager(path)
+        print(f"{ROWS} rows")
+        print(f"  re-read and sort per call: {timed(lambda: uncached(path)):9.1f} ms")
+        print(f"  cache, first load:         {timed(manager.get_data):9.1f} ms")
+        print(f"  cache, unchanged file:     {timed(manager.get_data):9.3f} ms")
+        with open(path, "a", newline="") as file:
+            csv.writer(file).writerows([[1, last.strftime("%b %d %Y"), "salary", 100]] * 100)
+        print(f"  cache, 100 appended rows:  {timed(manager.get_data):9.3f} ms")
+        with open(path, "a", newline="") as file:
+            csv.writer(file).writerows([[0, "Jan 05 2000", "late entry", 100]] * 10)
+        print(f"  cache, 10 back-dated rows: {timed(manager.get_data):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Ledger appends in rows/sec: the per-row open/append/close against LedgerWriter in each durability mode."""
+import csv
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "component"))
+
+from ledger_writer import LedgerWriter, DURABILITY
+
+ROWS = 20_000
+FSYNC_ROWS = 2_000  # fsync per row is slow enough that fewer rows give a stable figure
+THREADS = 8
+ROW = [0, "Feb 22 2024", "food", "550"]
+
+
+def open_close(path, rows):
+    for _ in range(rows):
+        with open(path, 'a', newline="") as file:
+            csv.writer(file).writerow(ROW)
+
+
+def writer_appends(path, rows, durability, threads=1):
+    writer = LedgerWriter(path, durability)
+
+    def submit():
+        for _ in range(rows // threads):
+            writer.append(ROW)
+
+    workers = [threading.Thread(target=submit) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    writer.close()
+
+
+def rate(function, path, rows, *args):
+    path.write_text("flag,Date,Source,Amount\n")
+    start = time.perf_counter()
+    function(path, rows, *args)
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.csv"
+        print(f"{'':<30}{'rows/sec':>12}")
+        print(f"  {'open/append/close per row':<28}{rate(open_close, path, ROWS):12,.0f}")
+        for durability in DURABILITY:
+            rows = FSYNC_ROWS if durability == "fsync" else ROWS
+            print(f"  {'writer, ' + durability:<28}{rate(writer_appends, path, rows, durability):12,.0f}")
+        print(f"  {f'writer, fsync, {THREADS} threads':<28}"
+              f"{rate(writer_appends, path, FSYNC_ROWS, 'fsync', THREADS):12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Login lookups against user_rec.csv: the row-by-row scan check_user used against the email index."""
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "component"))
+
+from repository import CsvUsers
+
+USER_COUNTS = (1_000, 10_000, 100_000)
+LOOKUPS = 200
+
+
+def write_users(path, count):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["user_name", "email", "password"])
+        writer.writerows([f"user{i}", f"user{i}@example.com", f"pass{i}"] for i in range(count))
+
+
+def scan(path, email, password):
+    with open(path, 'r') as file:
+        reader = csv.reader(file)
+        next(reader)  # Skip the field names
+        for line in reader:
+            if email == line[1] and password == line[2]:
+                return line
+    return None
+
+
+def indexed(users, email, password):
+    user = users.find(email)
+    return user if user is not None and user[2] == password else None
+
+
+def per_login(function, *args, count):
+    emails = [(f"user{i}@example.com", f"pass{i}") for i in range(count - 1, 0, -max(1, count // LOOKUPS))][:LOOKUPS]
+    start = time.perf_counter()
+    for email, password in emails:
+        assert function(*args, email, password) is not None
+    return (time.perf_counter() - start) * 1e6 / len(emails)
+
+
+def main():
+    print(f"{'users':>8}{'csv scan':>14}{'index build':>14}{'indexed':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "user_rec.csv"
+        for count in USER_COUNTS:
+            write_users(path, count)
+            users = CsvUsers(path)
+            start = time.perf_counter()
+            users.find("")
+            build = (time.perf_counter() - start) * 1000
+            print(f"{count:>8}{per_login(scan, path, count=count):11.1f} us{build:11.1f} ms"
+                  f"{per_login(indexed, users, count=count):9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
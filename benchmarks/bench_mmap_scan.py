@@ -0,0 +1,101 @@
+"""Peak RSS and time of the dashboard source totals of a large data.csv, per scan path.
+
+Every path runs in a fresh interpreter, which reports its own peak resident set size:
+``DictReader`` (streamed, a dict per row), ``read_csv`` (the repository's cold read, which holds
+a list per row, summed like LedgerAggregates.fold) and ``mmap`` (mmap_scan.source_totals).
+``--megabytes`` sets the size of the generated ledger (default 1024); ``--path`` measures an
+existing ledger instead.
+"""
+import argparse
+import csv
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+COMPONENT_PATH = Path(__file__).parent.parent / "component"
+sys.path.append(str(COMPONENT_PATH))
+
+
+def write_ledger(path, megabytes):
+    rng = random.Random(3)
+    start = date(2000, 1, 1)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["flag", "Date", "Source", "Amount"])
+        while file.tell() < megabytes << 20:
+            writer.writerows([rng.randint(0, 1), (start + timedelta(days=rng.randrange(3000))).strftime("%b %d %Y"),
+                              f"source {rng.randrange(2000)}", rng.randrange(1, 10_000)] for _ in range(10_000))
+
+
+def fold(rows):
+    totals = {0: {}, 1: {}}
+    for row in rows:
+        sums = totals.setdefault(int(row[0]), {})
+        sums[row[2]] = sums.get(row[2], 0) + float(row[3])
+    return totals
+
+
+def dict_reader(path):
+    with open(path, newline="") as file:
+        return fold((row["flag"], row["Date"], row["Source"], row["Amount"]) for row in csv.DictReader(file))
+
+
+def repository_read(path):
+    from repository import read_csv
+    return fold(read_csv(path)[0])
+
+
+def mmap_scan(path):
+    from mmap_scan import source_totals
+    return source_totals(path)[0]
+
+
+PATHS = {"baseline": lambda path: None, "DictReader": dict_reader, "read_csv": repository_read, "mmap": mmap_scan}
+
+
+def child(name, path):
+    start = time.perf_counter()
+    PATHS[name](path)
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    print(json.dumps({"seconds": seconds, "peak": peak}))
+
+
+def measure(name, path):
+    """The child's report, or None when it was killed, which on Linux usually means out of memory."""
+    process = subprocess.run([sys.executable, __file__, "--child", name, str(path)], capture_output=True, text=True)
+    if process.returncode < 0:
+        return None
+    process.check_returncode()
+    return json.loads(process.stdout)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=1024)
+    parser.add_argument("--path")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        return child(*args.child)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(args.path) if args.path else Path(directory) / "data.csv"
+        if not args.path:
+            write_ledger(path, args.megabytes)
+        print(f"{path.stat().st_size / 1e6:.0f} MB ledger")
+        for name in PATHS:
+            result = measure(name, path)
+            if result is None:
+                print(f"  {name:<12}killed, out of memory")
+                continue
+            print(f"  {name:<12}{result['seconds'] * 1000:10.1f} ms  peak RSS {result['peak'] / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
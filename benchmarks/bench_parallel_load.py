@@ -0,0 +1,62 @@
+"""Cold totals and sorted view of a large data.csv, single process against parallel_load on 1..N cores.
+
+``--rows`` sets the size of the generated ledger (default 4M rows, about 130 MB); ``--workers``
+lists the process counts to try (default 1, 2, 4 ... up to the number of CPUs).
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+COMPONENT_PATH = Path(__file__).parent.parent / "component"
+sys.path.append(str(COMPONENT_PATH))
+
+from parallel_load import sorted_runs, summarize
+from repository import read_csv
+
+
+def write_ledger(path, rows):
+    rng = random.Random(3)
+    start = date(2000, 1, 1)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["flag", "Date", "Source", "Amount"])
+        for _ in range(rows):
+            writer.writerow([rng.randint(0, 1), (start + timedelta(days=rng.randrange(3000))).strftime("%b %d %Y"),
+                             f"source {rng.randrange(2000)}", rng.randrange(1, 10_000)])
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(argv):
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=4_000_000)
+    parser.add_argument("--workers", type=int, nargs="*",
+                        default=sorted({1 << n for n in range(cpus.bit_length()) if 1 << n <= cpus} | {cpus}))
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.csv"
+        write_ledger(path, args.rows)
+        print(f"{args.rows} rows, {path.stat().st_size / 1e6:.0f} MB, {cpus} CPUs")
+        print(f"  {'csv.reader, one process':<28}{timed(lambda: read_csv(path)) * 1000:9.1f} ms")
+        for task, function in (("totals", summarize), ("sorted view", sorted_runs)):
+            baseline = None
+            for workers in args.workers:
+                seconds = timed(lambda: function(path, workers))
+                baseline = baseline or seconds
+                print(f"  {task + f', {workers} process(es)':<28}{seconds * 1000:9.1f} ms"
+                      f"  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
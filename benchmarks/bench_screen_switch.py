@@ -0,0 +1,65 @@
+"""Screen switch latency: one interpreter per switch (the old os.system navigation) against the router.
+
+Needs a display; on a headless box run it under Xvfb, e.g. ``xvfb-run python benchmarks/bench_screen_switch.py``.
+"""
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+COMPONENT_PATH = Path(__file__).parent.parent / "component"
+sys.path.append(str(COMPONENT_PATH))
+
+from router import ScreenRouter, SCREENS, create_window
+
+ORDER = ["dashboard", "income", "expense", "summary", "login", "registration"]
+ROUNDS = 5
+
+# What every click used to cost: a fresh interpreter that imports the screen, loads its assets and builds it.
+SPAWN = """
+import sys
+sys.path.append({component!r})
+from router import ScreenRouter, create_window
+router = ScreenRouter(create_window())
+router.show({name!r})
+router.window.update()
+router.window.destroy()
+"""
+
+
+def spawn_switch(name):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", SPAWN.format(component=str(COMPONENT_PATH), name=name)], check=True)
+    return time.perf_counter() - start
+
+
+def router_switch(router, name):
+    start = time.perf_counter()
+    router.show(name)
+    router.window.update()
+    return time.perf_counter() - start
+
+
+def main():
+    names = [name for name in ORDER if name in SCREENS]
+    spawned = {name: min(spawn_switch(name) for _ in range(ROUNDS)) for name in names}
+
+    start = time.perf_counter()
+    router = ScreenRouter(create_window())
+    startup = time.perf_counter() - start
+    first = {name: router_switch(router, name) for name in names}
+    warm = {name: [] for name in names}
+    for _ in range(ROUNDS):
+        for name in names:
+            warm[name].append(router_switch(router, name))
+    router.window.destroy()
+
+    print(f"router startup (Tk root only): {startup * 1000:.1f} ms")
+    print(f"{'screen':<14}{'spawn':>12}{'first show':>14}{'switch':>12}")
+    for name in names:
+        print(f"{name:<14}{spawned[name] * 1000:>10.1f}ms{first[name] * 1000:>12.1f}ms"
+              f"{min(warm[name]) * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Cold start of every screen entry point against a time budget per phase.
+
+Each component/<screen>/main.py is launched in a fresh interpreter with ``--profile=... --profile-exit``
+(see component/startup.py), under ``xvfb-run`` when there is no DISPLAY. The per-phase timings of
+the reports are printed and the script exits with status 1 if any phase, or a screen's total,
+goes over its budget. ``--budget budgets.json`` overrides the budgets below with a JSON object of
+the same shape; ``--runs N`` keeps the best of N launches of each screen.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+COMPONENT_PATH = Path(__file__).parent.parent / "component"
+
+ENTRY_POINTS = {
+    "login": "login/main.py",
+    "registration": "registration/main.py",
+    "dashboard": "Dashboard/main.py",
+    "income": "income/main.py",
+    "expense": "expense/main.py",
+    "summary": "summary/main.py",
+}
+
+# milliseconds; "total" is the whole launch, phases are matched by name with the screen filled in
+BUDGETS = {
+    "total": 1500,
+    "window": 150,
+    "import {screen}": 400,
+    "build {screen}": 400,
+    "import tkcalendar": 250,
+    "asset decode": 150,
+    "csv parse": 200,
+    "columnar load": 100,
+    "first paint": 200,
+    "background loads": 500,
+}
+
+
+def launcher():
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return []
+    if shutil.which("xvfb-run") is None:
+        sys.exit("no DISPLAY and xvfb-run is not installed")
+    return ["xvfb-run", "-a"]
+
+
+def launch(screen, entry_point, directory):
+    report_path = Path(directory) / f"{screen}.json"
+    subprocess.run(launcher() + [sys.executable, str(COMPONENT_PATH / entry_point),
+                                 f"--profile={report_path}", "--profile-exit"], check=True, cwd=COMPONENT_PATH)
+    with open(report_path) as file:
+        return json.load(file)
+
+
+def over_budget(screen, report, budgets):
+    phases = {phase["name"]: phase["ms"] for phase in report["phases"]}
+    phases["total"] = report["total_ms"]
+    failures = []
+    for name, budget in budgets.items():
+        name = name.format(screen=screen)
+        if name in phases and phases[name] > budget:
+            failures.append(f"{screen}: {name} took {phases[name]:.1f} ms, budget {budget} ms")
+    return failures
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", help="JSON file of {phase: milliseconds}")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("screens", nargs="*", default=list(ENTRY_POINTS))
+    args = parser.parse_args(argv)
+    budgets = dict(BUDGETS)
+    if args.budget:
+        with open(args.budget) as file:
+            budgets.update(json.load(file))
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        for screen in args.screens:
+            report = min((launch(screen, ENTRY_POINTS[screen], directory) for _ in range(args.runs)),
+                         key=lambda report: report["total_ms"])
+            print(f"{screen:<14}{report['total_ms']:9.1f} ms total")
+            for phase in report["phases"]:
+                print(f"    {phase['name']:<24}{phase['ms']:9.1f} ms  x{phase['count']}")
+            failures += over_budget(screen, report, budgets)
+    for failure in failures:
+        print("OVER BUDGET", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
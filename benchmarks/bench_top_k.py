@@ -0,0 +1,49 @@
+"""Top-K dashboard categories: the old full sort-and-slice against the bounded heap in top_k.TopK."""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "component" / "Dashboard"))
+
+from top_k import TopK
+
+K = 4
+
+
+def sort_and_slice(totals):
+    sorted_data = dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+    top = dict(list(sorted_data.items())[:K])
+    top['Others'] = sum(list(sorted_data.values())[K:])
+    return top
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(42)
+    for categories in (100_000, 1_000_000):
+        totals = {f"source {i}": rng.random() * 10_000 for i in range(categories)}
+        print(f"{categories:>9} categories: sort-and-slice {timed(sort_and_slice, totals) * 1000:8.1f} ms, "
+              f"heap {timed(lambda: TopK(K, totals).result()) * 1000:8.1f} ms")
+
+        # Refresh after appending rows: the old path re-sorts everything, the heap only sees the new rows.
+        top = TopK(K, totals)
+        appended = [(f"source {rng.randrange(categories)}", rng.random() * 100) for _ in range(1000)]
+
+        def fold():
+            for source, amount in appended:
+                totals[source] += amount
+                top.update(source, totals[source], amount)
+            return top.result()
+
+        print(f"{'':>21}1000 appended rows: re-sort {timed(sort_and_slice, totals) * 1000:8.1f} ms, "
+              f"heap {timed(fold) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
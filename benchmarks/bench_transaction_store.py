@@ -0,0 +1,54 @@
+"""Bytes per transaction at 1M rows: MoneyManagerApp's list of tuples against TransactionStore."""
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dashboard3 import TransactionStore
+
+ROWS = 1_000_000
+CATEGORIES = ["food", "rent", "salary", "bus", "tuition", "loan", "gift", "tour"]
+
+
+def entries():
+    # Entry.get() and strftime hand back a new str for every transaction, so build fresh ones too
+    rng = random.Random(7)
+    for i in range(ROWS):
+        yield (f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", rng.choice(("Income", "Expense")),
+               "".join(rng.choice(CATEGORIES)), rng.randrange(1, 1_000_000) / 100)
+
+
+def measure(build):
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def tuples():
+    transactions = []
+    for row in entries():
+        transactions.append(row)
+    return transactions
+
+
+def store():
+    transactions = TransactionStore()
+    for day, transaction_type, category, amount in entries():
+        transactions.append(day, transaction_type, category, round(amount * 100))
+    return transactions
+
+
+def main():
+    print(f"{ROWS} transactions{'':<8}MB   bytes/transaction")
+    for label, build in (("list of tuples", tuples), ("TransactionStore", store)):
+        size = measure(build)
+        print(f"  {label:<20}{size / 2 ** 20:8.1f}{size / ROWS:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import sys
+from pathlib import Path
+from top_k import TopK
+
+sys.path.append(str(Path(__file__).parent.parent))
+from mmap_scan import source_totals
+from parallel_load import summarize, worth_splitting
+from repository import CsvLedger, cursor_at, ledger_repository
+try:
+    from analytics import LedgerAnalytics
+except ImportError:  # NumPy not installed
+    LedgerAnalytics = None
+
+EXPENSE, INCOME = 0, 1
+
+
+class LedgerAggregates:
+    """Per flag and Source totals of the ledger, folded in incrementally.
+
+    The store keeps the repository cursor it has read up to (a byte offset for data.csv, a row
+    id for SQLite), so each update only folds in the rows stored since the last one. When the
+    repository starts over because the ledger was rewritten, the totals are rebuilt. A current
+    columnar copy of data.csv seeds the totals so only the CSV rows written after it are parsed;
+    without one the CSV is first scanned through a memory map (see mmap_scan.py), or on all
+    cores when it is large (see parallel_load.py).
+    """
+
+    def __init__(self, filename):
+        self.filename = Path(filename)
+        self.ledger = ledger_repository(self.filename)
+        self.reset()
+
+    def reset(self):
+        self.cursor = None
+        self.totals = {EXPENSE: {}, INCOME: {}}
+        self.tops = {}
+
+    def seed(self):
+        stored = self.ledger.columns()
+        if stored is None:
+            if worth_splitting(self.ledger):
+                summary, self.cursor = summarize(self.filename)
+                sources = summary.sources
+            elif isinstance(self.ledger, CsvLedger) and self.filename.exists():
+                stat = os.stat(self.filename)
+                sources, end, _ = source_totals(self.filename)
+                self.cursor = cursor_at(self.filename, end, (stat.st_size, stat.st_mtime_ns))
+            else:
+                return
+            self.totals.update({flag: {source: amount / 100 for source, amount in sums.items()}
+                                for flag, sums in sources.items()})
+            return
+        columns, self.cursor = stored
+        if LedgerAnalytics is not None:
+            analytics = LedgerAnalytics.from_columns(columns)
+            self.totals.update({flag: analytics.by_source(flag) for flag in (EXPENSE, INCOME)})
+        else:
+            self.totals.update(columns.totals())
+
+    def update(self):
+        if self.cursor is None:
+            self.seed()
+        rows, cursor, reset = self.ledger.read(self.cursor)
+        if reset and self.cursor is not None:
+            self.reset()
+            self.seed()
+            rows, cursor, reset = self.ledger.read(self.cursor)
+        self.fold(rows)
+        self.cursor = cursor
+        return self.totals
+
+    def fold(self, rows):
+        for row in rows:
+            flag, source, amount = int(row[0]), row[2], float(row[3])
+            totals = self.totals.setdefault(flag, {})
+            totals[source] = totals.get(source, 0) + amount
+            for (top_flag, _), top in self.tops.items():
+                if top_flag == flag:
+                    top.update(source, totals[source], amount)
+
+    def top(self, flag, k):
+        """Top ``k`` sources of a flag plus "Others"; maintained from then on as rows are folded in."""
+        if (flag, k) not in self.tops:
+            self.tops[flag, k] = TopK(k, self.totals.get(flag))
+        return self.tops[flag, k].result()
+
+
+_stores = {}
+
+
+def get_aggregates(filename):
+    """Return the shared store for a ledger file, so every dashboard widget folds rows only once."""
+    key = os.path.abspath(filename)
+    if key not in _stores:
+        _stores[key] = LedgerAggregates(filename)
+    return _stores[key]
@@ -1,7 +1,12 @@
+import sys
+import time
 from datetime import datetime
-from tkinter import Label, PhotoImage, TclError,Frame
+from tkinter import Label, TclError,Frame
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent))
+from assets import photo
+
 
 class Header:
     def __init__(self, window):
@@ -26,13 +31,24 @@ class Header:
         # Profile
         profile_image_path = self.relative_to_assets("avatar.png")
         try:
-            profile_photo = PhotoImage(file=profile_image_path)
+            profile_photo = photo(window, profile_image_path)
         except TclError:
             profile_photo = None
             print(f"Profile image not found: {profile_image_path}")
         self.profile_label = Label(window, image=profile_photo, bg='#C07BB5')
         self.profile_label.image = profile_photo
         self.profile_label.place(x=315, y=8)
+        self.schedule_tick()
+
+    def schedule_tick(self):
+        """Update the clock and greeting just after the next minute starts."""
+        delay = int(1000 * (60 - time.time() % 60)) + 50
+        self.header.after(delay, self.tick)
+
+    def tick(self):
+        self.time_label.config(text=f'It\'s  {self.get_time()}')
+        self.greeting_text.config(text=self.get_greeting())
+        self.schedule_tick()
 
     def get_time(self):
         return datetime.now().strftime("%H:%M")
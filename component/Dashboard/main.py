@@ -1,23 +1,46 @@
-from tkinter import Tk
+import sys
+from pathlib import Path
 from header import Header
 from body import Body
 from show_info import ShowInfo
+from file_handling import TOP_K
 
+sys.path.append(str(Path(__file__).parent.parent))
+from background import Loader
+from ledger_events import ledger_events, Repaint
 
-class Main:
-    def __init__(self):
-        window = Tk()
-        window.geometry("1116x582")
-        window.configure(bg="#28283F")
-        window.title("Money Manager")
-        window.geometry("+150+40")
 
-        self.body = Body(window)
+class Main:
+    def __init__(self, window, top_k=TOP_K):
+        self.window = window
+        self.body = Body(window, top_k)
         self.header = Header(window)
-        self.footer=ShowInfo(window)
+        self.footer=ShowInfo(window, top_k)
+        # the totals are read on a worker; charts and cards show placeholders until they arrive
+        self.loader = Loader(window, self.body.file_handler.calculate_income_expenses, self.fill)
+        # appends repaint the dashboard while it is shown, at most once per frame however many rows arrive
+        self.repaint = Repaint(window, self.refresh)
+        self.unsubscribe = None
+        self.refresh()
+
+    def refresh(self):
+        if self.unsubscribe is None:
+            self.unsubscribe = ledger_events.subscribe(self.body.file_handler.filename, self.repaint.request)
+        self.loader.start()
+
+    def fill(self, totals):
+        self.body.draw_pie_charts(totals)
+        self.footer.update_balance_labels(totals)
+        self.footer.display_balance_labels()
 
-        window.resizable(False, False)
-        window.mainloop()
+    def leave(self):
+        # a hidden dashboard doesn't follow appends; the router's refresh() on the way back catches up
+        if self.unsubscribe is not None:
+            self.unsubscribe()
+            self.unsubscribe = None
+        self.repaint.cancel()
+        self.loader.cancel()
 
 if __name__ == "__main__":
-    main = Main()
+    from router import run
+    run("dashboard")
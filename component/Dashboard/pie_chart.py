@@ -0,0 +1,80 @@
+from functools import lru_cache
+from itertools import cycle
+
+LEGEND_GAP, LEGEND_BOX, LEGEND_TEXT_X, LEGEND_TEXT_Y = 5, 20, 25, 10
+FULL_CIRCLE = 359.999  # Tk draws nothing for an arc whose extent is exactly 360
+
+
+@lru_cache(maxsize=64)
+def pie_geometry(items, x, y, radius, colors):
+    """Wedges (start, extent, colour) and legend rows (box, text position, text, colour) of a chart.
+
+    ``items`` is the chart's (category, value) pairs as a tuple, so a snapshot of the totals that
+    has been drawn before is laid out from the cache. Wedges are left out when nothing is above zero.
+    """
+    total = sum(value for _, value in items)
+    wedges, legend = [], []
+    start = 0
+    legend_x, legend_y = x + radius + LEGEND_GAP, y - radius
+    for (category, value), color in zip(items, cycle(colors)):
+        if total > 0:
+            extent = min(360 * value / total, FULL_CIRCLE)
+            wedges.append((start, extent, color))
+            start += extent
+        legend.append(((legend_x, legend_y, legend_x + LEGEND_BOX, legend_y + LEGEND_BOX),
+                       (legend_x + LEGEND_TEXT_X, legend_y + LEGEND_TEXT_Y), f"{category} ({value})", color))
+        legend_y += LEGEND_TEXT_X
+    return tuple(wedges), tuple(legend)
+
+
+class PieChart:
+    """A pie chart with legend on a canvas that redraws by reconfiguring the items it already has.
+
+    Drawing the totals that are already shown costs no Tk calls. Otherwise existing arcs, legend
+    boxes and labels are moved and recoloured with ``coords``/``itemconfig``, new ones are only
+    created when there are more categories than ever before and spare ones are hidden, so the
+    number of canvas items never grows past the largest chart drawn.
+    """
+
+    def __init__(self, canvas, title, x, y, radius, colors):
+        self.canvas = canvas
+        self.x, self.y, self.radius = x, y, radius
+        self.colors = tuple(colors)
+        self.arcs, self.boxes, self.labels = [], [], []
+        self.items = None
+        canvas.create_text(x + 10, y - radius - 30, text=title, font=('Arial', 14, 'bold'))
+        self.empty = canvas.create_text(x, y, text="No data yet", font=('Arial', 12), state="hidden")
+
+    def loading(self):
+        """Skeleton shown while the totals are loaded: the chart's items hidden behind a placeholder."""
+        self.items = None
+        for item in self.arcs + self.boxes + self.labels:
+            self.canvas.itemconfig(item, state="hidden")
+        self.canvas.itemconfig(self.empty, text="Loading...", state="normal")
+
+    def draw(self, data):
+        items = tuple(data.items())
+        if items == self.items:
+            return
+        self.items = items
+        self.canvas.itemconfig(self.empty, text="No data yet")
+        wedges, legend = pie_geometry(items, self.x, self.y, self.radius, self.colors)
+        x, y, radius = self.x, self.y, self.radius
+        bounds = (x - radius, y - radius, x + radius, y + radius)
+        for index, (start, extent, color) in enumerate(wedges):
+            if index < len(self.arcs):
+                self.canvas.itemconfig(self.arcs[index], start=start, extent=extent, fill=color, state="normal")
+            else:
+                self.arcs.append(self.canvas.create_arc(*bounds, start=start, extent=extent, fill=color))
+        for index, (box, text_position, text, color) in enumerate(legend):
+            if index < len(self.boxes):
+                self.canvas.coords(self.boxes[index], *box)
+                self.canvas.itemconfig(self.boxes[index], fill=color, state="normal")
+                self.canvas.coords(self.labels[index], *text_position)
+                self.canvas.itemconfig(self.labels[index], text=text, state="normal")
+            else:
+                self.boxes.append(self.canvas.create_rectangle(*box, fill=color))
+                self.labels.append(self.canvas.create_text(*text_position, text=text, anchor='w'))
+        for item in self.arcs[len(wedges):] + self.boxes[len(legend):] + self.labels[len(legend):]:
+            self.canvas.itemconfig(item, state="hidden")
+        self.canvas.itemconfig(self.empty, state="hidden" if wedges else "normal")
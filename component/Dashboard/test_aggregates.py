@@ -0,0 +1,67 @@
+import pytest
+from aggregates import LedgerAggregates, INCOME, EXPENSE
+from columnar import ColumnarLedger
+import parallel_load
+
+HEADER = "flag,Date,Source,Amount\n"
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(HEADER + "1,Feb 27 2024,tution,3000\n0,Feb 22 2024,food,550\n")
+    return path
+
+
+def test_repeated_source_is_added(ledger):
+    with open(ledger, "a") as file:
+        file.write("0,Mar 01 2024,food,450\n")
+    totals = LedgerAggregates(ledger).update()
+    assert totals[EXPENSE] == {'food': 1000}
+    assert totals[INCOME] == {'tution': 3000}
+
+
+def test_only_appended_rows_are_folded(ledger):
+    aggregates = LedgerAggregates(ledger)
+    aggregates.update()
+    consumed = aggregates.cursor.offset
+    with open(ledger, "a") as file:
+        file.write("1,Mar 04 2024,scholarship,5000\n")
+    aggregates.update()
+    assert aggregates.cursor.offset == ledger.stat().st_size > consumed
+    assert aggregates.totals[INCOME] == {'tution': 3000, 'scholarship': 5000}
+
+
+def test_partial_row_waits_for_newline(ledger):
+    aggregates = LedgerAggregates(ledger)
+    with open(ledger, "a") as file:
+        file.write("0,Mar 07 2024,tour,7")
+    assert 'tour' not in aggregates.update()[EXPENSE]
+    with open(ledger, "a") as file:
+        file.write("00\n")
+    assert aggregates.update()[EXPENSE]['tour'] == 700
+
+
+def test_rewritten_file_is_rebuilt(ledger):
+    aggregates = LedgerAggregates(ledger)
+    aggregates.update()
+    ledger.write_text(HEADER + "1,Feb 27 2024,salary,9000\n0,Feb 22 2024,rent,4000\n")
+    assert aggregates.update() == {EXPENSE: {'rent': 4000}, INCOME: {'salary': 9000}}
+
+
+def test_columnar_store_seeds_totals(ledger):
+    ColumnarLedger(ledger).compact()
+    with open(ledger, "a") as file:
+        file.write("0,Mar 01 2024,food,450\n")
+    aggregates = LedgerAggregates(ledger)
+    assert aggregates.update() == {EXPENSE: {'food': 1000}, INCOME: {'tution': 3000}}
+    assert aggregates.cursor.offset == ledger.stat().st_size
+
+
+def test_large_ledger_is_seeded_by_the_parallel_read(ledger, monkeypatch):
+    monkeypatch.setattr(parallel_load, "PARALLEL_MIN_BYTES", 0)
+    aggregates = LedgerAggregates(ledger)
+    assert aggregates.update() == {EXPENSE: {'food': 550}, INCOME: {'tution': 3000}}
+    with open(ledger, "a") as file:
+        file.write("0,Mar 01 2024,food,450\n")
+    assert aggregates.update()[EXPENSE] == {'food': 1000}
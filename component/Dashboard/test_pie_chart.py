@@ -14,3 +14,66 @@ def body():
 def test_draw_pie_charts(body):
     body.draw_pie_charts()
     assert len(body.canvas.find_all()) > 0
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+
+    def create(self, kind, options):
+        self.calls += 1
+        self.items[len(self.items) + 1] = dict(options, kind=kind)
+        return len(self.items)
+
+    def create_arc(self, *coords, **options):
+        return self.create("arc", options)
+
+    def create_rectangle(self, *coords, **options):
+        return self.create("rectangle", options)
+
+    def create_text(self, *coords, **options):
+        return self.create("text", options)
+
+    def coords(self, item, *coords):
+        self.calls += 1
+
+    def itemconfig(self, item, **options):
+        self.calls += 1
+        self.items[item].update(options)
+
+    def visible(self, kind):
+        return [item for item in self.items.values() if item["kind"] == kind and item.get("state") != "hidden"]
+
+
+def chart():
+    from pie_chart import PieChart
+    return PieChart(FakeCanvas(), "Income Details", x=120, y=175, radius=120, colors=['#FF9999', '#66B2FF'])
+
+
+def test_empty_ledger_draws_no_wedges():
+    pie = chart()
+    pie.draw({})
+    pie.draw({'Others': 0})
+    assert pie.canvas.visible("arc") == []
+    assert pie.canvas.items[pie.empty]["state"] == "normal"
+
+
+def test_redraw_reuses_items():
+    pie = chart()
+    pie.draw({'Salary': 5000, 'Investment': 2000, 'Others': 1000})
+    count = len(pie.canvas.items)
+    pie.draw({'Salary': 6000, 'Others': 1000})
+    pie.draw({'Salary': 6000, 'Investment': 2500, 'Others': 1000})
+    assert len(pie.canvas.items) == count
+    assert [arc["extent"] for arc in pie.canvas.visible("arc")] == [360 * 6000 / 9500, 360 * 2500 / 9500,
+                                                                    360 * 1000 / 9500]
+    calls = pie.canvas.calls
+    pie.draw({'Salary': 6000, 'Investment': 2500, 'Others': 1000})
+    assert pie.canvas.calls == calls
+
+
+def test_single_category_fills_the_circle():
+    pie = chart()
+    pie.draw({'Salary': 5000})
+    assert 359.9 < pie.canvas.visible("arc")[0]["extent"] < 360
@@ -0,0 +1,33 @@
+import random
+from top_k import TopK
+
+
+def sort_and_slice(totals, k):
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    top = dict(ranked[:k])
+    top['Others'] = sum(value for _, value in ranked[k:])
+    return top
+
+
+def test_streaming_matches_sort_and_slice():
+    rng = random.Random(7)
+    totals, top = {}, TopK(4)
+    for _ in range(2000):
+        source, amount = f"source{rng.randrange(60)}", rng.randrange(1, 500) + rng.random()
+        totals[source] = totals.get(source, 0) + amount
+        top.update(source, totals[source], amount)
+    expected = sort_and_slice(totals, 4)
+    result = top.result()
+    assert list(result) == list(expected)
+    assert abs(result['Others'] - expected['Others']) < 1e-6
+
+
+def test_seeded_from_existing_totals():
+    top = TopK(2, {'rent': 900, 'food': 300, 'bus': 100})
+    assert top.result() == {'rent': 900, 'food': 300, 'Others': 100}
+    top.update('bus', 600, 500)
+    assert top.result() == {'rent': 900, 'bus': 600, 'Others': 300}
+
+
+def test_fewer_categories_than_k():
+    assert TopK(4, {'salary': 5000}).result() == {'salary': 5000, 'Others': 0}
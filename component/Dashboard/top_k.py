@@ -0,0 +1,52 @@
+import heapq
+
+
+class TopK:
+    """The K largest category totals plus an "Others" remainder, kept up to date as rows arrive.
+
+    Ledger amounts are positive, so a category total only ever grows: a category outside the top K
+    can only get in by overtaking the current minimum, which the min-heap gives in O(log K).
+    Entries of members whose total grew are left stale in the heap and skipped when popped.
+    """
+
+    def __init__(self, k, totals=None):
+        self.k = k
+        self.members = {}
+        self.heap = []
+        self.total = 0
+        if totals:
+            self.total = sum(totals.values())
+            self.members = dict(heapq.nlargest(k, totals.items(), key=lambda item: item[1]))
+            self.compact()
+
+    def compact(self):
+        self.heap = [(value, source) for source, value in self.members.items()]
+        heapq.heapify(self.heap)
+
+    def minimum(self):
+        while self.members.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        return self.heap[0]
+
+    def update(self, source, total, delta):
+        """Record that ``source`` now totals ``total`` after growing by ``delta``."""
+        self.total += delta
+        if self.k <= 0:
+            return
+        if source in self.members:
+            self.members[source] = total
+        elif len(self.members) < self.k:
+            self.members[source] = total
+        elif total > self.minimum()[0]:
+            del self.members[heapq.heappop(self.heap)[1]]
+            self.members[source] = total
+        else:
+            return
+        heapq.heappush(self.heap, (total, source))
+        if len(self.heap) > 2 * self.k:
+            self.compact()
+
+    def result(self):
+        top = dict(sorted(self.members.items(), key=lambda item: item[1], reverse=True))
+        top['Others'] = self.total - sum(top.values())
+        return top
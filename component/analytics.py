@@ -0,0 +1,125 @@
+"""Income/expense breakdowns over the whole ledger with NumPy.
+
+The ledger is loaded once into arrays (from the columnar store when it is current, plus any CSV
+rows written after it) and every aggregate is a vectorised bincount/cumsum/argpartition over
+them. NumPy is optional for the app: importing this module raises ImportError without it, and
+callers fall back to their plain loops.
+"""
+import numpy
+
+from columnar import ColumnarLedger, CSV_PATH, COLUMNS
+from ledger_dates import month_key, to_date
+
+EXPENSE, INCOME = 0, 1
+
+
+class LedgerAnalytics:
+    def __init__(self, flag, day, source, amount, sources, offset=0):
+        self.flag = numpy.asarray(flag, dtype=numpy.uint8)
+        self.day = numpy.asarray(day, dtype=numpy.int32)
+        self.source = numpy.asarray(source, dtype=numpy.int32)
+        self.amount = numpy.asarray(amount, dtype=numpy.int64)  # minor units
+        self.sources = sources
+        self.offset = offset
+
+    @classmethod
+    def from_columns(cls, columns):
+        return cls(columns.flag, columns.date, columns.source, columns.amount, columns.sources, columns.offset)
+
+    @classmethod
+    def load(cls, csv_path=CSV_PATH):
+        """The whole ledger: the columnar store if it is current, then the CSV rows after it."""
+        ledger = ColumnarLedger(csv_path)
+        columns = ledger.load()
+        if columns is None:
+            sources, offset = [], 0
+            stored = {name: numpy.zeros(0, dtype=dtype) for name, (_, dtype) in COLUMNS.items()}
+        else:
+            sources, offset = list(columns.sources), columns.offset
+            stored = {"flag": columns.flag, "date": columns.date, "source": columns.source, "amount": columns.amount}
+        new, _, offset = ledger.encode_csv(offset, sources)
+        merged = {name: numpy.concatenate([stored[name], numpy.frombuffer(new[name], dtype=new[name].typecode)])
+                  for name in COLUMNS}
+        return cls(merged["flag"], merged["date"], merged["source"], merged["amount"], sources, offset)
+
+    def __len__(self):
+        return len(self.flag)
+
+    def signed(self):
+        return numpy.where(self.flag == INCOME, self.amount, -self.amount)
+
+    def totals(self):
+        """Total income, total expense and balance."""
+        income = int(self.amount[self.flag == INCOME].sum())
+        expense = int(self.amount[self.flag == EXPENSE].sum())
+        return income / 100, expense / 100, (income - expense) / 100
+
+    def source_sums(self, flag):
+        mask = self.flag == flag
+        return numpy.bincount(self.source[mask], weights=self.amount[mask], minlength=len(self.sources))
+
+    def present(self, flag):
+        """Indexes of the sources that have rows of a flag, in order of their first row, as a CSV fold meets them."""
+        unique, first = numpy.unique(self.source[self.flag == flag], return_index=True)
+        return unique[numpy.argsort(first, kind="stable")]
+
+    def by_source(self, flag):
+        """Amount per source of a flag, sources whose rows add up to zero included."""
+        sums = self.source_sums(flag)
+        return {self.sources[index]: float(sums[index]) / 100 for index in self.present(flag)}
+
+    def top_k(self, flag, k):
+        """The ``k`` largest sources of a flag, largest first, plus "Others" for the rest."""
+        sums = self.source_sums(flag)
+        present = self.present(flag)
+        if len(present) > k:
+            top = present[numpy.argpartition(sums[present], len(present) - k)[len(present) - k:]]
+        else:
+            top = present
+        top = top[numpy.argsort(-sums[top], kind="stable")]
+        result = {self.sources[index]: float(sums[index]) / 100 for index in top}
+        result['Others'] = float(sums.sum() - sums[top].sum()) / 100
+        return result
+
+    def group(self, keys, flag=None):
+        """Sorted unique keys and the amount per key, all rows or one flag; unreadable dates are left out."""
+        mask = self.day > 0
+        if flag is not None:
+            mask &= self.flag == flag
+        unique, inverse = numpy.unique(keys[mask], return_inverse=True)
+        return unique, numpy.bincount(inverse, weights=self.amount[mask], minlength=len(unique)) / 100
+
+    def by_day(self, flag=None):
+        days, sums = self.group(self.day, flag)
+        return {to_date(day): total for day, total in zip(days.tolist(), sums.tolist())}
+
+    def by_month(self, flag=None):
+        days = self.day[self.day > 0]
+        months = numpy.zeros(len(self.day), dtype=numpy.int64)
+        if len(days):
+            # month_key for every distinct day only, then broadcast back through the inverse index
+            unique, inverse = numpy.unique(days, return_inverse=True)
+            months[self.day > 0] = numpy.array([month_key(int(day)) for day in unique])[inverse]
+        keys, sums = self.group(months, flag)
+        return {(int(key) // 12, int(key) % 12 + 1): float(total) for key, total in zip(keys, sums)}
+
+    def by_day_and_source(self, flag=None):
+        """{date: {source: amount}}, the breakdown the summary tests build by hand."""
+        mask = self.day > 0
+        if flag is not None:
+            mask &= self.flag == flag
+        pairs = self.day[mask].astype(numpy.int64) * len(self.sources) + self.source[mask]
+        unique, inverse = numpy.unique(pairs, return_inverse=True)
+        sums = numpy.bincount(inverse, weights=self.amount[mask], minlength=len(unique)) / 100
+        result, days = {}, {}
+        for day, source, total in zip((unique // len(self.sources)).tolist(), (unique % len(self.sources)).tolist(),
+                                      sums.tolist()):
+            if day not in days:
+                days[day] = result[to_date(day)] = {}
+            days[day][self.sources[source]] = total
+        return result
+
+    def running_balance(self):
+        """Dates in order and the balance after each transaction, income minus expense."""
+        order = numpy.argsort(self.day, kind="stable")
+        return self.day[order], numpy.cumsum(self.signed()[order]) / 100
@@ -0,0 +1,130 @@
+"""One decoded PhotoImage per distinct asset, shared by every screen.
+
+Screens ask for images with ``photo(widget, path)`` instead of building ``PhotoImage(file=...)``
+themselves. The cache lives on the Tk root (``window.asset_cache``, next to ``window.router``),
+so it is shared by every screen of the app and dies with the interpreter its images belong to.
+Files are keyed by path and then by a hash of their bytes, so the sidebar buttons that are
+byte-identical across assets/ folders are decoded once and share one image.
+
+Nothing is decoded at import time. The first request from an assets/ folder schedules the images
+of the screens one click away from it (``NEIGHBOURS``) to be decoded one per idle callback, so
+the screens opened next find their images ready without holding up the current one. The login
+and registration backgrounds, about 1 MB each, are never preloaded. ``python component/assets.py`` prints what the cache holds after loading all of
+assets/ (it needs a display).
+"""
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+import tkinter
+from tkinter import PhotoImage, TclError, Tk
+
+from startup import record
+
+ASSETS_PATH = Path(__file__).parent.parent / Path("assets")
+PRELOAD = True
+
+# assets folder -> the folders of the screens reachable from the screen using it, preloaded once
+# it is first used; login and reg (behind log out and "register") are decoded when they open
+NEIGHBOURS = {
+    "login": ("dashboard",),
+    "reg": (),
+    "dashboard": ("income", "expense", "summary"),
+    "income": ("dashboard", "expense", "summary"),
+    "expense": ("dashboard", "income", "summary"),
+    "summary": ("dashboard", "income", "expense"),
+}
+
+
+def preload_paths(assets_path, folder):
+    """The images of the screens reachable from the one whose assets are in ``folder``."""
+    return sorted(path for name in NEIGHBOURS.get(folder, ()) for path in (Path(assets_path) / name).glob("*.png"))
+
+
+class AssetCache:
+    def __init__(self, root, assets_path=ASSETS_PATH):
+        self.root = root
+        self.assets_path = Path(assets_path).resolve()
+        self.by_path = {}
+        self.by_digest = {}
+        self.decode_seconds = 0.0
+        self.preloaded = set()  # folders whose neighbours have been scheduled
+
+    def image(self, path):
+        path = Path(path).resolve()
+        image = self.decode(path)
+        folder = path.parent.name if path.parent.parent == self.assets_path else None
+        if PRELOAD and folder not in self.preloaded:
+            self.preloaded.add(folder)
+            paths = preload_paths(self.assets_path, folder)
+            if paths:
+                self.root.after_idle(self.preload, paths)
+        return image
+
+    def decode(self, path):
+        image = self.by_path.get(path)
+        if image is None:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                raise TclError(f'couldn\'t open "{path}": no such file or directory')
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            image = self.by_digest.get(digest)
+            if image is None:
+                start = time.perf_counter()
+                image = self.by_digest[digest] = PhotoImage(master=self.root, file=path)
+                seconds = time.perf_counter() - start
+                self.decode_seconds += seconds
+                record("asset decode", seconds)
+            self.by_path[path] = image
+        return image
+
+    def preload(self, paths):
+        """Decode ``paths`` one per idle callback, so pending events are served in between."""
+        if not paths:
+            return
+        try:
+            self.decode(paths[0].resolve())
+        except TclError:
+            pass
+        self.root.after_idle(self.preload, paths[1:])
+
+    def report(self):
+        images = list(self.by_digest.values())
+        return {
+            "files": len(self.by_path),
+            "images": len(images),
+            "shared": len(self.by_path) - len(images),
+            "decode_ms": round(self.decode_seconds * 1000, 2),
+            "bytes": sum(image.width() * image.height() * 4 for image in images),  # Tk photos are 32-bit RGBA
+        }
+
+
+def asset_cache(widget):
+    """The cache of ``widget``'s root; ``None`` means Tk's default root, as it does for PhotoImage."""
+    root = tkinter._get_default_root("create image") if widget is None else widget._root()
+    cache = getattr(root, "asset_cache", None)
+    if cache is None:
+        cache = root.asset_cache = AssetCache(root)
+    return cache
+
+
+def photo(widget, path):
+    """The shared PhotoImage for an asset file, decoded on first use."""
+    return asset_cache(widget).image(path)
+
+
+def main():
+    root = Tk()
+    root.withdraw()
+    cache = asset_cache(root)
+    for path in sorted(ASSETS_PATH.rglob("*.png")):
+        cache.image(path)
+    print(json.dumps(cache.report(), indent=2))
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
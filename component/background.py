@@ -0,0 +1,103 @@
+"""Ledger and user-file loads off the Tk event thread.
+
+Tk may only be touched from the thread running the mainloop, so workers never call back into
+the UI: a ``Loader`` submits its function to a shared executor and polls the future with
+``widget.after`` until it is done, then hands the result to its callback on the Tk thread.
+
+A screen keeps one ``Loader`` per kind of load. Starting it while a load is still running does
+not run a second one next to it (the loaded objects, such as the dashboard totals, are not
+thread safe); the load is repeated once the running one finishes instead. ``cancel`` drops the
+result of the load in flight, which the router does for a screen that is navigated away from.
+
+Loads run on a small thread pool, which suits file reads. CPU-bound parsing of top-level,
+picklable functions can use a process pool with ``processes=True``; the number of workers of
+either pool is read from ``MONEYMANAGER_WORKERS`` (default 2).
+"""
+import atexit
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+POLL_MS = 25
+WORKERS = int(os.environ.get("MONEYMANAGER_WORKERS", "2"))
+
+pools = {}
+in_flight = set()  # loaders with a load submitted whose callback has not run yet
+
+
+def busy():
+    """Whether any loader still has a load running or a result to hand over."""
+    return bool(in_flight)
+
+
+def executor(processes=False):
+    """The shared thread pool, or the shared process pool; created on first use and shut down at exit."""
+    kind = "processes" if processes else "threads"
+    if kind not in pools:
+        pools[kind] = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=WORKERS)
+        atexit.register(pools[kind].shutdown, cancel_futures=True)
+    return pools[kind]
+
+
+class Loader:
+    """Runs ``function(*args)`` in the background and passes its result to ``on_done`` on the Tk thread.
+
+    An exception raised by the function goes to ``on_error`` instead, or is printed when there is
+    none, like Tk does with exceptions in callbacks.
+    """
+
+    def __init__(self, widget, function, on_done, on_error=None, processes=False, poll_ms=POLL_MS):
+        self.widget = widget
+        self.function = function
+        self.on_done = on_done
+        self.on_error = on_error
+        self.processes = processes
+        self.poll_ms = poll_ms
+        self.args = ()
+        self.future = None
+        self.wanted = False
+        self.again = False
+
+    @property
+    def running(self):
+        return self.future is not None
+
+    def start(self, *args):
+        self.args = args
+        self.wanted = True
+        if self.running:
+            self.again = True
+            return
+        self.future = executor(self.processes).submit(self.function, *args)
+        in_flight.add(self)
+        self.widget.after(self.poll_ms, self.poll)
+
+    def cancel(self):
+        """Forget the load in flight; it finishes in the background but its result is dropped."""
+        self.wanted = self.again = False
+        if self.future is not None and self.future.cancel():
+            self.future = None
+            in_flight.discard(self)
+
+    def poll(self):
+        if self.future is None:
+            return
+        if not self.future.done():
+            self.widget.after(self.poll_ms, self.poll)
+            return
+        future, self.future = self.future, None
+        in_flight.discard(self)
+        if self.again:
+            self.again = False
+            self.start(*self.args)
+            return
+        if not self.wanted:
+            return
+        self.wanted = False
+        error = future.exception()
+        if error is None:
+            self.on_done(future.result())
+        elif self.on_error is not None:
+            self.on_error(error)
+        else:
+            sys.excepthook(type(error), error, error.__traceback__)
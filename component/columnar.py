@@ -0,0 +1,260 @@
+"""Binary columnar copy of data_store/data.csv.
+
+Each column is a flat little-endian file that loads with ``array.fromfile`` or ``numpy.memmap``
+without any parsing: flag (uint8), date (int32 ordinal, 0 when unreadable), source (int32 index
+into sources.json) and amount (int64 minor units, 0 when unreadable). The text of unreadable dates
+and amounts is kept in texts.json, so rows read back as written. meta.json records how many rows are stored and
+the byte offset of data.csv they cover, so readers take the columns for that prefix and only parse
+rows appended to the CSV afterwards.
+
+Keep it in sync with ``python component/columnar.py import`` (append new CSV rows) or
+``python component/columnar.py compact`` (rebuild from scratch).
+"""
+import csv
+import json
+import os
+import sys
+from array import array
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from ledger_dates import date_key, to_date
+from startup import phase
+
+OUTPUT_PATH = Path(__file__).parent.parent
+CSV_PATH = OUTPUT_PATH / Path("data_store/data.csv")
+TAIL_CHECK = 64
+HEADER = ["flag", "Date", "Source", "Amount"]
+
+# column -> (array typecode, numpy dtype)
+COLUMNS = {
+    "flag": ("B", "<u1"),
+    "date": ("i", "<i4"),
+    "source": ("i", "<i4"),
+    "amount": ("q", "<i8"),
+}
+
+
+def load_numpy():
+    """NumPy, or None when it isn't installed; imported on first use as it adds ~100 ms to start-up."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def to_minor(amount):
+    if amount.isdigit():
+        return int(amount) * 100
+    try:
+        return int((Decimal(amount) * 100).to_integral_value())
+    except (InvalidOperation, OverflowError):
+        raise ValueError(f"unreadable amount {amount!r}")
+
+
+def from_minor(minor):
+    return str(minor // 100) if minor % 100 == 0 else f"{minor / 100:.2f}"
+
+
+class Columns:
+    """The stored columns plus the CSV prefix (``offset``, ``tail``) they were built from.
+
+    ``texts`` keeps the original text of the fields that have no column value, by row index:
+    ``texts["date"]`` for dates stored as 0 and ``texts["amount"]`` for amounts stored as 0.
+    """
+
+    def __init__(self, flag, date, source, amount, sources, offset, tail, texts=None):
+        self.flag, self.date, self.source, self.amount = flag, date, source, amount
+        self.sources = sources
+        self.texts = texts or {"date": {}, "amount": {}}
+        self.offset = offset
+        self.tail = tail
+
+    def __len__(self):
+        return len(self.flag)
+
+    def totals(self):
+        """Amount per flag and source, like the dashboard's LedgerAggregates totals (see analytics.py for NumPy)."""
+        totals = {}
+        for flag, source, amount in zip(self.flag, self.source, self.amount):
+            by_source = totals.setdefault(flag, {})
+            by_source[source] = by_source.get(source, 0) + amount
+        return {flag: {self.sources[source]: amount / 100 for source, amount in by_source.items()}
+                for flag, by_source in totals.items()}
+
+    def rows(self):
+        """Rows in CSV form (flag, Date, Source, Amount), unreadable fields as they were written."""
+        dates = {}
+        bad_dates, bad_amounts = self.texts["date"], self.texts["amount"]
+        for index, (flag, day, source, amount) in enumerate(zip(self.flag, self.date, self.source, self.amount)):
+            if not day:
+                date = bad_dates.get(index, "")
+            elif day in dates:
+                date = dates[day]
+            else:
+                date = dates[day] = to_date(day).strftime("%b %d %Y")
+            amount = bad_amounts[index] if index in bad_amounts else from_minor(amount)
+            yield [str(flag), date, self.sources[source], amount]
+
+
+class ColumnarLedger:
+    def __init__(self, csv_path=CSV_PATH, store_path=None):
+        self.csv_path = Path(csv_path)
+        self.store_path = Path(store_path) if store_path else self.csv_path.parent / "columnar"
+
+    def column_path(self, name):
+        return self.store_path / f"{name}.col"
+
+    def read_meta(self):
+        try:
+            with open(self.store_path / "meta.json") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def covers_csv(self, meta):
+        """True if data.csv still starts with the bytes the store was built from."""
+        tail = bytes.fromhex(meta["tail"])
+        try:
+            with open(self.csv_path, "rb") as file:
+                file.seek(max(0, meta["offset"] - len(tail)))
+                return os.fstat(file.fileno()).st_size >= meta["offset"] and file.read(len(tail)) == tail
+        except FileNotFoundError:
+            return False
+
+    def is_current(self):
+        meta = self.read_meta()
+        return meta is not None and self.covers_csv(meta)
+
+    def load(self, use_numpy=True):
+        """Columns for the part of data.csv the store covers, or None if it is missing or out of date."""
+        with phase("columnar load"):
+            return self.load_columns(use_numpy)
+
+    def load_columns(self, use_numpy):
+        meta = self.read_meta()
+        if meta is None or not self.covers_csv(meta):
+            return None
+        numpy = load_numpy() if use_numpy else None
+        columns = {}
+        for name, (typecode, dtype) in COLUMNS.items():
+            if numpy is not None:
+                columns[name] = (numpy.memmap(self.column_path(name), dtype=dtype, mode="r", shape=(meta["rows"],))
+                                 if meta["rows"] else numpy.zeros(0, dtype=dtype))
+            else:
+                values = array(typecode)
+                with open(self.column_path(name), "rb") as file:
+                    values.fromfile(file, meta["rows"])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                columns[name] = values
+        with open(self.store_path / "sources.json") as file:
+            sources = json.load(file)
+        return Columns(sources=sources, offset=meta["offset"], tail=bytes.fromhex(meta["tail"]),
+                       texts=self.read_texts(), **columns)
+
+    def read_texts(self):
+        try:
+            with open(self.store_path / "texts.json") as file:
+                return {field: {int(index): text for index, text in texts.items()}
+                        for field, texts in json.load(file).items()}
+        except FileNotFoundError:
+            return {"date": {}, "amount": {}}
+
+    def compact(self):
+        """Rebuild the store from the whole of data.csv."""
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        (self.store_path / "meta.json").unlink(missing_ok=True)
+        (self.store_path / "texts.json").unlink(missing_ok=True)
+        for name in COLUMNS:
+            open(self.column_path(name), "wb").close()
+        return self.append({"rows": 0, "offset": 0, "tail": ""}, [])
+
+    def sync(self):
+        """Append rows added to data.csv since the last sync, rebuilding if the CSV was rewritten."""
+        meta = self.read_meta()
+        if meta is None or not self.covers_csv(meta):
+            return self.compact()
+        with open(self.store_path / "sources.json") as file:
+            sources = json.load(file)
+        return self.append(meta, sources)
+
+    def encode_csv(self, offset, sources, texts=None, first_row=0):
+        """Column arrays for the complete CSV rows from ``offset`` on, the bytes read and the offset reached.
+
+        New source names are appended to ``sources``. A date or amount that cannot be read is
+        stored as 0; its text goes into ``texts`` (see ``Columns``) under its row index, counted
+        from ``first_row``.
+        """
+        with open(self.csv_path, "rb") as file:
+            file.seek(offset)
+            chunk = file.read()
+        end = chunk.rfind(b"\n") + 1
+        lines = chunk[:end].decode().splitlines()
+        if not offset:
+            lines = lines[1:]  # header
+        source_ids = {source: index for index, source in enumerate(sources)}
+        new = {name: array(typecode) for name, (typecode, _) in COLUMNS.items()}
+        texts = {"date": {}, "amount": {}} if texts is None else texts
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            index = first_row + len(new["flag"])
+            try:
+                day = date_key(row[1])
+            except ValueError:
+                day = 0
+                texts["date"][index] = row[1]
+            try:
+                amount = to_minor(row[3])
+            except ValueError:
+                amount = 0
+                texts["amount"][index] = row[3]
+            if row[2] not in source_ids:
+                source_ids[row[2]] = len(sources)
+                sources.append(row[2])
+            new["flag"].append(int(row[0]))
+            new["date"].append(day)
+            new["source"].append(source_ids[row[2]])
+            new["amount"].append(amount)
+        return new, chunk[:end], offset + end
+
+    def append(self, meta, sources):
+        # entries past the committed rows are left over from an interrupted sync
+        texts = {field: {index: text for index, text in by_row.items() if index < meta["rows"]}
+                 for field, by_row in self.read_texts().items()}
+        new, consumed, offset = self.encode_csv(meta["offset"], sources, texts, meta["rows"])
+        itemsizes = {name: array(typecode).itemsize for name, (typecode, _) in COLUMNS.items()}
+        for name, values in new.items():
+            if sys.byteorder == "big":
+                values.byteswap()
+            with open(self.column_path(name), "r+b") as file:
+                # drop anything written after the last committed meta.json, e.g. by an interrupted sync
+                file.truncate(meta["rows"] * itemsizes[name])
+                file.seek(0, os.SEEK_END)
+                values.tofile(file)
+        with open(self.store_path / "sources.json", "w") as file:
+            json.dump(sources, file)
+        with open(self.store_path / "texts.json", "w") as file:
+            json.dump(texts, file)
+        tail = (bytes.fromhex(meta["tail"]) + consumed)[-TAIL_CHECK:]
+        meta = {"rows": meta["rows"] + len(new["flag"]), "offset": offset, "tail": tail.hex()}
+        with open(self.store_path / "meta.json.tmp", "w") as file:
+            json.dump(meta, file)
+        os.replace(self.store_path / "meta.json.tmp", self.store_path / "meta.json")
+        return meta
+
+
+def main(argv):
+    if len(argv) != 1 or argv[0] not in ("import", "compact"):
+        print("usage: python columnar.py import|compact")
+        return 2
+    ledger = ColumnarLedger()
+    meta = ledger.sync() if argv[0] == "import" else ledger.compact()
+    print(f"{meta['rows']} rows stored in {ledger.store_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""A date picker that only loads tkcalendar when the user opens it.
+
+tkcalendar pulls in babel and its locale data, a large share of a screen's start-up. Until the
+field is clicked or focused it is a plain read-only Entry showing the date; then it is swapped
+for a ``tkcalendar.DateEntry`` in the same place, dropped down, on the same date.
+"""
+from datetime import date, datetime
+from tkinter import Entry
+
+from startup import phase
+
+# DateEntry date_pattern -> strftime format, for the patterns the screens use
+DATE_FORMATS = {"dd-MM-yyyy": "%d-%m-%Y", "MM/dd/yyyy": "%m/%d/%Y", "yyyy-MM-dd": "%Y-%m-%d"}
+
+
+class LazyDateEntry:
+    def __init__(self, master, date_pattern="dd-MM-yyyy", **options):
+        self.master = master
+        self.options = dict(options, date_pattern=date_pattern)
+        self.format = DATE_FORMATS[date_pattern]
+        self.date = date.today()
+        self.geometry = None
+        self.calendar = None
+        self.widget = Entry(master, width=12, readonlybackground="#FFFFFF", fg="#000716")
+        self.widget.insert(0, self.date.strftime(self.format))
+        self.widget.configure(state="readonly")
+        self.widget.bind("<Button-1>", self.open)
+        self.widget.bind("<FocusIn>", self.open)
+
+    def grid(self, **options):
+        self.geometry = ("grid", options)
+        self.widget.grid(**options)
+
+    def place(self, **options):
+        self.geometry = ("place", options)
+        self.widget.place(**options)
+
+    def open(self, event=None):
+        """Replace the plain entry with the real DateEntry and drop its calendar down."""
+        if self.calendar is not None:
+            return
+        with phase("import tkcalendar"):
+            from tkcalendar import DateEntry
+        self.calendar = DateEntry(self.master, **self.options)
+        self.calendar.set_date(self.date)
+        if self.geometry is not None:
+            method, options = self.geometry
+            getattr(self.calendar, method)(**options)
+        self.widget.destroy()
+        self.widget = self.calendar
+        self.calendar.focus_set()
+        self.calendar.after_idle(self.calendar.drop_down)
+
+    def get_date(self):
+        return self.calendar.get_date() if self.calendar is not None else self.date
+
+    def set_date(self, value):
+        self.date = value if isinstance(value, date) else datetime.strptime(value, self.format).date()
+        if self.calendar is not None:
+            self.calendar.set_date(self.date)
+        else:
+            self.widget.configure(state="normal")
+            self.widget.delete(0, "end")
+            self.widget.insert(0, self.date.strftime(self.format))
+            self.widget.configure(state="readonly")
@@ -1,4 +1,8 @@
-import csv
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from repository import ledger_repository
 
 
 class DataHandler:
@@ -6,7 +10,4 @@ class DataHandler:
         self.filename = filename
 
     def data_write(self, field):
-        with open(self.filename, 'a', newline="") as file:
-            csv.writer(file).writerow(field)
-            file.close()
-
+        ledger_repository(self.filename).append(field)
@@ -1,6 +1,6 @@
 import pytest
 from tkinter import Tk
-from Feedback import Feedback
+from FeedBack import Feedback
 
 
 @pytest.fixture
@@ -0,0 +1,69 @@
+"""Change notifications for ledger files.
+
+Repositories publish the rows they append once they are stored: the CSV ledger when its writer
+has committed the batch (see ledger_writer.py), SQLite after the insert. Screens subscribe to the
+ledger they show. Callbacks run synchronously in the publishing thread. For the screens' own
+writes that is the Tk thread, except for the ``none`` durability, whose batches are committed on
+the writer's timer thread; ``Repaint.request`` only calls ``after`` there, which tkinter hands
+to the Tk thread.
+``Repaint`` turns a stream of notifications into at most one repaint per frame interval, so a
+bulk import that appends in many chunks redraws the dashboard once, not once per chunk.
+"""
+import os
+import threading
+
+FRAME_MS = 16
+
+
+class LedgerEvents:
+    def __init__(self):
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(path):
+        return os.path.abspath(path)
+
+    def subscribe(self, path, callback):
+        """Call ``callback(rows)`` whenever rows are appended to ``path``; returns a function that unsubscribes."""
+        key = self.key(path)
+        with self.lock:
+            self.subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            with self.lock:
+                if callback in self.subscribers.get(key, []):
+                    self.subscribers[key].remove(callback)
+        return unsubscribe
+
+    def publish(self, path, rows):
+        with self.lock:
+            callbacks = list(self.subscribers.get(self.key(path), []))
+        for callback in callbacks:
+            callback(rows)
+
+
+class Repaint:
+    """Runs ``callback`` once, ``interval`` ms after the first of any number of ``request`` calls."""
+
+    def __init__(self, widget, callback, interval=FRAME_MS):
+        self.widget = widget
+        self.callback = callback
+        self.interval = interval
+        self.pending = None
+
+    def request(self, *args):
+        if self.pending is None:
+            self.pending = self.widget.after(self.interval, self.run)
+
+    def run(self):
+        self.pending = None
+        self.callback()
+
+    def cancel(self):
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+            self.pending = None
+
+
+ledger_events = LedgerEvents()
@@ -0,0 +1,128 @@
+"""Buffered appends to a CSV ledger, written as group commits.
+
+The writer keeps data.csv open and queues rows; one commit writes every queued row with a single
+write while holding an advisory lock on the file, so rows from several processes never interleave
+mid-line. The durability mode decides when ``append`` returns:
+
+* ``none``  - at once; rows are committed when ``batch_rows`` are queued or ``batch_seconds`` have
+  passed (and on close). A crash can lose the rows still queued.
+* ``flush`` - once its row has been written to the operating system; other readers see it and it
+  survives the process dying. This is what the per-row open/append/close gave, and the default.
+* ``fsync`` - once its row is on disk.
+
+In the ``flush`` and ``fsync`` modes rows appended by other threads while a commit is running are
+written together by the next one, so concurrent writers share writes and fsyncs.
+
+``on_commit(rows)`` is called with every batch once it has been written, in the committing
+thread. The shared writers of ``ledger_writer`` publish their batches to ``ledger_events`` there,
+so subscribers hear of rows when they can be read back, not when they are queued.
+"""
+import atexit
+import csv
+import io
+import os
+import threading
+
+from ledger_events import ledger_events
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, each batch is still a single O_APPEND write
+    fcntl = None
+
+DURABILITY = ("none", "flush", "fsync")
+BATCH_ROWS = 256
+BATCH_SECONDS = 0.5
+
+
+def default_durability():
+    return os.environ.get("MONEYMANAGER_DURABILITY", "flush").lower()
+
+
+class LedgerWriter:
+    def __init__(self, path, durability=None, batch_rows=BATCH_ROWS, batch_seconds=BATCH_SECONDS, on_commit=None):
+        self.durability = durability or default_durability()
+        if self.durability not in DURABILITY:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY)}, not {self.durability!r}")
+        self.path = path
+        self.batch_rows = batch_rows
+        self.batch_seconds = batch_seconds
+        self.on_commit = on_commit
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        self.queue = []
+        self.queued = 0  # rows ever queued
+        self.committed = 0  # rows ever written
+        self.queue_lock = threading.Lock()
+        self.commit_lock = threading.Lock()
+        self.timer = None
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        with self.queue_lock:
+            self.queue.extend(rows)
+            self.queued += len(rows)
+            ticket = self.queued
+            if self.durability == "none":
+                if len(self.queue) < self.batch_rows:
+                    if self.timer is None:
+                        self.timer = threading.Timer(self.batch_seconds, self.commit)
+                        self.timer.daemon = True
+                        self.timer.start()
+                    return
+        self.commit(ticket)
+
+    def commit(self, ticket=None):
+        """Write every queued row, unless another commit already wrote up to ``ticket``."""
+        with self.commit_lock:
+            if ticket is not None and self.committed >= ticket:
+                return
+            with self.queue_lock:
+                batch, self.queue = self.queue, []
+                upto = self.queued
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+            if batch:
+                self.write(batch)
+            self.committed = upto
+        if batch and self.on_commit is not None:
+            self.on_commit(batch)
+
+    def write(self, rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        data = memoryview(buffer.getvalue().encode())
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            while data:
+                data = data[os.write(self.fd, data):]
+            if self.durability == "fsync":
+                os.fsync(self.fd)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def close(self):
+        if self.fd is None:
+            return
+        self.commit()
+        os.close(self.fd)
+        self.fd = None
+
+
+_writers = {}
+
+
+def ledger_writer(path):
+    """The shared writer for a ledger file, committed and closed when the program exits.
+
+    Its commits are published to ``ledger_events`` under ``path``.
+    """
+    key = os.path.abspath(path)
+    if key not in _writers:
+        _writers[key] = LedgerWriter(path, on_commit=lambda rows: ledger_events.publish(path, rows))
+        atexit.register(_writers[key].close)
+    return _writers[key]
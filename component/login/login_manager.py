@@ -1,22 +1,35 @@
 from user_manager import UserManager
-import csv
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from background import Loader
+from repository import user_repository
 
 class LoginManager(UserManager):
     def __init__(self):
         super().__init__()
+        self.loader = None
+
+    def find_user(self, email):
+        return user_repository(self.filename).find(email)
 
     def check_user(self, email, password):
-        with open(self.filename, 'r') as file:
-            readar = csv.reader(file)
-            next(readar)  # Skip the field names
-            flag = 0
-            for line in readar:
-                if email == line[1] and password == line[2]:
-                    self.popmsg(line[0])
-                    flag = 1
-                    break
-            if flag == 0:
-                self.pop_reg_msg()
+        """Look the user up on a worker and greet them, or explain the failure, once it is found."""
+        if self.loader is None:
+            self.loader = Loader(self.window, self.find_user, None)
+        self.loader.on_done = lambda user: self.verify(user, password)
+        self.loader.start(email)
+
+    def verify(self, user, password):
+        if user is not None and password == user[2]:
+            self.popmsg(user[0])
+        else:
+            self.pop_reg_msg()
+
+    def leave(self):
+        if self.loader is not None:
+            self.loader.cancel()
 
     def get_data(self):
         email = self.entry_1.get()
@@ -1,8 +1,8 @@
-from gui_manager import GUI
+import sys
+from pathlib import Path
 
-def main():
-    gui = GUI()
-    gui.run()
 
 if __name__ == "__main__":
-    main()
+    sys.path.append(str(Path(__file__).parent.parent))
+    from router import run
+    run("login")
@@ -0,0 +1,93 @@
+"""Source totals of data.csv straight from a memory map.
+
+The dashboard totals only need the flag, Source and Amount columns. ``source_totals`` maps the
+file read-only and walks it with ``find`` on the map: the flag is read as a single byte, Source is
+a ``memoryview`` slice used for the dict lookup (it hashes and compares like the bytes key it
+finds), and only Amount is converted: ``int`` on its bytes, falling back to ``to_minor`` for
+anything else the dashboard's fold reads (``450.5``, ``1e2``). Those two small slices are the
+only objects made per row, and nothing is kept. The Date column is never decoded,
+and the source names are decoded once at the end. The file is mapped a window at a time, so peak
+memory is the totals plus one window of file pages, instead of the rows and their strings. Lines
+with quoted fields go through ``csv`` as before.
+
+``python benchmarks/bench_mmap_scan.py`` compares peak RSS and time with the row-parsing path.
+"""
+import csv
+import mmap
+import os
+
+from columnar import to_minor
+
+COMMA, QUOTE, NEWLINE = b",", b'"', b"\n"
+SEPARATOR, CR = ord(","), ord("\r")
+FLAGS = {48: 0, 49: 1}  # b"0", b"1"
+WINDOW = 64 << 20  # bytes mapped at a time
+
+
+def add_quoted(totals, line):
+    for row in csv.reader([line.decode()]):
+        sums, source = totals.setdefault(int(row[0]), {}), row[2].encode()
+        sums[source] = sums.get(source, 0) + to_minor(row[3])
+
+
+def scan(buffer, position, end, totals):
+    """Add the lines of ``buffer[position:end]`` to ``totals``; returns how many were unreadable."""
+    bad = 0
+    view = memoryview(buffer)
+    find = buffer.find
+    while position < end:
+        line_end = find(NEWLINE, position, end)
+        amount_end = line_end - 1 if buffer[line_end - 1] == CR else line_end
+        if amount_end == position:
+            position = line_end + 1
+            continue
+        try:
+            if find(QUOTE, position, amount_end) != -1:
+                add_quoted(totals, buffer[position:amount_end])
+            else:
+                date_end = find(COMMA, position + 2, amount_end)
+                source_end = find(COMMA, date_end + 1, amount_end)
+                if buffer[position + 1] != SEPARATOR or date_end < 0 or source_end < 0:
+                    raise ValueError("not a ledger row")
+                flag = FLAGS[buffer[position]]
+                text = buffer[source_end + 1:amount_end]
+                try:
+                    amount = int(text) * 100
+                except ValueError:
+                    amount = to_minor(text.decode())
+                sums, source = totals[flag], view[date_end + 1:source_end]
+                if source in sums:
+                    sums[source] += amount
+                else:
+                    sums[bytes(source)] = amount
+        except (ValueError, KeyError, IndexError):
+            bad += 1
+        position = line_end + 1
+    source = None  # the last Source slice holds the map open
+    view.release()
+    return bad
+
+
+def source_totals(path, offset=None):
+    """({flag: {source: amount in minor units}}, end, bad) of the complete lines after ``offset``.
+
+    ``offset`` defaults to the start of the first row after the header; ``end`` is the byte
+    offset the scan stopped at (after the last newline) and ``bad`` counts the rows skipped
+    because their flag or amount could not be read. The file is mapped ``WINDOW`` bytes at a
+    time, so the pages resident at once stay bounded however large the ledger is.
+    """
+    totals, bad = {0: {}, 1: {}}, 0
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        position = len(file.readline()) if offset is None else offset
+        while position < size:
+            base = position - position % mmap.ALLOCATIONGRANULARITY
+            length = min(position - base + WINDOW, size - base)
+            with mmap.mmap(file.fileno(), length, access=mmap.ACCESS_READ, offset=base) as buffer:
+                end = buffer.rfind(NEWLINE) + 1
+                if end <= position - base:
+                    break  # no complete line in the window: a partial last line, or one longer than WINDOW
+                bad += scan(buffer, position - base, end, totals)
+            position = base + end
+    return {flag: {source.decode(): amount for source, amount in sums.items()} for flag, sums in totals.items()}, \
+        min(position, size), bad
@@ -0,0 +1,178 @@
+"""Multi-core first read of a large data.csv.
+
+The file is cut into byte ranges that start and end on line boundaries. Each range is parsed in
+its own process (``scan_range``) into a partial ``LedgerSummary`` holding the per-source and
+per-day sums and the first and last date. The parts are added up in the parent. For the
+date-sorted view (``sorted_runs``), each process sorts its own rows and the parent k-way merges
+the sorted runs.
+
+Both return the ``CsvCursor`` of the bytes they covered, so the repository's incremental reads
+continue from there. The cold load of a ledger with no columnar copy (see columnar.py) goes
+through here once the CSV is ``PARALLEL_MIN_BYTES`` or larger; smaller files are not worth the
+process start-up. ``python benchmarks/bench_parallel_load.py`` measures the scaling.
+"""
+import csv
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from columnar import to_minor
+from ledger_dates import date_key
+from repository import CsvLedger, cursor_at
+
+PARALLEL_MIN_BYTES = 64 << 20
+MIN_RANGE_BYTES = 4 << 20
+MAX_RANGE_BYTES = 64 << 20  # bounds the memory of a worker, and gives pool.map pieces to balance
+
+
+class LedgerSummary:
+    """Sums in minor units: ``sources[flag][source]`` and ``days[flag][ordinal day]``.
+
+    A row with an unreadable date still counts in ``sources``, as it does in the dashboard's own
+    fold; it is left out of ``days``, ``first`` and ``last`` only. ``bad_rows`` holds every row
+    missing from ``days``.
+    """
+
+    def __init__(self):
+        self.sources = {0: {}, 1: {}}
+        self.days = {0: {}, 1: {}}
+        self.first = self.last = None
+        self.rows = 0
+        self.bad_rows = []
+
+    def add(self, row):
+        try:
+            flag, source, amount = int(row[0]), row[2], to_minor(row[3])
+        except (ValueError, IndexError, OverflowError):
+            self.bad_rows.append(row)
+            return
+        sources = self.sources.setdefault(flag, {})
+        sources[source] = sources.get(source, 0) + amount
+        try:
+            day = date_key(row[1])
+        except ValueError:
+            self.bad_rows.append(row)
+            return
+        days = self.days.setdefault(flag, {})
+        days[day] = days.get(day, 0) + amount
+        if self.first is None or day < self.first:
+            self.first = day
+        if self.last is None or day > self.last:
+            self.last = day
+        self.rows += 1
+
+    def merge(self, other):
+        for mine, theirs in ((self.sources, other.sources), (self.days, other.days)):
+            for flag, sums in theirs.items():
+                target = mine.setdefault(flag, {})
+                for key, amount in sums.items():
+                    target[key] = target.get(key, 0) + amount
+        if other.first is not None:
+            self.first = other.first if self.first is None else min(self.first, other.first)
+            self.last = other.last if self.last is None else max(self.last, other.last)
+        self.rows += other.rows
+        self.bad_rows += other.bad_rows
+        return self
+
+
+def worth_splitting(ledger):
+    """Whether a ledger store is a CSV file big enough for a parallel first read."""
+    return isinstance(ledger, CsvLedger) and ledger.path.exists() and \
+        os.path.getsize(ledger.path) >= PARALLEL_MIN_BYTES
+
+
+def workers():
+    return os.cpu_count() or 1
+
+
+def byte_ranges(path, parts, size=None):
+    """(start, end) ranges covering the complete lines after the header, about 1/``parts`` each.
+
+    ``size`` limits the ranges to that prefix of the file; a trailing partial line is left out,
+    as ``read_csv`` does.
+    """
+    size = os.path.getsize(path) if size is None else size
+    with open(path, "rb") as file:
+        file.readline()
+        start = min(file.tell(), size)
+        step = max(MIN_RANGE_BYTES, (size - start) // max(parts, 1) + 1)
+        ranges = []
+        while start < size:
+            file.seek(min(start + step, size) - 1)
+            file.readline()
+            end = min(file.tell(), size)
+            if end == size:
+                file.seek(start)
+                end = start + file.read(size - start).rfind(b"\n") + 1
+                if end > start:
+                    ranges.append((start, end))
+                break
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def header_end(path, size):
+    with open(path, "rb") as file:
+        line = file.readline()
+    return len(line) if line.endswith(b"\n") and len(line) <= size else 0
+
+
+def read_range(path, start, end):
+    with open(path, "rb") as file:
+        file.seek(start)
+        return [row for row in csv.reader(file.read(end - start).decode().splitlines()) if row]
+
+
+def scan_range(path, start, end):
+    summary = LedgerSummary()
+    for row in read_range(path, start, end):
+        summary.add(row)
+    return summary
+
+
+def sort_range(path, start, end):
+    """The range's rows as a (date key, row) run sorted by date, and the rows with no readable date."""
+    run, bad = [], []
+    for row in read_range(path, start, end):
+        try:
+            run.append((date_key(row[1]), row))
+        except (ValueError, IndexError):
+            bad.append(row)
+    run.sort(key=lambda pair: pair[0])
+    return run, bad
+
+
+def run_ranges(path, function, processes=None):
+    """``function(path, start, end)`` for every range, in file order, with the cursor after the last one."""
+    stat = os.stat(path)
+    stamp = stat.st_size, stat.st_mtime_ns
+    processes = processes or workers()
+    ranges = byte_ranges(path, max(processes, stat.st_size // MAX_RANGE_BYTES + 1), stat.st_size)
+    end = ranges[-1][1] if ranges else header_end(path, stat.st_size)
+    if processes == 1 or len(ranges) < 2:
+        results = [function(path, start, stop) for start, stop in ranges]
+    else:
+        # spawn: forking a process that runs Tk and worker threads is not safe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(min(processes, len(ranges)), mp_context=context) as pool:
+            results = list(pool.map(function, [str(path)] * len(ranges), *zip(*ranges)))
+    return results, cursor_at(path, end, stamp)
+
+
+def summarize(path, processes=None):
+    """(LedgerSummary, cursor) of the whole file."""
+    parts, cursor = run_ranges(Path(path), scan_range, processes)
+    summary = LedgerSummary()
+    for part in parts:
+        summary.merge(part)
+    return summary, cursor
+
+
+def sorted_runs(path, processes=None):
+    """(merged (date key, row) pairs in date order, bad rows, cursor); equal dates keep file order."""
+    parts, cursor = run_ranges(Path(path), sort_range, processes)
+    merged = list(heapq.merge(*(run for run, _ in parts), key=lambda pair: pair[0]))
+    return merged, [row for _, bad in parts for row in bad], cursor
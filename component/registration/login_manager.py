@@ -1,8 +1,11 @@
 from user_manager import UserManager
-import csv
+import sys
 from pathlib import Path
 from  tkinter import messagebox
 
+sys.path.append(str(Path(__file__).parent.parent))
+from repository import user_repository
+
 OUTPUT_PATH = Path(__file__).parent.parent.parent
 filename=OUTPUT_PATH/Path("data_store/user_rec.csv")
 
@@ -15,24 +18,21 @@ class LoginManager(UserManager):
 
 
 
-    def check_user_list(self,field,reader):
-        for line in reader:
-            if field[1]==line[1]:
-                popmsg()
-                self.switch_login()
-                return True
+    def check_user_list(self,field,users):
+        if users.find(field[1]) is not None:
+            popmsg()
+            self.switch_login()
+            return True
             
 
     def new_user(self,field):
-        with open(filename,'r+',newline="") as file:
-            self.field=field
-            reader=csv.reader(file)
-            if not self.check_user_list(self.field,reader):
-                csv.writer(file).writerow(self.field)
-                messagebox.showinfo("Success","New User Registration is Successful.\n"+
-                                    "Now Log Into The System")
-                file.close()
-                self.switch_login()
+        self.field=field
+        users=user_repository(filename)
+        if not self.check_user_list(self.field,users):
+            users.add(self.field)
+            messagebox.showinfo("Success","New User Registration is Successful.\n"+
+                                "Now Log Into The System")
+            self.switch_login()
 
     def get_data(self):
         name=self.entry_1.get()
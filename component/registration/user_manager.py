@@ -1,5 +1,3 @@
-import os
-import csv
 from pathlib import Path
 from tkinter import messagebox
 
@@ -12,20 +10,15 @@ class UserManager:
     def relative_to_assets(self, path: str) -> Path:
         return self.ASSETS_PATH / Path(path)
 
-    def execute_python_file(self, file_path):
-        try:
-            os.system(f'python {file_path}')
-        except FileNotFoundError:
-            print(f"Error: The file '{file_path}' does not exist.")
+    def switch(self, name):
+        self.window.winfo_toplevel().router.show(name)
 
     def switch_login(self):
-        self.window.destroy()
-        self.execute_python_file(self.OUTPUT_PATH / "component/login/main.py")
+        self.switch("login")
 
     def popmsg(self, name):
         messagebox.showinfo("Greetings", f"{name} Welcome Back")
-        self.window.destroy()
-        self.execute_python_file(self.OUTPUT_PATH / "component/login/main.py")
+        self.switch("login")
 
     def pop_reg_msg(self):
         messagebox.showinfo("Existing Email",
@@ -0,0 +1,272 @@
+"""Ledger and user storage behind one interface, with CSV (default) and SQLite backends.
+
+Set MONEYMANAGER_BACKEND=sqlite to keep data in data_store/money_manager.db instead of the CSV
+files; the database is created on first use and seeded from the existing CSV files. Screens only
+talk to the objects returned by ``ledger_repository`` and ``user_repository``.
+
+Ledger rows are lists of strings in CSV column order (flag, Date, Source, Amount). ``read`` takes
+the cursor returned by the previous call and gives back only the rows stored since then; when it
+has to start over (first call, or the data was rewritten) ``reset`` is True and callers drop what
+they built from earlier rows.
+"""
+import csv
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from columnar import ColumnarLedger
+from ledger_dates import date_key
+from ledger_events import ledger_events
+from ledger_writer import ledger_writer
+from startup import record
+
+OUTPUT_PATH = Path(__file__).parent.parent
+LEDGER_PATH = OUTPUT_PATH / Path("data_store/data.csv")
+USERS_PATH = OUTPUT_PATH / Path("data_store/user_rec.csv")
+DATABASE_NAME = "money_manager.db"
+HEADER = ["flag", "Date", "Source", "Amount"]
+USER_HEADER = ["user_name", "email", "password"]
+TAIL_CHECK = 64  # bytes before a CSV cursor re-read to tell an append from a rewrite
+FETCH_ROWS = 1000  # rows SqliteLedger.rows reads per turn of the lock
+
+CsvCursor = namedtuple("CsvCursor", "offset tail stamp")
+
+
+def day_or_none(text):
+    try:
+        return date_key(text)
+    except ValueError:
+        return None
+
+
+def cursor_at(path, offset, stamp):
+    """The cursor of a CSV read up to byte ``offset`` of the file as it was at ``stamp`` (size, mtime)."""
+    with open(path, "rb") as file:
+        file.seek(max(0, offset - TAIL_CHECK))
+        return CsvCursor(offset, file.read(offset - file.tell()), stamp)
+
+
+def read_csv(path, cursor=None):
+    """(rows, cursor, reset) for the CSV rows after the header written since ``cursor``.
+
+    Only complete lines are read, a row being written comes next time. ``reset`` is True when
+    reading started from the top, because there was no cursor or the file was rewritten.
+    """
+    stat = os.stat(path)
+    stamp = stat.st_size, stat.st_mtime_ns
+    if cursor is not None and cursor.stamp == stamp:
+        return [], cursor, False
+    start = time.perf_counter()
+    offset, tail = (cursor.offset, cursor.tail) if cursor is not None else (0, b"")
+    with open(path, "rb") as file:
+        if offset:
+            file.seek(max(0, offset - len(tail)))
+            if stat.st_size < offset or file.read(len(tail)) != tail:
+                offset, tail = 0, b""
+        file.seek(offset)
+        chunk = file.read()
+    end = chunk.rfind(b"\n") + 1
+    lines = chunk[:end].decode().splitlines()
+    if not offset:
+        lines = lines[1:]  # header
+    rows = [row for row in csv.reader(lines) if row]
+    record("csv parse", time.perf_counter() - start)
+    return rows, CsvCursor(offset + end, (tail + chunk[:end])[-TAIL_CHECK:], stamp), not offset
+
+
+class CsvLedger:
+    def __init__(self, path=LEDGER_PATH):
+        self.path = Path(path)
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        ledger_writer(self.path).extend(rows)  # published to ledger_events once committed
+
+    def read(self, cursor=None):
+        return read_csv(self.path, cursor)
+
+    def rows(self):
+        """Every stored row, streamed from the file."""
+        with open(self.path, newline="") as file:
+            reader = csv.reader(file)
+            next(reader, None)  # header
+            yield from (row for row in reader if row)
+
+    def columns(self, use_numpy=True):
+        """The columnar copy of the ledger and a cursor for the CSV rows after it, or None."""
+        columns = ColumnarLedger(self.path).load(use_numpy)
+        if columns is None:
+            return None
+        return columns, CsvCursor(columns.offset, columns.tail, None)
+
+    def between(self, start, end, flag=None):
+        rows, _, _ = self.read()
+        return [row for row in rows
+                if (flag is None or row[0] == str(flag)) and start <= (day_or_none(row[1]) or 0) <= end]
+
+
+class SqliteLedger:
+    """Ledger table in WAL mode, indexed on (flag, day) for date ranges and on source."""
+
+    def __init__(self, database, csv_path=LEDGER_PATH):
+        self.csv_path = csv_path  # change notifications go out under the ledger's CSV path
+        # screens write on the Tk thread while background loads read (see background.py)
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='ledger'").fetchone()
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS ledger (id INTEGER PRIMARY KEY, flag INTEGER NOT NULL, "
+                                    "date TEXT NOT NULL, day INTEGER, source TEXT NOT NULL, amount NUMERIC NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS ledger_flag_day ON ledger (flag, day)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS ledger_source ON ledger (source)")
+            if not exists and Path(csv_path).exists():
+                self.insert(CsvLedger(csv_path).read()[0])
+
+    def insert(self, rows):
+        self.connection.executemany("INSERT INTO ledger (flag, date, day, source, amount) VALUES (?, ?, ?, ?, ?)",
+                                    [(int(row[0]), row[1], day_or_none(row[1]), row[2], row[3]) for row in rows])
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        with self.lock, self.connection:
+            self.insert(rows)
+        ledger_events.publish(self.csv_path, rows)
+
+    @staticmethod
+    def as_rows(records):
+        return [[str(flag), date, source, str(amount)] for flag, date, source, amount in records]
+
+    def read(self, cursor=None):
+        last = cursor or 0
+        with self.lock:
+            newest = self.connection.execute("SELECT MAX(id) FROM ledger").fetchone()[0] or 0
+            reset = cursor is None or newest < last
+            if reset:
+                last = 0
+            records = self.connection.execute(
+                "SELECT flag, date, source, amount FROM ledger WHERE id > ? ORDER BY id", (last,)).fetchall()
+        return self.as_rows(records), max(last, newest), reset
+
+    def rows(self):
+        """Every stored row, fetched FETCH_ROWS at a time so writers only wait for one batch."""
+        with self.lock:
+            records = self.connection.execute("SELECT flag, date, source, amount FROM ledger")
+        while True:
+            with self.lock:
+                batch = records.fetchmany(FETCH_ROWS)
+            if not batch:
+                return
+            yield from self.as_rows(batch)
+
+    def columns(self, use_numpy=True):
+        return None
+
+    def between(self, start, end, flag=None):
+        flags = (0, 1) if flag is None else (flag,)
+        with self.lock:
+            records = self.connection.execute(
+                f"SELECT flag, date, source, amount FROM ledger WHERE flag IN ({', '.join('?' * len(flags))}) "
+                "AND day BETWEEN ? AND ? ORDER BY day, id", (*flags, start, end)).fetchall()
+        return self.as_rows(records)
+
+
+class CsvUsers:
+    """user_rec.csv with an in-memory email -> record index.
+
+    The index is built on the first lookup and kept in step with the file by a stat check on
+    every lookup: appended rows are read on their own, a rewritten file is indexed again. Users
+    added through ``add`` go straight into the index. The first record for an email wins, as it
+    did for the row-by-row scan. The login check looks users up on a worker while registration
+    adds them on the Tk thread, so the cursor and index are only touched under ``lock``.
+    """
+
+    def __init__(self, path=USERS_PATH):
+        self.path = Path(path)
+        self.index = {}
+        self.cursor = None
+        self.lock = threading.RLock()
+
+    def refresh(self):
+        with self.lock:
+            rows, self.cursor, reset = read_csv(self.path, self.cursor)
+            if reset:
+                self.index = {}
+            for row in rows:
+                if len(row) > 1:
+                    self.index.setdefault(row[1], row)
+
+    def find(self, email):
+        with self.lock:
+            self.refresh()
+            return self.index.get(email)
+
+    def add(self, user):
+        with self.lock:
+            with open(self.path, 'a', newline="") as file:
+                csv.writer(file).writerow(user)
+            if self.cursor is not None:
+                self.index.setdefault(user[1], list(user))
+
+
+class SqliteUsers:
+    def __init__(self, database, csv_path=USERS_PATH):
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='users'").fetchone()
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS users (user_name TEXT NOT NULL, "
+                                    "email TEXT NOT NULL, password TEXT NOT NULL)")
+            self.connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS users_email ON users (email)")
+            if not exists and Path(csv_path).exists():
+                with open(csv_path, newline="") as file:
+                    rows = [row[:3] for row in list(csv.reader(file))[1:] if row]
+                self.connection.executemany("INSERT OR IGNORE INTO users VALUES (?, ?, ?)", rows)
+
+    def find(self, email):
+        with self.lock:
+            row = self.connection.execute("SELECT user_name, email, password FROM users WHERE email = ?",
+                                          (email,)).fetchone()
+        return list(row) if row else None
+
+    def add(self, user):
+        with self.lock, self.connection:
+            self.connection.execute("INSERT INTO users VALUES (?, ?, ?)", user[:3])
+
+
+_repositories = {}
+
+
+def backend():
+    return os.environ.get("MONEYMANAGER_BACKEND", "csv").lower()
+
+
+def ledger_repository(csv_path=LEDGER_PATH):
+    """The ledger store for the configured backend; ``csv_path`` names the ledger (and locates the database)."""
+    key = ("ledger", backend(), os.path.abspath(csv_path))
+    if key not in _repositories:
+        if backend() == "sqlite":
+            _repositories[key] = SqliteLedger(Path(csv_path).parent / DATABASE_NAME, csv_path)
+        else:
+            _repositories[key] = CsvLedger(csv_path)
+    return _repositories[key]
+
+
+def user_repository(csv_path=USERS_PATH):
+    key = ("users", backend(), os.path.abspath(csv_path))
+    if key not in _repositories:
+        if backend() == "sqlite":
+            _repositories[key] = SqliteUsers(Path(csv_path).parent / DATABASE_NAME, csv_path)
+        else:
+            _repositories[key] = CsvUsers(csv_path)
+    return _repositories[key]
@@ -0,0 +1,131 @@
+import importlib
+import sys
+from pathlib import Path
+from tkinter import Tk, Frame, TclError
+
+import assets
+import background
+import startup
+from startup import phase
+
+COMPONENT_PATH = Path(__file__).parent
+ASSETS_PATH = COMPONENT_PATH.parent / Path("assets")
+
+# screen name -> (component directory, module, class); every class takes the frame it is built into
+SCREENS = {
+    "login": ("login", "gui_manager", "GUI"),
+    "registration": ("registration", "gui_manager", "GUI"),
+    "dashboard": ("Dashboard", "main", "Main"),
+    "income": ("income", "main", "IncomeManager"),
+    "expense": ("expense", "main", "ExpenseManager"),
+    "summary": ("summary", "gui", "MainWindow"),
+}
+
+
+def load_screen(directory, module_name):
+    """Import a screen module without letting its sibling modules clash with other screens.
+
+    Screens import their neighbours by bare name and several directories reuse the same names
+    (Navigation, GUI, DataHandler, gui_manager ...), so each screen is imported with its own
+    directory first on sys.path and its siblings are dropped from sys.modules afterwards.
+    """
+    directory = COMPONENT_PATH / directory
+    siblings = {file.stem for file in directory.glob("*.py")}
+    saved = {name: sys.modules.pop(name) for name in siblings if name in sys.modules}
+    sys.path.insert(0, str(directory))
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        sys.path.remove(str(directory))
+        for name in siblings:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
+
+
+class ScreenRouter:
+    """Keeps one Tk root and swaps screens as stacked frames, building each screen only once."""
+
+    def __init__(self, window, screens=None):
+        self.window = window
+        self.window.router = self
+        self.specs = dict(SCREENS if screens is None else screens)
+        self.screens = {}
+        self.current = None
+
+    def build(self, name):
+        directory, module_name, class_name = self.specs[name]
+        with phase(f"import {name}"):
+            screen_class = getattr(load_screen(directory, module_name), class_name)
+        frame = Frame(self.window, bg="#28283F")
+        frame.place(x=0, y=0, relwidth=1, relheight=1)
+        with phase(f"build {name}"):
+            self.screens[name] = (frame, screen_class(frame))
+        return self.screens[name]
+
+    def show(self, name):
+        """Raise a screen, building it on first use; screens showing ledger data refresh on revisits.
+
+        The screen being left is told with ``leave()`` when it has one, so it can cancel its
+        background loads.
+        """
+        if self.current is not None and self.current != name:
+            _, previous = self.screens[self.current]
+            if hasattr(previous, "leave"):
+                previous.leave()
+        if name in self.screens:
+            frame, screen = self.screens[name]
+            if hasattr(screen, "refresh"):
+                screen.refresh()
+        else:
+            frame, screen = self.build(name)
+        frame.tkraise()
+        self.current = name
+        return screen
+
+
+def create_window():
+    window = Tk()
+    try:
+        window.iconbitmap(ASSETS_PATH / "dashboard" / "window_logo.ico")
+    except TclError:
+        pass
+    window.title("Money Manager")
+    window.geometry("1116x582")
+    window.geometry("+150+40")
+    window.configure(bg="#28283F")
+    window.resizable(False, False)
+    return window
+
+
+def run(start="login", argv=None):
+    """Open the app on ``start``; ``argv`` (default: the command line) may ask for a startup profile.
+
+    A profiled start does not preload the images of other screens, which would otherwise run in
+    the idle callbacks of the first paint and be counted as this screen's asset decoding. After
+    the first paint it keeps serving events until the screen's background loads have delivered,
+    so their CSV parsing is in the report.
+    """
+    profile = startup.configure(sys.argv[1:] if argv is None else argv)
+    if profile is not None:
+        assets.PRELOAD = False
+    with phase("window"):
+        window = create_window()
+    router = ScreenRouter(window)
+    router.show(start)
+    if profile is not None:
+        with phase("first paint"):
+            window.update_idletasks()  # geometry and redraws only, no queued input events
+        with phase("background loads"):
+            while background.busy():
+                window.after(background.POLL_MS)
+                window.update()
+        profile.write(start)
+        if profile.exit_after:
+            window.destroy()
+            return
+    window.mainloop()
+
+
+if __name__ == "__main__":
+    names = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    run(names[0] if names else "login")
@@ -0,0 +1,95 @@
+"""Per-phase startup timings for the screen entry points.
+
+Run any entry point with ``--profile[=report.json]`` (or set MONEYMANAGER_PROFILE=report.json)
+and the router times opening the window, importing and building the first screen and its first
+paint, while the asset cache and the CSV readers add the time they spend decoding images and
+parsing rows. The CSV reads of the dashboard and summary run on background loaders, so the
+router then waits for those loads ("background loads") before the report is written as JSON; ``--profile-exit``
+(or MONEYMANAGER_PROFILE_EXIT=1) then closes the app, which is what benchmarks/bench_startup.py
+uses. Phases can nest: "build <screen>" includes the image decoding and CSV parsing it caused.
+
+When profiling is off ``phase`` and ``record`` do nothing. Both may be called from worker threads.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "MONEYMANAGER_PROFILE"
+PROFILE_EXIT_ENV = "MONEYMANAGER_PROFILE_EXIT"
+DEFAULT_REPORT = "startup_profile.json"
+
+STARTED = time.perf_counter()
+_profile = None
+
+
+class StartupProfile:
+    def __init__(self, path, exit_after=False):
+        self.path = path
+        self.exit_after = exit_after
+        self.phases = {}  # name -> [seconds, count], in the order phases first finished
+        self.lock = threading.Lock()  # loaders record from their worker threads
+
+    def add(self, name, seconds):
+        with self.lock:
+            totals = self.phases.setdefault(name, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    def report(self, screen):
+        with self.lock:
+            phases = [{"name": name, "ms": round(seconds * 1000, 2), "count": count}
+                      for name, (seconds, count) in self.phases.items()]
+        return {
+            "screen": screen,
+            "total_ms": round((time.perf_counter() - STARTED) * 1000, 2),
+            "process_cpu_ms": round(time.process_time() * 1000, 2),  # includes interpreter start-up
+            "phases": phases,
+            "python": sys.version.split()[0],
+        }
+
+    def write(self, screen):
+        report = self.report(screen)
+        with open(self.path, "w") as file:
+            json.dump(report, file, indent=2)
+        return report
+
+
+def configure(argv):
+    """Turn profiling on from ``--profile[=path]``/``--profile-exit`` or the environment; returns the profile."""
+    global _profile
+    path = os.environ.get(PROFILE_ENV)
+    exit_after = os.environ.get(PROFILE_EXIT_ENV) == "1"
+    for arg in argv:
+        if arg == "--profile":
+            path = path or DEFAULT_REPORT
+        elif arg.startswith("--profile="):
+            path = arg.split("=", 1)[1]
+        elif arg == "--profile-exit":
+            exit_after = True
+    if path:
+        _profile = StartupProfile(path, exit_after)
+    return _profile
+
+
+def active():
+    return _profile
+
+
+@contextmanager
+def phase(name):
+    if _profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profile.add(name, time.perf_counter() - start)
+
+
+def record(name, seconds):
+    if _profile is not None:
+        _profile.add(name, seconds)
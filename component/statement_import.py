@@ -0,0 +1,191 @@
+"""Bulk import of bank statements into the ledger.
+
+    python component/statement_import.py statement.csv [--date COL] [--source COL] [--amount COL]
+                                         [--type COL | --flag 0|1] [--date-format FMT]
+    python component/statement_import.py statement.ofx
+
+CSV statements are mapped column by column onto flag/Date/Source/Amount; OFX/QFX files are read
+from their STMTTRN blocks (DTPOSTED, NAME or MEMO, TRNAMT, TRNTYPE). The flag comes from a type
+column (credit/income vs debit/expense), from ``--flag``, or from the sign of the amount.
+
+Rows are checked with the rules ``Feedback.submit_data`` applies on the income/expense screens
+(a source and a whole positive amount; a ".00" fraction is dropped) and dates are written the way
+the screens write them. Rows already in the ledger are skipped: a statement imported twice adds
+nothing, while repeated identical transactions within one statement are all kept. The statement
+is read and written ``CHUNK_ROWS`` at a time, each chunk as one ledger write.
+"""
+import argparse
+import csv
+import re
+import sys
+from collections import Counter, namedtuple
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+from columnar import to_minor
+from repository import ledger_repository, day_or_none, LEDGER_PATH
+
+CHUNK_ROWS = 10_000
+MAX_ERRORS = 100
+LEDGER_DATE = "%b %d %Y"  # what the income/expense screens write
+DATE_FORMATS = (LEDGER_DATE, "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y%m%d", "%b %d %y")
+SOURCE_COLUMNS = ("Source", "Description", "Payee", "Name", "Memo", "Narration")
+INCOME_TYPES = {"1", "income", "credit", "cr", "deposit", "dep", "int", "div"}
+EXPENSE_TYPES = {"0", "expense", "debit", "dr", "withdrawal", "payment", "pos", "atm", "fee", "check", "xfer"}
+OFX_TAG = re.compile(r"<(/?)([A-Z0-9.]+)>([^<\r\n]*)")
+
+ImportResult = namedtuple("ImportResult", "read imported duplicates rejected errors")
+Mapping = namedtuple("Mapping", "date source amount type flag date_format", defaults=(None, None, None))
+
+
+class RejectedRow(ValueError):
+    pass
+
+
+def valid_entry(source, amount):
+    """The check ``Feedback.submit_data`` makes before writing a row."""
+    return bool(source) and amount.isnumeric()
+
+
+@lru_cache(maxsize=8192)
+def ledger_date(text, date_format=None):
+    text = text.strip()
+    for pattern in (date_format,) if date_format else DATE_FORMATS:
+        try:
+            return datetime.strptime(text, pattern).strftime(LEDGER_DATE)
+        except ValueError:
+            continue
+    raise RejectedRow(f"unrecognised date {text!r}")
+
+
+def convert(record, mapping):
+    """A ledger row [flag, Date, Source, Amount] for one statement record, or RejectedRow."""
+    source = (record.get(mapping.source) or "").strip()
+    amount = (record.get(mapping.amount) or "").strip().replace(",", "")
+    negative = amount.startswith("-") or (amount.startswith("(") and amount.endswith(")"))
+    amount = amount.strip("-+()")
+    if amount.endswith(".00"):
+        amount = amount[:-3]
+    if not valid_entry(source, amount):
+        raise RejectedRow(f"needs a source and a whole positive amount, got {source!r}, {amount!r}")
+    if mapping.flag is not None:
+        flag = mapping.flag
+    elif mapping.type is not None:
+        kind = (record.get(mapping.type) or "").strip().lower()
+        if kind not in INCOME_TYPES and kind not in EXPENSE_TYPES:
+            raise RejectedRow(f"unknown transaction type {kind!r}")
+        flag = 1 if kind in INCOME_TYPES else 0
+    else:
+        flag = 0 if negative else 1
+    return [flag, ledger_date(record.get(mapping.date) or "", mapping.date_format), source, amount]
+
+
+def row_key(row):
+    flag, date, source, amount = row
+    try:
+        amount = to_minor(str(amount))
+    except ValueError:
+        pass
+    return int(flag), day_or_none(date) or date, source, amount
+
+
+def csv_records(file):
+    return csv.DictReader(file)
+
+
+def ofx_records(file):
+    """Each STMTTRN block of an OFX/QFX file (SGML or XML) as a {tag: value} dict."""
+    record = None
+    for line in file:
+        for closing, tag, value in OFX_TAG.findall(line):
+            if tag == "STMTTRN":
+                if closing and record is not None:
+                    yield record
+                record = None if closing else {}
+            elif record is not None and not closing:
+                record[tag] = value.strip()
+                if tag == "DTPOSTED":
+                    record[tag] = record[tag][:8]  # drop the time and zone: 20240227120000[-5:EST]
+                elif tag == "MEMO":
+                    record.setdefault("NAME", record[tag])
+
+
+def default_mapping(fields, ofx=False):
+    if ofx:
+        return Mapping("DTPOSTED", "NAME", "TRNAMT", "TRNTYPE", date_format="%Y%m%d")
+    source = next((name for name in SOURCE_COLUMNS if name in fields), "Source")
+    kind = next((name for name in ("flag", "Type") if name in fields), None)
+    return Mapping("Date", source, "Amount", kind)
+
+
+def import_statement(path, ledger_path=LEDGER_PATH, mapping=None, chunk_rows=CHUNK_ROWS):
+    """Append the new, valid transactions of a statement to the ledger and count what happened."""
+    ledger = ledger_repository(ledger_path)
+    existing = Counter(hash(row_key(row)) for row in ledger.rows())  # hashes only, a few bytes a row
+    read = imported = duplicates = rejected = 0
+    errors = []  # the first MAX_ERRORS, with their record numbers
+    ofx = Path(path).suffix.lower() in (".ofx", ".qfx")
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as file:
+        records = ofx_records(file) if ofx else csv_records(file)
+        if mapping is None:
+            mapping = default_mapping([] if ofx else records.fieldnames or [], ofx)
+        while True:
+            chunk = list(islice(records, chunk_rows))
+            if not chunk:
+                break
+            rows = []
+            for line, record in enumerate(chunk, start=read + 1):
+                try:
+                    row = convert(record, mapping)
+                except RejectedRow as error:
+                    rejected += 1
+                    if len(errors) < MAX_ERRORS:
+                        errors.append((line, str(error)))
+                    continue
+                key = hash(row_key(row))
+                if existing[key]:
+                    existing[key] -= 1
+                    duplicates += 1
+                else:
+                    rows.append(row)
+            read += len(chunk)
+            if rows:
+                ledger.extend(rows)
+                imported += len(rows)
+    return ImportResult(read, imported, duplicates, rejected, errors)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Import a bank statement into the ledger.")
+    parser.add_argument("statement")
+    parser.add_argument("--ledger", default=LEDGER_PATH)
+    parser.add_argument("--date")
+    parser.add_argument("--source")
+    parser.add_argument("--amount")
+    kind = parser.add_mutually_exclusive_group()
+    kind.add_argument("--type", help="column saying income/credit or expense/debit")
+    kind.add_argument("--flag", type=int, choices=(0, 1), help="import every row as expense (0) or income (1)")
+    parser.add_argument("--date-format", help="strptime format of the date column")
+    args = parser.parse_args(argv)
+    mapping = None
+    if any((args.date, args.source, args.amount, args.type, args.flag is not None, args.date_format)):
+        with open(args.statement, newline="", encoding="utf-8-sig") as file:
+            fields = next(csv.reader(file), [])
+        defaults = default_mapping(fields, Path(args.statement).suffix.lower() in (".ofx", ".qfx"))
+        mapping = Mapping(args.date or defaults.date, args.source or defaults.source, args.amount or defaults.amount,
+                          (args.type or defaults.type) if args.flag is None else None, args.flag,
+                          args.date_format or defaults.date_format)
+    result = import_statement(args.statement, args.ledger, mapping)
+    for line, error in result.errors:
+        print(f"  record {line}: {error}")
+    if result.rejected > len(result.errors):
+        print(f"  ... and {result.rejected - len(result.errors)} more")
+    print(f"{result.read} records read, {result.imported} imported, "
+          f"{result.duplicates} already in the ledger, {result.rejected} rejected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,26 +1,122 @@
-import csv
-from datetime import datetime
+import heapq
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from columnar import to_minor
+from ledger_dates import date_key
+from parallel_load import sorted_runs, worth_splitting
+from repository import ledger_repository, HEADER
+
+INSERT_LIMIT = 64  # out-of-order appends up to this many rows are bisected in, larger batches are merged
+
 
 class DataManager:
+    """Reads the ledger for the summary screen and keeps it parsed and sorted by date.
+
+    ``get_data`` returns the cached list (header first) until the ledger repository reports new
+    rows. Rows stored since the last read are parsed on their own and merged in; since new rows
+    are usually dated after the existing ones this is normally a plain extend. When the
+    repository starts over because the ledger was rewritten, the cache is rebuilt.
+
+    Rows are ordered by the ordinal date keys kept in ``keys``; rows whose date cannot be read
+    are left out of the ledger and collected in ``bad_rows``; they still count in ``totals``, as
+    they do on the dashboard, and the summary screen says how many there are. An up to date columnar copy of the
+    ledger (see columnar.py) replaces parsing for the part of the CSV it covers; without one a
+    large CSV is first read on all cores (see parallel_load.py).
+    """
+
     def __init__(self, data_filename):
         self.data_filename = data_filename
+        self.ledger = ledger_repository(data_filename)
+        self.data = None
+        self.keys = []
+        self.bad_rows = []
+        self.sums = [0, 0]  # expense, income in minor units, every row read so far
+        self.cursor = None
 
     def get_data(self):
-        with open(self.data_filename, "r", newline="") as file:
-            reader = csv.reader(file)
-            data = list(reader)
-            header = data[0]
-            d_sorted = sorted(data[1:], key=self.extract_date)
-            d_sorted.insert(0, header)
-            return d_sorted
+        if self.data is None:
+            self.load_columns()
+        rows, cursor, reset = self.ledger.read(self.cursor)
+        if reset and self.cursor is not None:
+            self.load_columns()
+            rows, cursor, reset = self.ledger.read(self.cursor)
+        if reset and self.cursor is None:
+            self.data, self.keys, self.bad_rows, self.sums = [list(HEADER)], [], [], [0, 0]
+        if rows:
+            self.merge(rows)
+        self.cursor = cursor
+        return self.data
+
+    def load_columns(self):
+        self.data, self.keys, self.bad_rows, self.sums, self.cursor = None, [], [], [0, 0], None
+        stored = self.ledger.columns(use_numpy=False)
+        if stored is None:
+            if worth_splitting(self.ledger):
+                merged, self.bad_rows, self.cursor = sorted_runs(self.data_filename)
+                self.data = [list(HEADER)] + [row for _, row in merged]
+                self.keys = [key for key, _ in merged]
+                self.count(self.data[1:])
+                self.count(self.bad_rows)
+            return
+        columns, self.cursor = stored
+        for flag, amount in zip(columns.flag, columns.amount):
+            self.sums[flag == 1] += amount
+        rows = list(columns.rows())
+        order = sorted((index for index, key in enumerate(columns.date) if key), key=columns.date.__getitem__)
+        self.bad_rows = [rows[index] for index, key in enumerate(columns.date) if not key]
+        self.data = [list(HEADER)] + [rows[index] for index in order]
+        self.keys = [columns.date[index] for index in order]
+
+    def merge(self, rows):
+        self.count(rows)
+        new, bad = [], []
+        for row in rows:
+            try:
+                new.append((self.extract_date(row), row))
+            except (ValueError, IndexError):
+                bad.append(row)
+        self.bad_rows.extend(bad)
+        if not new:
+            return
+        new.sort(key=lambda pair: pair[0])
+        if not self.keys or new[0][0] >= self.keys[-1]:
+            self.keys.extend(key for key, _ in new)
+            self.data.extend(row for _, row in new)
+        elif len(new) <= INSERT_LIMIT:
+            for key, row in new:
+                index = bisect_right(self.keys, key)
+                self.keys.insert(index, key)
+                self.data.insert(index + 1, row)
+        else:
+            merged = list(heapq.merge(zip(self.keys, self.data[1:]), new, key=lambda pair: pair[0]))
+            self.keys = [key for key, _ in merged]
+            self.data[1:] = [row for _, row in merged]
+
+    def count(self, rows):
+        """Add rows to ``sums``; an amount that can't be read counts as 0, as in the columnar store."""
+        for row in rows:
+            try:
+                self.sums[row[0] == '1'] += to_minor(row[3])
+            except (ValueError, IndexError):
+                pass
+
+    def totals(self):
+        """(income, expense, balance) of every row, those with unreadable dates included.
+
+        The sums are kept up to date as rows are read, so this costs no more than ``get_data``.
+        """
+        self.get_data()
+        income, expense = self.sums[1] / 100, self.sums[0] / 100
+        return income, expense, income - expense
+
+    def between(self, start, end):
+        """Rows dated from ``start`` to ``end`` inclusive, both given as ordinal date keys."""
+        data = self.get_data()
+        return data[bisect_left(self.keys, start) + 1:bisect_right(self.keys, end) + 1]
 
     @staticmethod
     def extract_date(row):
-        date_string = row[1]
-        try:
-            return datetime.strptime(date_string, "%b %d %Y")
-        except ValueError:
-            try:
-                return datetime.strptime(date_string, "%b %d %y")
-            except ValueError:
-                return datetime.now()
+        return date_key(row[1])
@@ -1,28 +1,15 @@
-import os
-
 class SwitchManager:
-    def __init__(self, output_path):
-        self.output_path = output_path
+    def show(self, window, name):
+        window.winfo_toplevel().router.show(name)
 
     def dashboard(self,window):
-        window.destroy()
-        self.execute_python_file("dashboard/main.py")
+        self.show(window, "dashboard")
 
     def login(self,window):
-        window.destroy()
-        self.execute_python_file("login/main.py")
+        self.show(window, "login")
 
     def expense(self,window):
-        window.destroy()
-        self.execute_python_file("expense/main.py")
+        self.show(window, "expense")
 
     def income(self,window):
-        window.destroy()
-        self.execute_python_file("income/main.py")
-
-
-    def execute_python_file(self, file_path):
-        try:
-            os.system(f'python {self.output_path / file_path}')
-        except FileNotFoundError:
-            print(f"Error: The file '{file_path}' does not exist.")
+        self.show(window, "income")
@@ -3,7 +3,9 @@ from datetime import datetime
 from pathlib import Path
 
 import pytest
-from DataManager import DataManager  
+from DataManager import DataManager
+from columnar import ColumnarLedger
+import parallel_load
 data_path = Path(__file__).parent.parent.parent / "data_store" / "data.csv"
 
 @pytest.fixture
@@ -33,3 +35,85 @@ def test_summary_by_date(sample_instance):
     assert summary[datetime.strptime(date_string, "%b %d %Y").date()] == {'zzz': 1000 }
 
 
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("flag,Date,Source,Amount\n1,Mar 04 2024,scholarship,5000\n0,Feb 22 2024,food,550\n")
+    return path
+
+def append(path, *rows):
+    with open(path, "a", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+def test_cached_until_file_changes(ledger):
+    manager = DataManager(ledger)
+    assert manager.get_data() is manager.get_data()
+    assert [row[2] for row in manager.get_data()[1:]] == ['food', 'scholarship']
+
+def test_appended_rows_are_merged_in_date_order(ledger):
+    manager = DataManager(ledger)
+    manager.get_data()
+    append(ledger, [1, "Apr 19 2024", "zzz", 1000], [0, "Mar 01 2024", "loan", 3000])
+    assert [row[2] for row in manager.get_data()[1:]] == ['food', 'loan', 'scholarship', 'zzz']
+
+def test_large_out_of_order_append(ledger):
+    manager = DataManager(ledger)
+    manager.get_data()
+    append(ledger, *[[0, f"Jan {day:02d} 2024", f"day{day}", day] for day in range(31, 0, -1)] * 3)
+    data = manager.get_data()
+    assert data[1][2] == 'day1' and data[-1][2] == 'scholarship'
+    assert data[1:] == sorted(data[1:], key=DataManager.extract_date)
+
+def test_rewritten_file_is_reloaded(ledger):
+    manager = DataManager(ledger)
+    manager.get_data()
+    ledger.write_text("flag,Date,Source,Amount\n1,Mar 29 2024,allowence,2000\n")
+    assert manager.get_data()[1:] == [['1', 'Mar 29 2024', 'allowence', '2000']]
+
+def test_bad_dates_are_reported_not_stamped(ledger):
+    append(ledger, [0, "someday", "mystery", 10])
+    manager = DataManager(ledger)
+    assert [row[2] for row in manager.get_data()[1:]] == ['food', 'scholarship']
+    assert manager.bad_rows == [['0', 'someday', 'mystery', '10']]
+
+def test_totals_count_rows_with_bad_dates(ledger):
+    append(ledger, [0, "someday", "mystery", 10], [1, "Mar 05 2024", "gift", "lots"])
+    totals = DataManager(ledger).totals()
+    assert totals == (5000.0, 560.0, 4440.0)
+    analytics = pytest.importorskip("analytics")
+    assert analytics.LedgerAnalytics.load(ledger).totals() == totals
+
+def test_rows_between_dates(ledger):
+    append(ledger, [0, "Mar 01 2024", "loan", 3000], [1, "Apr 19 2024", "zzz", 1000])
+    manager = DataManager(ledger)
+    start, end = datetime(2024, 3, 1).toordinal(), datetime(2024, 3, 31).toordinal()
+    assert [row[2] for row in manager.between(start, end)] == ['loan', 'scholarship']
+
+def test_columnar_store_gives_same_ledger(ledger):
+    append(ledger, [0, "Mar 01 2024", "loan", 3000], [0, "someday", "mystery", 10])
+    from_csv = DataManager(ledger)
+    expected = from_csv.get_data()
+    ColumnarLedger(ledger).compact()
+    append(ledger, [1, "Jan 05 2024", "gift", 200])
+    manager = DataManager(ledger)
+    assert manager.get_data() == expected[:1] + [['1', 'Jan 05 2024', 'gift', '200']] + expected[1:]
+    assert manager.bad_rows == from_csv.bad_rows == [['0', 'someday', 'mystery', '10']]
+    assert manager.totals() == (5200.0, 3560.0, 1640.0)
+
+
+def test_large_ledger_is_sorted_by_the_parallel_read(ledger, monkeypatch):
+    monkeypatch.setattr(parallel_load, "PARALLEL_MIN_BYTES", 0)
+    manager = DataManager(ledger)
+    assert [row[2] for row in manager.get_data()[1:]] == ['food', 'scholarship']
+    append(ledger, ['0', 'Mar 01 2024', 'loan', '10'])
+    assert [row[2] for row in manager.get_data()[1:]] == ['food', 'loan', 'scholarship']
+    assert manager.totals() == (5000.0, 560.0, 4440.0)
+
+
+def test_totals_come_from_the_configured_backend(ledger, monkeypatch):
+    monkeypatch.setenv("MONEYMANAGER_BACKEND", "sqlite")
+    manager = DataManager(ledger)
+    assert manager.totals() == (5000.0, 550.0, 4450.0)
+    manager.ledger.append(['1', 'Apr 19 2024', 'zzz', '1000'])  # stored in the database, not in data.csv
+    assert manager.totals() == (6000.0, 550.0, 5450.0)
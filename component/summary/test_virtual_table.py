@@ -0,0 +1,20 @@
+from virtual_table import visible_range
+
+
+def test_range_at_top_is_clamped():
+    assert visible_range(0, 280, 28, 4, 100_000) == (0, 14)
+
+
+def test_range_is_padded_by_overscan():
+    first, last = visible_range(28 * 500 + 10, 280, 28, 4, 100_000)
+    assert (first, last) == (496, 515)
+
+
+def test_range_window_size_is_independent_of_ledger_size():
+    small = visible_range(28 * 50, 280, 28, 4, 1_000)
+    large = visible_range(28 * 50, 280, 28, 4, 1_000_000)
+    assert small == large
+
+
+def test_short_ledger():
+    assert visible_range(0, 280, 28, 4, 3) == (0, 3)
@@ -0,0 +1,94 @@
+from math import ceil
+from tkinter import Canvas, Scrollbar
+
+HEADER_BG = '#E2B2FF'
+INCOME_BG = '#0FFF52'
+EXPENSE_BG = '#FF4545'
+
+
+def visible_range(top, height, row_height, overscan, count):
+    """Indexes of the rows a viewport starting at pixel ``top`` needs, padded by ``overscan`` rows."""
+    first = max(0, int(top // row_height) - overscan)
+    last = min(count, ceil((top + height) / row_height) + overscan)
+    return first, max(first, last)
+
+
+def row_colour(row):
+    return INCOME_BG if row[0] == '1' else EXPENSE_BG
+
+
+class VirtualTable:
+    """Ledger table that only draws the rows in view; ``set_rows`` takes the ledger with its header first.
+
+    A fixed pool of row slots (a rectangle and a text item per cell) is created once for the
+    visible height plus ``overscan`` rows above and below; scrolling moves and relabels those
+    slots, so the number of canvas items does not depend on the ledger size.
+    """
+
+    def __init__(self, window, x, y, width, height, columns=3, row_height=28, overscan=4):
+        self.columns = columns
+        self.row_height = row_height
+        self.overscan = overscan
+        self.rows = []
+        self.shown = None
+        self.body_height = height - row_height
+        self.cell_width = (width - 16) / columns
+        self.header = Canvas(window, bg='#28283F', width=width - 16, height=row_height, highlightthickness=0)
+        self.header.place(x=x, y=y)
+        self.titles = [self.draw_cell(self.header, col, 0, '', HEADER_BG)[1] for col in range(columns)]
+        self.canvas = Canvas(window, bg='#28283F', width=width - 16, height=self.body_height, highlightthickness=0,
+                             yscrollincrement=1)
+        self.canvas.place(x=x, y=y + row_height)
+        self.scrollbar = Scrollbar(window, orient='vertical', command=self.canvas.yview)
+        self.scrollbar.place(x=x + width - 16, y=y + row_height, width=16, height=self.body_height)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+        self.canvas.bind('<MouseWheel>', lambda event: self.scroll(-event.delta // 120))
+        self.canvas.bind('<Button-4>', lambda event: self.scroll(-1))
+        self.canvas.bind('<Button-5>', lambda event: self.scroll(1))
+        pool = ceil(self.body_height / row_height) + 1 + 2 * overscan
+        self.slots = [[self.draw_cell(self.canvas, col, 0, '', EXPENSE_BG) for col in range(columns)]
+                      for _ in range(pool)]
+
+    def draw_cell(self, canvas, col, top, text, colour):
+        left = col * self.cell_width
+        rect = canvas.create_rectangle(left, top, left + self.cell_width, top + self.row_height,
+                                       fill=colour, outline='#28283F')
+        label = canvas.create_text(left + self.cell_width / 2, top + self.row_height / 2, text=text, font='Arial')
+        return rect, label
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.shown = None
+        for col, title in enumerate(self.titles):
+            self.header.itemconfigure(title, text=rows[0][col + 1])
+        self.canvas.configure(scrollregion=(0, 0, self.cell_width * self.columns,
+                                            max((len(rows) - 1) * self.row_height, self.body_height)))
+        self.render()
+
+    def scroll(self, units):
+        self.canvas.yview_scroll(units * self.row_height, 'units')
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def render(self):
+        first, last = visible_range(self.canvas.canvasy(0), self.body_height, self.row_height, self.overscan,
+                                    len(self.rows) - 1)
+        if (first, last) == self.shown:
+            return
+        self.shown = first, last
+        for offset, slot in enumerate(self.slots):
+            index = first + offset
+            if index >= last:
+                for rect, label in slot:
+                    self.canvas.itemconfigure(rect, state='hidden')
+                    self.canvas.itemconfigure(label, state='hidden')
+                continue
+            row, top = self.rows[index + 1], index * self.row_height
+            for col, (rect, label) in enumerate(slot):
+                left = col * self.cell_width
+                self.canvas.coords(rect, left, top, left + self.cell_width, top + self.row_height)
+                self.canvas.coords(label, left + self.cell_width / 2, top + self.row_height / 2)
+                self.canvas.itemconfigure(rect, state='normal', fill=row_colour(row))
+                self.canvas.itemconfigure(label, state='normal', text=row[col + 1])
@@ -0,0 +1,59 @@
+import csv
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+from analytics import LedgerAnalytics, INCOME, EXPENSE
+from columnar import ColumnarLedger
+
+ROWS = [[1, "Feb 27 2024", "tution", 3000], [0, "Feb 27 2024", "loan", 3000], [0, "Feb 22 2024", "food", 550],
+        [0, "Mar 04 2024", "shopping", 1500], [1, "Mar 04 2024", "scholarship", 5000],
+        [0, "Mar 07 2024", "food", 700], [0, "Mar 07 2024", "bus", 25.5], [1, "Apr 19 2024", "zzz", 1000]]
+
+
+@pytest.fixture(params=[False, True], ids=["csv", "columnar"])
+def analytics(request, tmp_path):
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([["flag", "Date", "Source", "Amount"]] + ROWS[:5])
+    if request.param:
+        ColumnarLedger(path).compact()
+    with open(path, "a", newline="") as file:
+        csv.writer(file).writerows(ROWS[5:])
+    return LedgerAnalytics.load(path)
+
+
+def test_totals(analytics):
+    assert len(analytics) == 8
+    assert analytics.totals() == (9000, 5775.5, 3224.5)
+
+
+def test_by_source_adds_repeated_sources(analytics):
+    assert analytics.by_source(EXPENSE) == {'loan': 3000, 'food': 1250, 'shopping': 1500, 'bus': 25.5}
+
+
+def test_zero_sum_sources_are_kept(tmp_path):
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([["flag", "Date", "Source", "Amount"], [0, "Feb 22 2024", "refund", 0],
+                                    [0, "Feb 22 2024", "food", 550], [0, "Feb 23 2024", "refund", 0]])
+    ColumnarLedger(path).compact()
+    assert list(LedgerAnalytics.load(path).by_source(EXPENSE).items()) == [('refund', 0), ('food', 550)]
+
+
+def test_top_k(analytics):
+    assert analytics.top_k(EXPENSE, 2) == {'loan': 3000, 'shopping': 1500, 'Others': 1275.5}
+    assert analytics.top_k(INCOME, 4) == {'scholarship': 5000, 'tution': 3000, 'zzz': 1000, 'Others': 0}
+
+
+def test_groupings(analytics):
+    assert analytics.by_day(INCOME) == {date(2024, 2, 27): 3000, date(2024, 3, 4): 5000, date(2024, 4, 19): 1000}
+    assert analytics.by_month(EXPENSE) == {(2024, 2): 3550, (2024, 3): 2225.5}
+    assert analytics.by_day_and_source()[date(2024, 3, 7)] == {'food': 700, 'bus': 25.5}
+
+
+def test_running_balance(analytics):
+    days, balance = analytics.running_balance()
+    assert list(days) == sorted(days)
+    assert list(balance) == [-550, 2450, -550, -2050, 2950, 2250, 2224.5, 3224.5]
@@ -0,0 +1,72 @@
+import shutil
+from tkinter import Tk, TclError
+
+import pytest
+import assets as assets_module
+from assets import AssetCache, ASSETS_PATH, photo, preload_paths
+
+
+@pytest.fixture
+def root():
+    try:
+        window = Tk()
+    except TclError:
+        pytest.skip("no display")
+    window.withdraw()
+    yield window
+    window.destroy()
+
+
+@pytest.fixture
+def assets(tmp_path):
+    for folder in ("expense", "summary"):
+        (tmp_path / folder).mkdir()
+        shutil.copy(ASSETS_PATH / folder / "button_1.png", tmp_path / folder / "button_1.png")
+    shutil.copy(ASSETS_PATH / "login" / "button_1.png", tmp_path / "summary" / "button_2.png")
+    return tmp_path
+
+
+def test_identical_files_share_one_image(root, assets):
+    cache = AssetCache(root, assets)
+    first = cache.image(assets / "expense" / "button_1.png")
+    assert cache.image(assets / "summary" / "button_1.png") is first
+    assert cache.image(assets / "summary" / "button_2.png") is not first
+    report = cache.report()
+    assert (report["files"], report["images"], report["shared"]) == (3, 2, 1)
+    assert report["bytes"] > 0
+
+
+def test_cache_lives_on_the_root(root):
+    image = photo(root, ASSETS_PATH / "summary" / "button_1.png")
+    assert photo(root, ASSETS_PATH / "summary" / "button_1.png") is image
+    assert root.asset_cache.report()["files"] == 1
+
+
+def test_no_widget_means_the_default_root(root):
+    image = photo(None, ASSETS_PATH / "summary" / "button_1.png")
+    assert photo(root, ASSETS_PATH / "summary" / "button_1.png") is image
+
+
+def test_missing_file_raises_tcl_error(root, assets):
+    with pytest.raises(TclError):
+        AssetCache(root, assets).image(assets / "avatar.png")
+
+
+def test_preload_covers_the_reachable_screens_only():
+    paths = preload_paths(ASSETS_PATH, "login")
+    assert paths and {path.parent.name for path in paths} == {"dashboard"}
+    folders = {path.parent.name for path in preload_paths(ASSETS_PATH, "dashboard")}
+    assert folders == {"income", "expense", "summary"}
+    assert preload_paths(ASSETS_PATH, "reg") == [] and preload_paths(ASSETS_PATH, None) == []
+
+
+def test_first_image_of_a_folder_schedules_its_neighbours(root, monkeypatch):
+    monkeypatch.setattr(assets_module, "PRELOAD", True)
+    scheduled = []
+    monkeypatch.setattr(root, "after_idle", lambda function, *args: scheduled.append(args))
+    cache = AssetCache(root)
+    cache.image(ASSETS_PATH / "login" / "button_1.png")
+    cache.image(ASSETS_PATH / "login" / "button_2.png")
+    assert scheduled == [(preload_paths(ASSETS_PATH.resolve(), "login"),)]
+    cache.preload(scheduled[0][0][:1])
+    assert len(scheduled) == 2 and cache.report()["files"] == 3
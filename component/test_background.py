@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+from background import Loader, busy
+
+
+class FakeWidget:
+    """Runs after() callbacks when ``run`` is called, the way the mainloop would."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback, *args):
+        self.scheduled.append((callback, args))
+
+    def run(self, timeout=5):
+        deadline = time.monotonic() + timeout
+        while self.scheduled and time.monotonic() < deadline:
+            callback, args = self.scheduled.pop(0)
+            callback(*args)
+
+
+def test_result_is_delivered_on_the_polling_thread():
+    widget, seen = FakeWidget(), []
+    Loader(widget, lambda value: (value * 2, threading.get_ident()), seen.append).start(21)
+    widget.run()
+    assert seen == [(42, seen[0][1])] and seen[0][1] != threading.get_ident()
+
+
+def test_busy_until_the_result_is_handed_over():
+    widget, seen = FakeWidget(), []
+    release = threading.Event()
+    Loader(widget, release.wait, lambda result: seen.append(busy())).start()
+    assert busy()
+    release.set()
+    widget.run()
+    assert seen == [False] and not busy()
+
+
+def test_errors_go_to_on_error():
+    widget, errors = FakeWidget(), []
+    Loader(widget, lambda: 1 / 0, lambda result: None, on_error=errors.append).start()
+    widget.run()
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_cancelled_load_is_dropped():
+    widget, seen = FakeWidget(), []
+    release = threading.Event()
+    loader = Loader(widget, release.wait, seen.append)
+    loader.start()
+    loader.cancel()
+    release.set()
+    widget.run()
+    assert seen == [] and not loader.running
+
+
+def test_start_while_running_loads_again_afterwards():
+    widget, seen, calls = FakeWidget(), [], []
+    release = threading.Event()
+
+    def load(value):
+        calls.append(value)
+        release.wait()
+        return value
+
+    loader = Loader(widget, load, seen.append)
+    loader.start(1)
+    loader.start(2)
+    release.set()
+    widget.run()
+    assert calls == [1, 2] and seen == [2]
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_pools(processes):
+    widget, seen = FakeWidget(), []
+    Loader(widget, sum, seen.append, processes=processes).start([1, 2, 3])
+    widget.run(timeout=30)
+    assert seen == [6]
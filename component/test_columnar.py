@@ -0,0 +1,64 @@
+import csv
+
+import pytest
+from columnar import ColumnarLedger, to_minor, from_minor
+
+ROWS = [["1", "Feb 27 2024", "tution", "3000"], ["0", "Feb 22 2024", "food", "550"],
+        ["0", "Mar 07 2024", "tour, 7no ghat", "700.50"], ["0", "not a date", "food", "50"]]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([["flag", "Date", "Source", "Amount"]] + ROWS)
+    return ColumnarLedger(path)
+
+
+def append(ledger, *rows):
+    with open(ledger.csv_path, "a", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+def test_minor_units_round_trip():
+    assert [from_minor(to_minor(amount)) for amount in ("3000", "700.50", "0.05")] == ["3000", "700.50", "0.05"]
+
+
+def test_missing_store_is_not_loaded(ledger):
+    assert ledger.load() is None
+
+
+def test_compact_round_trips_rows(ledger):
+    ledger.compact()
+    columns = ledger.load(use_numpy=False)
+    assert len(columns) == 4
+    assert list(columns.rows()) == ROWS
+    assert columns.totals() == {1: {"tution": 3000.0}, 0: {"food": 600.0, "tour, 7no ghat": 700.5}}
+    assert columns.offset == ledger.csv_path.stat().st_size
+
+
+def test_sync_appends_only_new_rows(ledger):
+    ledger.compact()
+    append(ledger, ["1", "Apr 19 2024", "zzz", "1000"])
+    assert ledger.load().offset < ledger.csv_path.stat().st_size
+    assert ledger.sync()["rows"] == 5
+    columns = ledger.load(use_numpy=False)
+    assert list(columns.rows())[-1] == ["1", "Apr 19 2024", "zzz", "1000"]
+    assert columns.sources == ["tution", "food", "tour, 7no ghat", "zzz"]
+
+
+def test_rewritten_csv_invalidates_store(ledger):
+    ledger.compact()
+    ledger.csv_path.write_text("flag,Date,Source,Amount\n1,Feb 27 2024,salary,9000\n")
+    assert ledger.load() is None
+    assert ledger.sync()["rows"] == 1
+
+
+def test_unreadable_fields_keep_their_text(ledger):
+    assert pytest.raises(ValueError, to_minor, "inf")
+    ledger.compact()
+    append(ledger, ["0", "Apr 19 2024", "fee", "inf"], ["0", "", "food", "abc"])
+    ledger.sync()
+    rows = list(ledger.load(use_numpy=False).rows())
+    assert rows[-2:] == [["0", "Apr 19 2024", "fee", "inf"], ["0", "", "food", "abc"]]
+    assert rows[3] == ["0", "not a date", "food", "50"]
@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from ledger_events import ledger_events
+from router import load_screen
+
+
+def test_hidden_dashboard_stops_following_appends(tmp_path):
+    path, requests, calls = tmp_path / "data.csv", [], []
+    dashboard = object.__new__(load_screen("Dashboard", "main").Main)  # no Tk: only the event wiring is used
+    dashboard.body = SimpleNamespace(file_handler=SimpleNamespace(filename=path))
+    dashboard.repaint = SimpleNamespace(request=requests.append, cancel=lambda: calls.append("cancel"))
+    dashboard.loader = SimpleNamespace(start=lambda: calls.append("start"), cancel=lambda: calls.append("cancel"))
+    dashboard.unsubscribe = None
+    dashboard.refresh()
+    ledger_events.publish(path, ["shown"])
+    dashboard.leave()
+    ledger_events.publish(path, ["hidden"])
+    dashboard.refresh()
+    dashboard.refresh()  # a repaint while shown does not subscribe twice
+    ledger_events.publish(path, ["back"])
+    dashboard.leave()
+    assert requests == [["shown"], ["back"]]
+    assert calls == ["start", "cancel", "cancel", "start", "start", "cancel", "cancel"]
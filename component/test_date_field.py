@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from tkinter import Tk, TclError
+
+import pytest
+from date_field import LazyDateEntry
+
+COMPONENT_PATH = Path(__file__).parent
+
+
+@pytest.fixture
+def root():
+    try:
+        window = Tk()
+    except TclError:
+        pytest.skip("no display")
+    window.withdraw()
+    yield window
+    window.destroy()
+
+
+@pytest.mark.parametrize("screen", ["income", "expense"])
+def test_screens_import_without_tkcalendar(screen):
+    code = "import sys; sys.path.insert(0, '.'); import GUI; print('tkcalendar' in sys.modules, 'numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=COMPONENT_PATH / screen,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_plain_entry_until_opened(root):
+    field = LazyDateEntry(root, date_pattern="dd-MM-yyyy")
+    field.grid(padx=5, pady=5)
+    assert field.calendar is None and field.get_date() == date.today()
+    field.set_date("01-03-2024")
+    assert field.widget.get() == "01-03-2024"
+    field.open()
+    assert field.calendar is not None and field.get_date() == date(2024, 3, 1)
+    assert field.calendar.grid_info()["padx"] == 5
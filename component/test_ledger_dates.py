@@ -0,0 +1,22 @@
+from datetime import date, datetime
+
+import pytest
+from ledger_dates import date_key, month_key, to_date
+
+
+@pytest.mark.parametrize("text", ["Feb 27 2024", "Mar 04 2024", "Dec 31 1999", "Jan 1 2024", "feb 29 24", "Jun 15 70"])
+def test_matches_strptime(text):
+    pattern = "%b %d %Y" if len(text.split()[2]) == 4 else "%b %d %y"
+    assert date_key(text) == datetime.strptime(text, pattern).toordinal()
+
+
+@pytest.mark.parametrize("text", ["", "2024-02-27", "Feb 30 2024", "Foo 01 2024", "Feb 27 202", "Feb 27"])
+def test_rejects_other_formats(text):
+    with pytest.raises(ValueError):
+        date_key(text)
+
+
+def test_keys_group_by_day_and_month():
+    key = date_key("Mar 04 2024")
+    assert to_date(key) == date(2024, 3, 4)
+    assert month_key(key) == month_key(date_key("Mar 29 2024")) != month_key(date_key("Feb 27 2024"))
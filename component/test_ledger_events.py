@@ -0,0 +1,74 @@
+from ledger_events import LedgerEvents, Repaint, ledger_events
+from ledger_writer import ledger_writer
+from repository import CsvLedger
+
+
+class FakeWidget:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append((delay, callback))
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, identifier):
+        self.scheduled.pop(int(identifier.split("#")[1]) - 1)
+
+
+def test_publish_reaches_subscribers_of_the_same_file(tmp_path):
+    events, seen = LedgerEvents(), []
+    unsubscribe = events.subscribe(tmp_path / "data.csv", seen.append)
+    events.publish(str(tmp_path / "." / "data.csv"), [["1", "Feb 27 2024", "tution", "3000"]])
+    events.publish(tmp_path / "other.csv", [["0", "Feb 27 2024", "food", "10"]])
+    assert seen == [[["1", "Feb 27 2024", "tution", "3000"]]]
+    unsubscribe()
+    events.publish(tmp_path / "data.csv", [])
+    assert len(seen) == 1
+
+
+def test_repaint_coalesces_a_burst_into_one_callback():
+    widget, calls = FakeWidget(), []
+    repaint = Repaint(widget, lambda: calls.append(1))
+    for _ in range(50):
+        repaint.request(["row"])
+    assert len(widget.scheduled) == 1
+    widget.scheduled[0][1]()
+    assert calls == [1]
+    repaint.request()
+    assert len(widget.scheduled) == 2
+
+
+def test_repaint_cancel():
+    widget = FakeWidget()
+    repaint = Repaint(widget, lambda: None)
+    repaint.request()
+    repaint.cancel()
+    assert widget.scheduled == [] and repaint.pending is None
+
+
+def test_csv_ledger_publishes_appended_rows(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("flag,Date,Source,Amount\n")
+    seen = []
+    unsubscribe = ledger_events.subscribe(path, seen.append)
+    try:
+        CsvLedger(path).append([0, "Feb 22 2024", "food", "550"])
+    finally:
+        unsubscribe()
+    assert seen == [[[0, "Feb 22 2024", "food", "550"]]]
+
+
+def test_csv_ledger_publishes_queued_rows_once_committed(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONEYMANAGER_DURABILITY", "none")
+    path = tmp_path / "data.csv"
+    path.write_text("flag,Date,Source,Amount\n")
+    seen = []
+    unsubscribe = ledger_events.subscribe(path, seen.append)
+    try:
+        CsvLedger(path).append([0, "Feb 22 2024", "food", "550"])
+        assert seen == []
+        ledger_writer(path).close()
+    finally:
+        unsubscribe()
+    assert seen == [[[0, "Feb 22 2024", "food", "550"]]]
+    assert CsvLedger(path).read()[0] == [["0", "Feb 22 2024", "food", "550"]]
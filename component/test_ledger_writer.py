@@ -0,0 +1,67 @@
+import csv
+import threading
+
+import pytest
+from ledger_writer import LedgerWriter
+
+
+def read(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("flag,Date,Source,Amount\n")
+    return path
+
+
+def test_flush_mode_writes_each_append(path):
+    writer = LedgerWriter(path, "flush")
+    writer.append([1, "Feb 27 2024", "tution", "3000"])
+    assert read(path)[1:] == [["1", "Feb 27 2024", "tution", "3000"]]
+    writer.close()
+
+
+def test_none_mode_commits_in_batches(path):
+    writer = LedgerWriter(path, "none", batch_rows=3, batch_seconds=60)
+    writer.extend([[0, "Feb 22 2024", "food", "550"]] * 2)
+    assert read(path)[1:] == []
+    writer.append([0, "Feb 23 2024", "food", "100"])
+    assert len(read(path)) == 4
+    writer.append([1, "Feb 24 2024", "salary", "9000"])
+    writer.close()
+    assert read(path)[-1] == ["1", "Feb 24 2024", "salary", "9000"]
+
+
+def test_on_commit_sees_each_batch_after_it_is_written(path):
+    batches = []
+    writer = LedgerWriter(path, "none", batch_rows=3, batch_seconds=60,
+                          on_commit=lambda rows: batches.append((rows, len(read(path)) - 1)))
+    writer.extend([[0, "Feb 22 2024", "food", "550"]] * 2)
+    assert batches == []
+    writer.close()
+    assert batches == [([[0, "Feb 22 2024", "food", "550"]] * 2, 2)]
+
+
+def test_concurrent_appends_keep_rows_whole(path):
+    writer = LedgerWriter(path, "fsync")
+
+    def submit(thread):
+        for i in range(50):
+            writer.append([thread % 2, "Mar 01 2024", f"source {thread}", str(i)])
+
+    threads = [threading.Thread(target=submit, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+    rows = read(path)[1:]
+    assert len(rows) == 400 and all(len(row) == 4 for row in rows)
+
+
+def test_unknown_durability_is_rejected(path):
+    with pytest.raises(ValueError):
+        LedgerWriter(path, "sometimes")
@@ -0,0 +1,50 @@
+import mmap
+
+import mmap_scan
+import pytest
+from mmap_scan import source_totals
+
+HEADER = "flag,Date,Source,Amount\n"
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(HEADER + "1,Feb 27 2024,tution,3000\n0,Feb 22 2024,food,550\n0,Mar 01 2024,food,450.5\n")
+    return path
+
+
+def test_sums_by_flag_and_source(ledger):
+    totals, end, bad = source_totals(ledger)
+    assert totals == {0: {"food": 100050}, 1: {"tution": 300000}}
+    assert end == ledger.stat().st_size and bad == 0
+
+
+def test_quoted_fields_and_crlf(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b'flag,Date,Source,Amount\r\n0,"Feb 22, 2024","food, drinks",550\r\n1,Feb 27 2024,tution,3000\r\n')
+    assert source_totals(path)[0] == {0: {"food, drinks": 55000}, 1: {"tution": 300000}}
+
+
+def test_scan_from_an_offset_skips_bad_rows_and_a_partial_line(ledger):
+    offset = ledger.stat().st_size
+    with open(ledger, "a") as file:
+        file.write("1,Mar 04 2024,scholarship,5000\n1,Mar 04 2024,scholarship,1e2\nx,Mar 05 2024,oops,1\n\n0,Mar 06 2024,food,abc\n0,Mar 07 2024,tour,7")
+    totals, end, bad = source_totals(ledger, offset)
+    assert totals == {0: {}, 1: {"scholarship": 510000}}
+    assert bad == 2 and end == ledger.read_bytes().rindex(b"\n") + 1
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"")
+    assert source_totals(path) == ({0: {}, 1: {}}, 0, 0)
+
+
+def test_rows_across_window_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(mmap_scan, "WINDOW", mmap.ALLOCATIONGRANULARITY)
+    path = tmp_path / "data.csv"
+    path.write_text(HEADER + "1,Feb 27 2024,tution,3000\n0,Feb 22 2024,food,550\n" * 2000)
+    totals, end, bad = source_totals(path)
+    assert totals == {0: {"food": 55000 * 2000}, 1: {"tution": 300000 * 2000}}
+    assert end == path.stat().st_size and bad == 0
@@ -0,0 +1,63 @@
+import csv
+
+import parallel_load
+import pytest
+from ledger_dates import date_key
+from parallel_load import LedgerSummary, byte_ranges, sorted_runs, summarize
+from repository import read_csv
+
+ROWS = [["1", "Mar 29 2024", "allowence", "2000"], ["0", "Feb 22 2024", "food", "550.5"],
+        ["0", "not a date", "food", "1"], ["1", "Jan 02 2024", "salary", "9000"],
+        ["0", "Feb 22 2024", "rent", "100"]]
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(parallel_load, "MIN_RANGE_BYTES", 64)
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["flag", "Date", "Source", "Amount"])
+        writer.writerows(ROWS * 20)
+    return path
+
+
+def test_ranges_split_on_line_boundaries(ledger):
+    ranges = byte_ranges(ledger, 8)
+    data = ledger.read_bytes()
+    assert len(ranges) > 1
+    assert ranges[0][0] == data.index(b"\n") + 1 and ranges[-1][1] == len(data)
+    assert all(data[end - 1:end] == b"\n" and end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+
+
+def test_ranges_leave_out_a_partial_last_line(ledger):
+    with open(ledger, "a") as file:
+        file.write("1,Apr 01 2024,bonus")
+    assert byte_ranges(ledger, 4)[-1][1] == ledger.read_bytes().rindex(b"\n") + 1
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_summary_matches_a_serial_read(ledger, processes):
+    summary, cursor = summarize(ledger, processes)
+    assert summary.sources == {0: {"food": 55150 * 20, "rent": 10000 * 20}, 1: {"allowence": 200000 * 20, "salary": 900000 * 20}}
+    assert summary.days[0] == {date_key("Feb 22 2024"): 65050 * 20}
+    assert (summary.first, summary.last) == (date_key("Jan 02 2024"), date_key("Mar 29 2024"))
+    assert summary.rows == 80 and len(summary.bad_rows) == 20
+    assert cursor == read_csv(ledger)[1]
+
+
+def test_summary_skips_unreadable_amounts_and_keeps_undated_rows_in_sources():
+    summary = LedgerSummary()
+    for row in (["0", "someday", "food", "1e2"], ["0", "Feb 22 2024", "food", "inf"], ["x", "Feb 22 2024", "food", "1"],
+                ["0", "Feb 22 2024"]):
+        summary.add(row)
+    assert summary.sources == {0: {"food": 10000}, 1: {}} and summary.days == {0: {}, 1: {}}
+    assert summary.rows == 0 and len(summary.bad_rows) == 4 and summary.first is None
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_sorted_runs_merge_in_date_order_keeping_file_order(ledger, processes):
+    merged, bad, cursor = sorted_runs(ledger, processes)
+    good = [row for row in ROWS * 20 if row[1] != "not a date"]
+    assert [row for _, row in merged] == sorted(good, key=lambda row: date_key(row[1]))
+    assert len(bad) == 20 and cursor == read_csv(ledger)[1]
@@ -0,0 +1,128 @@
+import csv
+import sqlite3
+import threading
+
+import pytest
+import repository
+from ledger_dates import date_key
+from repository import CsvLedger, SqliteLedger, CsvUsers, SqliteUsers, ledger_repository, user_repository
+
+ROWS = [["1", "Feb 27 2024", "tution", "3000"], ["0", "Feb 22 2024", "food", "550"],
+        ["0", "Mar 07 2024", "tour, 7no ghat", "700"]]
+USERS = [["Sina", "sina@example.com", "1234"], ["Rafi", "rafi@example.com", "abcd"]]
+
+
+def write(path, header, rows):
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([header] + rows)
+
+
+@pytest.fixture(params=["csv", "sqlite"])
+def ledger(request, tmp_path):
+    path = tmp_path / "data.csv"
+    write(path, ["flag", "Date", "Source", "Amount"], ROWS)
+    return CsvLedger(path) if request.param == "csv" else SqliteLedger(tmp_path / "money_manager.db", path)
+
+
+@pytest.fixture(params=["csv", "sqlite"])
+def users(request, tmp_path):
+    path = tmp_path / "user_rec.csv"
+    write(path, ["user_name", "email", "password"], USERS)
+    return CsvUsers(path) if request.param == "csv" else SqliteUsers(tmp_path / "money_manager.db", path)
+
+
+def test_read_returns_only_new_rows(ledger):
+    rows, cursor, reset = ledger.read()
+    assert rows == ROWS and reset
+    assert ledger.read(cursor)[0] == []
+    ledger.append(["1", "Mar 10 2024", "salary", "9000"])
+    rows, cursor, reset = ledger.read(cursor)
+    assert rows == [["1", "Mar 10 2024", "salary", "9000"]] and not reset
+
+
+def test_between_filters_dates_and_flag(ledger):
+    start, end = date_key("Feb 20 2024"), date_key("Feb 28 2024")
+    assert sorted(ledger.between(start, end)) == sorted(ROWS[:2])
+    assert ledger.between(start, end, flag=0) == [ROWS[1]]
+
+
+def test_users_find_and_add(users):
+    assert users.find("rafi@example.com") == USERS[1]
+    assert users.find("nobody@example.com") is None
+    users.add(["Nila", "nila@example.com", "pass"])
+    assert users.find("nila@example.com") == ["Nila", "nila@example.com", "pass"]
+
+
+def test_users_are_found_while_others_are_added(users):
+    added = [[f"user {n}", f"user{n}@example.com", "pass"] for n in range(200)]
+    misses = []
+
+    def look_up():
+        for user in added:
+            found = users.find(user[1])
+            if found not in (None, user):
+                misses.append(found)
+    readers = [threading.Thread(target=look_up) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    for user in added:
+        users.add(user)
+    for reader in readers:
+        reader.join()
+    assert misses == [] and all(users.find(user[1]) == user for user in added)
+
+
+def test_sqlite_rows_are_fetched_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(repository, "FETCH_ROWS", 2)
+    path = tmp_path / "data.csv"
+    write(path, ["flag", "Date", "Source", "Amount"], ROWS)
+    ledger = SqliteLedger(tmp_path / "money_manager.db", path)
+    rows = ledger.rows()
+    assert next(rows) == ROWS[0]
+    writer = threading.Thread(target=ledger.append, args=(["1", "Mar 10 2024", "salary", "9000"],))
+    writer.start()
+    writer.join(5)  # the lock is free between batches
+    assert not writer.is_alive()
+    assert [ROWS[0]] + list(rows)[:2] == ROWS
+
+
+def test_csv_rewrite_resets_cursor(tmp_path):
+    path = tmp_path / "data.csv"
+    write(path, ["flag", "Date", "Source", "Amount"], ROWS)
+    ledger = CsvLedger(path)
+    _, cursor, _ = ledger.read()
+    write(path, ["flag", "Date", "Source", "Amount"], [["0", "Jan 01 2024", "rent", "5000"]] + ROWS[1:])
+    rows, _, reset = ledger.read(cursor)
+    assert reset and rows[0] == ["0", "Jan 01 2024", "rent", "5000"]
+
+
+def test_sqlite_email_is_unique(tmp_path):
+    path = tmp_path / "user_rec.csv"
+    write(path, ["user_name", "email", "password"], USERS)
+    users = SqliteUsers(tmp_path / "money_manager.db", path)
+    with pytest.raises(sqlite3.IntegrityError):
+        users.add(["Other", "sina@example.com", "x"])
+
+
+def test_backend_is_chosen_from_environment(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    write(path, ["flag", "Date", "Source", "Amount"], ROWS)
+    write(tmp_path / "user_rec.csv", ["user_name", "email", "password"], USERS)
+    assert isinstance(ledger_repository(path), CsvLedger)
+    monkeypatch.setenv("MONEYMANAGER_BACKEND", "sqlite")
+    assert isinstance(ledger_repository(path), SqliteLedger)
+    assert user_repository(tmp_path / "user_rec.csv").find("sina@example.com") == USERS[0]
+    assert (tmp_path / "money_manager.db").exists()
+
+
+def test_user_index_follows_the_file(tmp_path):
+    path = tmp_path / "user_rec.csv"
+    write(path, ["user_name", "email", "password"], USERS)
+    users = CsvUsers(path)
+    assert users.find("sina@example.com") == USERS[0]
+    with open(path, "a", newline="") as file:
+        csv.writer(file).writerow(["Nila", "nila@example.com", "pass"])
+    assert users.find("nila@example.com") == ["Nila", "nila@example.com", "pass"]
+    write(path, ["user_name", "email", "password"], USERS[1:])
+    assert users.find("sina@example.com") is None
+    assert users.find("rafi@example.com") == USERS[1]
@@ -0,0 +1,83 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import assets
+import background
+import pytest
+import router
+import startup
+from router import ScreenRouter, load_screen
+
+
+def test_screens_get_their_own_sibling_modules():
+    path, modules = list(sys.path), set(sys.modules)
+    income = load_screen("income", "Navigation")
+    expense = load_screen("expense", "Navigation")
+    assert income is not expense
+    assert income.__file__.endswith("income/Navigation.py") and expense.__file__.endswith("expense/Navigation.py")
+    assert income.Feedback is not expense.Feedback  # FeedBack is a sibling of each
+    # no sibling (Navigation, FeedBack ...) stays behind, whatever earlier tests imported
+    screen_dirs = {router.COMPONENT_PATH / "income", router.COMPONENT_PATH / "expense"}
+    assert not [name for name in set(sys.modules) - modules
+                if Path(getattr(sys.modules[name], "__file__", None) or "").parent in screen_dirs]
+    # the screen directories are taken off again; only the appends the modules make themselves remain
+    assert sys.path[:len(path)] == path
+    assert not [entry for entry in sys.path[len(path):] if Path(entry) in screen_dirs]
+
+
+def test_modules_loaded_before_are_restored(monkeypatch):
+    sentinel = object()
+    monkeypatch.setitem(sys.modules, "Navigation", sentinel)
+    load_screen("income", "Navigation")
+    assert sys.modules["Navigation"] is sentinel
+
+
+def test_failed_import_still_restores(monkeypatch):
+    path = list(sys.path)
+    with pytest.raises(ImportError):
+        load_screen("income", "no_such_module")
+    assert sys.path == path and "Navigation" not in sys.modules
+
+
+class FakeScreen:
+    def __init__(self):
+        self.calls = []
+
+    def refresh(self):
+        self.calls.append("refresh")
+
+    def leave(self):
+        self.calls.append("leave")
+
+
+def test_show_refreshes_revisited_screens_and_tells_the_left_one():
+    window = SimpleNamespace()
+    router = ScreenRouter(window, screens={})
+    frame = SimpleNamespace(tkraise=lambda: None)
+    first, second = FakeScreen(), FakeScreen()
+    router.screens = {"first": (frame, first), "second": (frame, second)}
+    assert window.router is router
+    router.show("first")
+    router.show("second")
+    router.show("second")
+    assert first.calls == ["refresh", "leave"]
+    assert second.calls == ["refresh", "refresh"] and router.current == "second"
+
+
+def test_profiled_run_paints_without_preloading(tmp_path, monkeypatch):
+    calls = []
+    window = SimpleNamespace(update_idletasks=lambda: calls.append("update_idletasks"),
+                             update=lambda: calls.append("update"), destroy=lambda: calls.append("destroy"),
+                             after=lambda delay: None)
+    loads = iter([True, True, False])
+    monkeypatch.setattr(router, "create_window", lambda: window)
+    monkeypatch.setattr(ScreenRouter, "show", lambda self, name: calls.append(name))
+    monkeypatch.setattr(startup, "_profile", None)
+    monkeypatch.setattr(assets, "PRELOAD", True)
+    monkeypatch.setattr(background, "busy", lambda: next(loads))
+    router.run("login", [f"--profile={tmp_path / 'report.json'}", "--profile-exit"])
+    assert calls == ["login", "update_idletasks", "update", "update", "destroy"] and assets.PRELOAD is False
+    phases = [phase["name"] for phase in json.loads((tmp_path / "report.json").read_text())["phases"]]
+    assert phases == ["window", "first paint", "background loads"]
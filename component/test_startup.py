@@ -0,0 +1,52 @@
+import json
+import threading
+
+import pytest
+import startup
+from startup import configure, phase, record
+
+
+@pytest.fixture(autouse=True)
+def no_profile(monkeypatch):
+    monkeypatch.setattr(startup, "_profile", None)
+    monkeypatch.delenv(startup.PROFILE_ENV, raising=False)
+    monkeypatch.delenv(startup.PROFILE_EXIT_ENV, raising=False)
+
+
+def test_off_unless_asked():
+    assert configure(["dashboard"]) is None
+    with phase("window"):
+        pass
+    record("csv parse", 1.0)
+    assert startup.active() is None
+
+
+def test_flag_and_environment(tmp_path, monkeypatch):
+    assert configure(["--profile"]).path == startup.DEFAULT_REPORT
+    profile = configure([f"--profile={tmp_path / 'a.json'}", "--profile-exit"])
+    assert (profile.path, profile.exit_after) == (str(tmp_path / "a.json"), True)
+    monkeypatch.setenv(startup.PROFILE_ENV, str(tmp_path / "b.json"))
+    assert configure([]).path == str(tmp_path / "b.json") and not startup.active().exit_after
+
+
+def test_phases_add_up_into_the_report(tmp_path):
+    profile = configure([f"--profile={tmp_path / 'report.json'}"])
+    for _ in range(2):
+        with phase("import dashboard"):
+            pass
+    record("csv parse", 0.25)
+    profile.write("dashboard")
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["screen"] == "dashboard"
+    assert [(item["name"], item["count"]) for item in report["phases"]] == [("import dashboard", 2), ("csv parse", 1)]
+    assert report["phases"][1]["ms"] == 250.0
+
+
+def test_records_from_worker_threads_are_all_counted(tmp_path):
+    configure([f"--profile={tmp_path / 'report.json'}"])
+    workers = [threading.Thread(target=lambda: [record("csv parse", 0.001) for _ in range(2000)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert startup.active().report("dashboard")["phases"] == [{"name": "csv parse", "ms": 8000.0, "count": 8000}]
@@ -0,0 +1,79 @@
+import csv
+
+import pytest
+from repository import CsvLedger
+from statement_import import import_statement, Mapping, main
+
+LEDGER = [["1", "Feb 27 2024", "tution", "3000"], ["0", "Feb 22 2024", "food", "550"]]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([["flag", "Date", "Source", "Amount"]] + LEDGER)
+    return path
+
+
+def stored(path):
+    return list(CsvLedger(path).rows())
+
+
+def write_statement(path, rows):
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([["Date", "Description", "Amount"]] + rows)
+    return path
+
+
+def test_signed_amounts_become_flags_and_dates_are_normalised(tmp_path, ledger):
+    statement = write_statement(tmp_path / "bank.csv", [["2024-03-01", "salary", "9,000.00"],
+                                                        ["2024-03-02", "rent", "-5000"]])
+    result = import_statement(statement, ledger)
+    assert (result.read, result.imported, result.rejected) == (2, 2, 0)
+    assert stored(ledger)[2:] == [["1", "Mar 01 2024", "salary", "9000"], ["0", "Mar 02 2024", "rent", "5000"]]
+
+
+def test_rows_failing_the_screen_rules_are_rejected(tmp_path, ledger):
+    statement = write_statement(tmp_path / "bank.csv", [["2024-03-01", "", "100"], ["2024-03-01", "cafe", "3.50"],
+                                                        ["yesterday", "cafe", "4"], ["01/03/2024", "cafe", "4"]])
+    result = import_statement(statement, ledger)
+    assert (result.imported, result.rejected) == (1, 3)
+    assert [line for line, _ in result.errors] == [1, 2, 3]
+
+
+def test_reimport_adds_nothing_but_repeats_in_a_statement_are_kept(tmp_path, ledger):
+    statement = write_statement(tmp_path / "bank.csv", [["2024-02-22", "food", "-550"], ["2024-03-05", "cafe", "-4"],
+                                                        ["2024-03-05", "cafe", "-4"]])
+    first = import_statement(statement, ledger, chunk_rows=2)
+    assert (first.imported, first.duplicates) == (2, 1)
+    second = import_statement(statement, ledger, chunk_rows=2)
+    assert (second.imported, second.duplicates) == (0, 3)
+    assert len(stored(ledger)) == 4
+
+
+def test_type_column_and_explicit_mapping(tmp_path, ledger):
+    statement = tmp_path / "export.csv"
+    with open(statement, "w", newline="") as file:
+        csv.writer(file).writerows([["When", "What", "Value", "Kind"], ["05/03/2024", "bonus", "700", "Credit"],
+                                    ["06/03/2024", "bus", "20", "DEBIT"]])
+    result = import_statement(statement, ledger, Mapping("When", "What", "Value", "Kind", date_format="%d/%m/%Y"))
+    assert result.imported == 2
+    assert stored(ledger)[2:] == [["1", "Mar 05 2024", "bonus", "700"], ["0", "Mar 06 2024", "bus", "20"]]
+
+
+def test_ofx_transactions(tmp_path, ledger):
+    statement = tmp_path / "bank.ofx"
+    statement.write_text("OFXHEADER:100\n<OFX><BANKTRANLIST>\n"
+                         "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240307120000[-5:EST]<TRNAMT>-700.00"
+                         "<FITID>1<NAME>tour</STMTTRN>\n"
+                         "<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20240308\n<TRNAMT>1200\n<MEMO>refund\n</STMTTRN>\n"
+                         "</BANKTRANLIST></OFX>\n")
+    assert import_statement(statement, ledger).imported == 2
+    assert stored(ledger)[2:] == [["0", "Mar 07 2024", "tour", "700"], ["1", "Mar 08 2024", "refund", "1200"]]
+
+
+def test_command_line_flag(tmp_path, ledger, capsys):
+    statement = write_statement(tmp_path / "bank.csv", [["2024-03-01", "groceries", "80"]])
+    assert main([str(statement), "--ledger", str(ledger), "--flag", "0"]) == 0
+    assert "1 imported" in capsys.readouterr().out
+    assert stored(ledger)[-1] == ["0", "Mar 01 2024", "groceries", "80"]
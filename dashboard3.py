@@ -1,15 +1,518 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import csv
-from datetime import datetime
+import gzip
+import io
+import json
+import os
+import queue
+import sys
+import threading
+from array import array
+from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent / "component"))
+from ledger_writer import LedgerWriter
+
+DATA_PATH = Path(__file__).parent / Path("data_store/dashboard3")
+SNAPSHOT_EVERY = 10_000  # journal records between snapshots
+SNAPSHOT_VERSION = 1
+
+EXPORT_HEADER = ["Date", "Type", "Category", "Amount"]
+EXPORT_FILETYPES = (("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz"), ("JSON Lines", "*.jsonl"),
+                    ("All files", "*.*"))
+PAGE_SIZE = 100  # transactions held in the history Listbox at a time
+PROGRESS_EVERY = 10_000  # rows between progress reports from the export thread
+POLL_MS = 100
+TYPES = ("Expense", "Income")  # type codes 0 and 1, as the ledger's flag column
+DELETED = -1
+
+
+def to_minor(text):
+    """Cents in an amount string, raising ValueError for anything that isn't a finite number."""
+    try:
+        return int((Decimal(text.strip()) * 100).to_integral_value())
+    except (InvalidOperation, OverflowError):
+        raise ValueError(f"not an amount: {text!r}")
+
+
+def from_minor(minor):
+    return Decimal(minor).scaleb(-2)
+
+
+class TransactionStore:
+    """Transactions as parallel typed arrays instead of a list of tuples.
+
+    A transaction costs 13 bytes: type code (1), interned date id (4), interned category id (4) and
+    amount in cents (4 or 8 - the array widens itself past 2**31). Amounts stay exact integers, so
+    sums don't pick up float rounding. Ids are positions in the arrays and never change; deleting
+    marks the type code DELETED, so delete and lookup are O(1) and ids stay valid for the lifetime
+    of the store. Iteration yields (date, type, category, amount) with a Decimal amount.
+
+    Totals per type and per (type, category) are adjusted on every append and delete, so the
+    balance and the summary never walk the history.
+    """
+
+    def __init__(self):
+        self.type = array("b")
+        self.date = array("i")
+        self.category = array("i")
+        self.amount = array("i")
+        self.strings = []  # interned dates and categories, shared id space
+        self.string_ids = {}
+        self.live = 0
+        self.totals = [0, 0]  # cents per type code
+        self.category_totals = {}  # (type code, category id) -> cents
+
+    COLUMNS = {"type": ("b",), "date": ("i",), "category": ("i",), "amount": ("i", "q")}  # name -> typecodes read back
+
+    def save(self, file, **meta):
+        """Write the store as one line of JSON followed by its arrays, little-endian.
+
+        The JSON holds SNAPSHOT_VERSION, ``meta``, the interned strings, the running totals and the
+        typecode and length of each array; deleted transactions are the DELETED codes in ``type``.
+        """
+        header = dict(meta, version=SNAPSHOT_VERSION, strings=self.strings, live=self.live, totals=self.totals,
+                      category_totals=[[code, category_id, total]
+                                       for (code, category_id), total in self.category_totals.items()],
+                      columns={name: [getattr(self, name).typecode, len(getattr(self, name))] for name in self.COLUMNS})
+        file.write(json.dumps(header).encode() + b"\n")
+        for name in self.COLUMNS:
+            values = getattr(self, name)
+            if sys.byteorder == "big":
+                values = array(values.typecode, values)
+                values.byteswap()
+            values.tofile(file)
+
+    @classmethod
+    def load(cls, file):
+        """(store, header) read from a file written by ``save``; ValueError if it isn't one this version reads."""
+        header = json.loads(file.readline())
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {header.get('version')!r}, expected {SNAPSHOT_VERSION}")
+        store = cls()
+        for name, typecodes in cls.COLUMNS.items():
+            typecode, length = header["columns"][name]
+            if typecode not in typecodes or length != header["columns"]["type"][1]:
+                raise ValueError(f"snapshot column {name} is {typecode} x {length}")
+            values = array(typecode)
+            values.fromfile(file, length)  # EOFError when the file is cut short
+            if sys.byteorder == "big":
+                values.byteswap()
+            setattr(store, name, values)
+        store.strings = list(header["strings"])
+        store.string_ids = {text: string_id for string_id, text in enumerate(store.strings)}
+        store.live, store.totals = header["live"], list(header["totals"])
+        store.category_totals = {(code, category_id): total for code, category_id, total in header["category_totals"]}
+        return store, header
+
+    def intern(self, text):
+        string_id = self.string_ids.get(text)
+        if string_id is None:
+            string_id = self.string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def append(self, day, transaction_type, category, minor):
+        """Store a transaction and return its id."""
+        if not -2 ** 31 <= minor < 2 ** 31 and self.amount.typecode == "i":
+            self.amount = array("q", self.amount)
+        type_code, category_id = TYPES.index(transaction_type), self.intern(category)
+        self.type.append(type_code)
+        self.date.append(self.intern(day))
+        self.category.append(category_id)
+        self.amount.append(minor)
+        self.live += 1
+        self.count(type_code, category_id, minor)
+        return len(self.type) - 1
+
+    def delete(self, transaction_id):
+        """Remove a transaction and return it, raising KeyError if there is no such id."""
+        transaction = self[transaction_id]
+        self.count(self.type[transaction_id], self.category[transaction_id], -self.amount[transaction_id])
+        self.type[transaction_id] = DELETED
+        self.live -= 1
+        return transaction
+
+    def count(self, type_code, category_id, minor):
+        self.totals[type_code] += minor
+        key = type_code, category_id
+        total = self.category_totals.get(key, 0) + minor
+        if total:
+            self.category_totals[key] = total
+        else:
+            self.category_totals.pop(key, None)
+
+    def total(self, transaction_type):
+        return self.totals[TYPES.index(transaction_type)]
+
+    def balance(self):
+        """Income minus expense, in cents."""
+        return self.totals[1] - self.totals[0]
+
+    def by_category(self, transaction_type):
+        """{category: cents} for one type."""
+        type_code = TYPES.index(transaction_type)
+        return {self.strings[category_id]: total
+                for (code, category_id), total in self.category_totals.items() if code == type_code}
+
+    def __getitem__(self, transaction_id):
+        if not 0 <= transaction_id < len(self.type) or self.type[transaction_id] == DELETED:
+            raise KeyError(transaction_id)
+        return (self.strings[self.date[transaction_id]], TYPES[self.type[transaction_id]],
+                self.strings[self.category[transaction_id]], from_minor(self.amount[transaction_id]))
+
+    def minor(self, transaction_id):
+        return self.amount[transaction_id]
+
+    def __len__(self):
+        return self.live
+
+    def ids(self):
+        """Live ids in insertion order, up to the last one stored when iteration started.
+
+        Reads one element at a time, so an export thread can walk the store while the Tk
+        thread keeps appending and deleting.
+        """
+        for transaction_id in range(len(self.type)):
+            if self.type[transaction_id] != DELETED:
+                yield transaction_id
+
+    def __iter__(self):
+        for transaction_id in self.ids():
+            try:
+                yield self[transaction_id]
+            except KeyError:  # deleted since ids() looked
+                continue
+
+
+class TransactionJournal:
+    """Keeps a TransactionStore on disk as a snapshot plus an append-only journal.
+
+    Every append and delete is written to journal.<generation>.csv as it happens, through a
+    LedgerWriter, so MONEYMANAGER_DURABILITY decides how much a crash can lose (nothing but the
+    last unwritten batch). Every SNAPSHOT_EVERY records, and on close, the whole store is saved
+    to snapshot.<generation>.bin (see ``TransactionStore.save``), and the records that follow go
+    to a fresh journal.<generation>.csv. The snapshot is written to a temporary file and read back
+    before it is renamed into place. The previous snapshot and journal are kept until then, and
+    one generation longer, so a damaged newest snapshot can still be rebuilt from the one before
+    it. Loading reads the newest readable snapshot and replays the journals from its generation
+    on, so startup cost is bounded by the snapshot size plus a couple of SNAPSHOT_EVERY records.
+    A journal line cut off by a crash is dropped.
+
+    A snapshot that can't be read (damaged, or written by another version) is moved aside to
+    snapshot.<generation>.unreadable. Generation 0 starts from an empty store, so its journal
+    needs no snapshot. When no base is left at all, the journals are replayed without their
+    deletes: ids are positions in the lost snapshot, so a delete would remove the wrong row.
+    """
+
+    def __init__(self, directory=DATA_PATH, snapshot_every=SNAPSHOT_EVERY):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self.generation = 0
+        self.store = TransactionStore()
+        base = self.load_snapshot()
+        journals = self.generations("journal.*.csv")
+        self.pending = sum(self.replay(generation, deletes=base is not None)
+                           for generation in journals if generation >= (base or 0))
+        self.generation = max(journals + [base or 0])
+        self.writer = LedgerWriter(self.journal_path())
+
+    def generations(self, pattern):
+        """The generation numbers of the files matching ``pattern``, oldest first."""
+        return sorted(int(path.name.split(".")[1]) for path in self.directory.glob(pattern)
+                      if path.name.split(".")[1].isdigit())
+
+    def load_snapshot(self):
+        """Load the newest readable snapshot; returns its generation, 0 for the empty store, or None."""
+        for generation in reversed(self.generations("snapshot.*.bin")):
+            path = self.snapshot_path(generation)
+            try:
+                with open(path, "rb") as file:
+                    self.store, header = TransactionStore.load(file)
+                if int(header["generation"]) == generation:
+                    return generation
+            except (OSError, EOFError, ValueError, KeyError, TypeError):
+                pass
+            self.store = TransactionStore()
+            os.replace(path, path.with_suffix(".unreadable"))
+        journals = self.generations("journal.*.csv")
+        return 0 if not journals or journals[0] == 0 else None
+
+    def snapshot_path(self, generation):
+        return self.directory / f"snapshot.{generation}.bin"
+
+    def journal_path(self, generation=None):
+        return self.directory / f"journal.{self.generation if generation is None else generation}.csv"
+
+    def replay(self, generation, deletes=True):
+        path = self.journal_path(generation)
+        if not path.exists():
+            return 0
+        data = path.read_bytes()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            os.truncate(path, end)  # a torn last record; the next one must start on a fresh line
+        count = 0
+        for record in csv.reader(io.StringIO(data[:end].decode())):
+            if record[0] == "A":
+                self.store.append(record[1], record[2], record[3], int(record[4]))
+            elif record[0] == "D" and deletes:
+                try:
+                    self.store.delete(int(record[1]))
+                except KeyError:
+                    pass
+            count += 1
+        return count
+
+    def remove_old(self, keep):
+        """Remove the snapshots and journals older than generation ``keep``."""
+        for name in ("snapshot.{}.bin", "journal.{}.csv"):
+            for generation in self.generations(name.format("*")):
+                if generation < keep:
+                    (self.directory / name.format(generation)).unlink()
+
+    def verify(self, path, generation):
+        """Whether the snapshot at ``path`` reads back as the current store."""
+        try:
+            with open(path, "rb") as file:
+                store, header = TransactionStore.load(file)
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            return False
+        return header.get("generation") == generation and store.type == self.store.type and \
+            store.amount == self.store.amount and (store.live, store.totals) == (self.store.live, self.store.totals)
+
+    def append(self, day, transaction_type, category, minor):
+        transaction_id = self.store.append(day, transaction_type, category, minor)
+        self.record(["A", day, transaction_type, category, minor])
+        return transaction_id
+
+    def delete(self, transaction_id):
+        transaction = self.store.delete(transaction_id)
+        self.record(["D", transaction_id])
+        return transaction
+
+    def record(self, row):
+        self.writer.append(row)
+        self.pending += 1
+        if self.pending >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        self.writer.close()
+        generation = self.generation + 1
+        temporary = self.snapshot_path(generation).with_suffix(".tmp")
+        with open(temporary, "wb") as file:
+            self.store.save(file, generation=generation)
+            file.flush()
+            os.fsync(file.fileno())
+        self.pending = 0
+        if not self.verify(temporary, generation):
+            # keep journaling onto the last good snapshot and try again after SNAPSHOT_EVERY records
+            temporary.unlink()
+            self.writer = LedgerWriter(self.journal_path())
+            return
+        os.replace(temporary, self.snapshot_path(generation))
+        self.journal_path(generation).touch()
+        self.generation = generation
+        self.writer = LedgerWriter(self.journal_path())
+        self.remove_old(generation - 1)
+
+    def close(self):
+        self.snapshot()
+        self.writer.close()
+
+
+class PagedHistory:
+    """The transaction history as a window of at most ``page_size`` rows of a Listbox.
+
+    Only rows in the window are formatted and handed to Tk. While the newest rows are shown, an
+    add inserts one row (dropping the oldest when the window is full) and a delete removes one
+    row and pulls in its neighbour, so each action is a couple of Tk calls however long the
+    history is. ``ids`` holds the transaction id of every history row in order; a deleted row
+    is overwritten with DELETED, like in the store, and the array is compacted once most of it
+    is tombstones, so a delete is O(1) amortized. ``shown`` holds the positions in ``ids`` of
+    the Listbox rows and ``before`` counts the live rows ahead of them.
+    """
+
+    def __init__(self, listbox, store, page_size=PAGE_SIZE):
+        self.listbox = listbox
+        self.store = store
+        self.page_size = page_size
+        self.ids = array("q", store.ids())
+        self.live = len(self.ids)
+        self.shown = []
+        self.before = self.live
+        self.show(self.live)
+
+    def format(self, position):
+        date, transaction_type, category, amount = self.store[self.ids[position]]
+        return f"{date}: {transaction_type} - {category} - ${amount:.2f}"
+
+    def live_after(self, position, count):
+        """Up to ``count`` positions of live rows from ``position`` on."""
+        positions = []
+        while position < len(self.ids) and len(positions) < count:
+            if self.ids[position] != DELETED:
+                positions.append(position)
+            position += 1
+        return positions
+
+    def live_before(self, position, count):
+        """Up to ``count`` positions of live rows before ``position``, in order."""
+        positions = []
+        while position > 0 and len(positions) < count:
+            position -= 1
+            if self.ids[position] != DELETED:
+                positions.append(position)
+        return positions[::-1]
+
+    def show(self, rank):
+        """Show the page starting at the ``rank``-th live row, walking there from the current page."""
+        rank = max(0, min(rank, self.live - self.page_size))
+        position = self.shown[0] if self.shown else len(self.ids)
+        while self.before > rank:
+            position -= 1
+            if self.ids[position] != DELETED:
+                self.before -= 1
+        while self.before < rank:
+            if self.ids[position] != DELETED:
+                self.before += 1
+            position += 1
+        self.shown = self.live_after(position, self.page_size)
+        self.listbox.delete(0, tk.END)
+        for position in self.shown:
+            self.listbox.insert(tk.END, self.format(position))
+
+    def older(self):
+        self.show(self.before - self.page_size)
+
+    def newer(self):
+        self.show(self.before + self.page_size)
+
+    def added(self, transaction_id):
+        showing_newest = self.before + len(self.shown) == self.live
+        self.ids.append(transaction_id)
+        self.live += 1
+        if showing_newest:
+            self.shown.append(len(self.ids) - 1)
+            self.listbox.insert(tk.END, self.format(len(self.ids) - 1))
+            if len(self.shown) > self.page_size:
+                del self.shown[0]
+                self.listbox.delete(0)
+                self.before += 1
+
+    def id_at(self, row):
+        return self.ids[self.shown[row]]
+
+    def deleted(self, row):
+        """Drop Listbox row ``row``, whose transaction has been deleted from the store."""
+        position = self.shown.pop(row)
+        self.ids[position] = DELETED
+        self.live -= 1
+        self.listbox.delete(row)
+        following = self.live_after(max(self.shown[-1:] + [position]) + 1, 1)
+        if following:
+            self.shown += following
+            self.listbox.insert(tk.END, self.format(following[0]))
+        elif self.before > 0:
+            self.shown[:0] = self.live_before(self.shown[0] if self.shown else position, 1)
+            self.before -= 1
+            self.listbox.insert(0, self.format(self.shown[0]))
+        if len(self.ids) > 2 * self.live + self.page_size:
+            self.compact()
+
+    def compact(self):
+        """Drop the tombstones from ``ids``; the shown rows are live and consecutive, so they move to ``before`` on."""
+        self.ids = array("q", (transaction_id for transaction_id in self.ids if transaction_id != DELETED))
+        self.shown = list(range(self.before, self.before + len(self.shown)))
+
+    def position(self):
+        if not self.live:
+            return "No transactions"
+        return f"{self.before + 1:,}-{self.before + len(self.shown):,} of {self.live:,}"
+
+
+def parse_day(text):
+    """The date of an ISO "YYYY-MM-DD" string, or None for anything else."""
+    try:
+        return date.fromisoformat(text.strip())
+    except ValueError:
+        return None
+
+
+def filter_transactions(transactions, start=None, end=None, types=None):
+    """Yield the transactions dated within [start, end] and of one of ``types``; None means no limit.
+
+    Transactions whose date can't be read are only kept when there is no date limit.
+    """
+    for transaction in transactions:
+        day, transaction_type = transaction[0], transaction[1]
+        if types is not None and transaction_type not in types:
+            continue
+        if start is not None or end is not None:
+            day = parse_day(day)
+            if day is None or (start is not None and day < start) or (end is not None and day > end):
+                continue
+        yield transaction
+
+
+def export_format(filename):
+    name = filename.lower()
+    if name.endswith(".gz"):
+        return "csv.gz"
+    if name.endswith((".jsonl", ".json", ".ndjson")):
+        return "jsonl"
+    return "csv"
+
+
+def write_export(filename, transactions, progress=None, cancelled=None):
+    """Stream ``transactions`` to ``filename`` as CSV, gzip-compressed CSV or JSON Lines.
+
+    ``progress(count)`` is called every PROGRESS_EVERY rows; the export stops early once
+    ``cancelled()`` is true. Returns the number of rows written.
+    """
+    fmt = export_format(filename)
+    opener = gzip.open if fmt == "csv.gz" else open
+    count = 0
+    with opener(filename, "wt", newline="", encoding="utf-8") as file:
+        if fmt == "jsonl":
+            write = lambda row: file.write(json.dumps(dict(zip(EXPORT_HEADER, row)), default=float) + "\n")
+        else:
+            writer = csv.writer(file)
+            writer.writerow(EXPORT_HEADER)
+            write = writer.writerow
+        for row in transactions:
+            write(row)
+            count += 1
+            if count % PROGRESS_EVERY == 0:
+                if progress is not None:
+                    progress(count)
+                if cancelled is not None and cancelled():
+                    break
+    return count
+
+
+def export_or_discard(filename, transactions, progress=None, cancelled=None):
+    """``write_export``, except that a cancelled export removes its partial file and returns None."""
+    count = write_export(filename, transactions, progress, cancelled)
+    if cancelled is not None and cancelled():
+        Path(filename).unlink(missing_ok=True)
+        return None
+    return count
+
 
 class MoneyManagerApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Money Manager")
         
-        self.balance = 0.00
-        self.transactions = []
+        self.journal = TransactionJournal()
+        self.transactions = self.journal.store
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
         # Background color
         background_color = "#003300"  # Mix of blue, black, and green
@@ -42,7 +545,15 @@ class MoneyManagerApp(tk.Tk):
         self.button_expense.pack(pady=5)
 
         self.listbox_transactions = tk.Listbox(self, height=10, width=50, bg="blue", fg="white")
-        self.listbox_transactions.pack(pady=10)
+        self.listbox_transactions.pack(pady=(10, 0))
+        self.history = PagedHistory(self.listbox_transactions, self.transactions)
+
+        self.frame_pages = tk.Frame(self, bg=background_color)
+        self.frame_pages.pack(pady=(0, 10))
+        tk.Button(self.frame_pages, text="< Older", command=lambda: self.page(self.history.older)).pack(side=tk.LEFT)
+        self.label_page = tk.Label(self.frame_pages, text=self.history.position(), bg=background_color, fg="white")
+        self.label_page.pack(side=tk.LEFT, padx=10)
+        tk.Button(self.frame_pages, text="Newer >", command=lambda: self.page(self.history.newer)).pack(side=tk.LEFT)
 
         self.button_delete = tk.Button(self, text="Delete Transaction", command=self.delete_transaction, bg="magenta", fg="white")
         self.button_delete.pack()
@@ -53,6 +564,16 @@ class MoneyManagerApp(tk.Tk):
         self.button_export = tk.Button(self, text="Export Transactions", command=self.export_transactions, bg="magenta", fg="white")
         self.button_export.pack()
 
+        self.button_cancel_export = tk.Button(self, text="Cancel Export", command=self.cancel_export,
+                                              bg="magenta", fg="white", state=tk.DISABLED)
+        self.button_cancel_export.pack()
+
+        self.label_export = tk.Label(self, text="", bg=background_color, fg="white")
+        self.label_export.pack()
+        self.export_thread = None
+        self.export_progress = None
+        self.export_cancelled = threading.Event()
+
         self.update_balance()
 
     def add_income(self):
@@ -63,18 +584,17 @@ class MoneyManagerApp(tk.Tk):
 
     def process_transaction(self, transaction_type):
         try:
-            amount = float(self.entry_amount.get())
+            amount = to_minor(self.entry_amount.get())
             category = self.entry_category.get()
             date = self.entry_date.get() if self.entry_date.get() else datetime.now().strftime("%Y-%m-%d")
             if amount > 0:
-                if transaction_type == "Expense" and amount > self.balance:
+                if transaction_type == "Expense" and amount > self.transactions.balance():
                     messagebox.showerror("Error", "Insufficient balance.")
                 else:
-                    self.balance += amount if transaction_type == "Income" else -amount
-                    self.transactions.append((date, transaction_type, category, amount))
+                    self.history.added(self.journal.append(date, transaction_type, category, amount))
                     self.update_balance()
                     self.update_transaction_history()
-                    messagebox.showinfo("Success", f"{transaction_type} of ${amount:.2f} added successfully.")
+                    messagebox.showinfo("Success", f"{transaction_type} of ${from_minor(amount):.2f} added successfully.")
             else:
                 messagebox.showerror("Error", "Amount must be greater than zero.")
         except ValueError:
@@ -83,40 +603,139 @@ class MoneyManagerApp(tk.Tk):
     def delete_transaction(self):
         selected_index = self.listbox_transactions.curselection()
         if selected_index:
-            idx = selected_index[0]
-            date, transaction_type, category, amount = self.transactions.pop(idx)
-            if transaction_type == "Income":
-                self.balance -= amount
-            else:
-                self.balance += amount
+            row = selected_index[0]
+            self.journal.delete(self.history.id_at(row))
+            self.history.deleted(row)
             self.update_balance()
             self.update_transaction_history()
 
     def view_summary(self):
-        total_income = sum(amount for date, t_type, cat, amount in self.transactions if t_type == "Income")
-        total_expenses = sum(amount for date, t_type, cat, amount in self.transactions if t_type == "Expense")
+        total_income = from_minor(self.transactions.total("Income"))
+        total_expenses = from_minor(self.transactions.total("Expense"))
         total_profit_loss = total_income - total_expenses
-        messagebox.showinfo("Summary", f"Total Income: ${total_income:.2f}\nTotal Expenses: ${total_expenses:.2f}\nProfit/Loss: ${total_profit_loss:.2f}")
+        lines = [f"Total Income: ${total_income:.2f}", f"Total Expenses: ${total_expenses:.2f}",
+                 f"Profit/Loss: ${total_profit_loss:.2f}"]
+        for transaction_type in ("Income", "Expense"):
+            categories = sorted(self.transactions.by_category(transaction_type).items(), key=lambda item: -item[1])
+            if categories:
+                lines.append(f"\n{transaction_type} by category:")
+                lines.extend(f"  {category or '(none)'}: ${from_minor(total):.2f}" for category, total in categories)
+        messagebox.showinfo("Summary", "\n".join(lines))
 
     def export_transactions(self):
-        filename = tk.filedialog.asksaveasfilename(defaultextension=".csv", filetypes=(("CSV files", "*.csv"), ("All files", "*.*")))
-        if filename:
-            with open(filename, "w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Date", "Type", "Category", "Amount"])
-                writer.writerows(self.transactions)
+        """Ask for filters and a file, then stream the export on a worker thread.
+
+        The worker only touches the file and a queue; the Tk side polls the queue with after()
+        to show progress, so the window keeps repainting during long exports. Cancel, or closing
+        the window, stops the worker and removes the partial file.
+        """
+        if self.export_thread is not None and self.export_thread.is_alive():
+            messagebox.showinfo("Export", "An export is already running.")
+            return
+        filters = ExportDialog(self).result
+        if filters is None:
+            return
+        filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=EXPORT_FILETYPES)
+        if not filename:
+            return
+        rows = filter_transactions(iter(self.transactions), *filters)
+        self.export_progress = queue.Queue()
+        self.export_cancelled = threading.Event()
+        self.export_thread = threading.Thread(target=self.run_export, args=(filename, rows), daemon=True)
+        self.export_thread.start()
+        self.button_cancel_export.config(state=tk.NORMAL)
+        self.label_export.config(text="Exporting...")
+        self.after(POLL_MS, self.poll_export)
+
+    def run_export(self, filename, rows):
+        try:
+            count = export_or_discard(filename, rows, progress=lambda count: self.export_progress.put(("progress", count)),
+                                      cancelled=self.export_cancelled.is_set)
+            self.export_progress.put(("done", count) if count is not None else ("cancelled", None))
+        except OSError as error:
+            self.export_progress.put(("error", error))
+
+    def poll_export(self):
+        while True:
+            try:
+                status, value = self.export_progress.get_nowait()
+            except queue.Empty:
+                break
+            if status == "progress":
+                self.label_export.config(text=f"Exported {value:,} rows...")
+                continue
+            self.button_cancel_export.config(state=tk.DISABLED)
+            if status == "done":
+                self.label_export.config(text=f"Exported {value:,} rows.")
+            elif status == "cancelled":
+                self.label_export.config(text="Export cancelled.")
+            else:
+                self.label_export.config(text="")
+                messagebox.showerror("Error", f"Export failed: {value}")
+            return
+        self.after(POLL_MS, self.poll_export)
+
+    def cancel_export(self):
+        self.export_cancelled.set()
+        self.label_export.config(text="Cancelling export...")
 
     def update_balance(self):
-        self.label_balance.config(text=f"Balance: ${self.balance:.2f}")
+        self.label_balance.config(text=f"Balance: ${from_minor(self.transactions.balance()):.2f}")
 
     def update_transaction_history(self):
-        self.listbox_transactions.delete(0, tk.END)
-        for date, transaction_type, category, amount in self.transactions:
-            self.listbox_transactions.insert(tk.END, f"{date}: {transaction_type} - {category} - ${amount:.2f}")
+        """The Listbox itself is kept current by ``self.history``; this refreshes the page label."""
+        self.label_page.config(text=self.history.position())
+
+    def page(self, move):
+        move()
+        self.update_transaction_history()
+
+    def close(self):
+        if self.export_thread is not None and self.export_thread.is_alive():
+            # stops within PROGRESS_EVERY rows and removes the partial file
+            self.export_cancelled.set()
+            self.export_thread.join()
+        self.journal.close()
+        self.destroy()
 
     def run(self):
         self.mainloop()
 
+class ExportDialog(tk.Toplevel):
+    """Modal filter choice for an export; ``result`` is (start, end, types) or None if cancelled."""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Export Transactions")
+        self.result = None
+        tk.Label(self, text="From (YYYY-MM-DD, optional):").pack()
+        self.entry_start = tk.Entry(self)
+        self.entry_start.pack()
+        tk.Label(self, text="To (YYYY-MM-DD, optional):").pack()
+        self.entry_end = tk.Entry(self)
+        self.entry_end.pack()
+        self.income = tk.BooleanVar(value=True)
+        self.expense = tk.BooleanVar(value=True)
+        tk.Checkbutton(self, text="Income", variable=self.income).pack()
+        tk.Checkbutton(self, text="Expense", variable=self.expense).pack()
+        tk.Button(self, text="Export", command=self.accept).pack(pady=5)
+        self.transient(master)
+        self.grab_set()
+        self.wait_window()
+
+    def accept(self):
+        limits = []
+        for entry in (self.entry_start, self.entry_end):
+            text = entry.get().strip()
+            limits.append(parse_day(text) if text else None)
+            if text and limits[-1] is None:
+                messagebox.showerror("Error", "Dates must look like 2024-02-27.", parent=self)
+                return
+        types = {name for name, chosen in (("Income", self.income), ("Expense", self.expense)) if chosen.get()}
+        self.result = (limits[0], limits[1], types)
+        self.destroy()
+
+
 if __name__ == "__main__":
     app = MoneyManagerApp()
     app.run()
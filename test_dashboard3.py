@@ -0,0 +1,248 @@
+import csv
+import gzip
+import json
+import random
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from dashboard3 import (filter_transactions, write_export, export_or_discard, to_minor, from_minor, TransactionStore,
+                        PagedHistory, TransactionJournal)
+
+TRANSACTIONS = [("2024-02-20", "Income", "salary", 9000.0), ("2024-02-22", "Expense", "food", 550.0),
+                ("2024-03-07", "Expense", "tour", 700.5), ("last week", "Expense", "bus", 20.0)]
+
+
+def test_filters_by_date_range_and_type():
+    rows = filter_transactions(TRANSACTIONS, date(2024, 2, 21), date(2024, 3, 31), {"Expense"})
+    assert list(rows) == TRANSACTIONS[1:3]
+    assert list(filter_transactions(TRANSACTIONS, types={"Income"})) == TRANSACTIONS[:1]
+    assert list(filter_transactions(TRANSACTIONS)) == TRANSACTIONS
+
+
+def test_exports_csv_gzip_and_json_lines(tmp_path):
+    assert write_export(str(tmp_path / "out.csv"), iter(TRANSACTIONS)) == 4
+    with open(tmp_path / "out.csv", newline="") as file:
+        assert list(csv.reader(file))[1] == ["2024-02-20", "Income", "salary", "9000.0"]
+    write_export(str(tmp_path / "out.csv.gz"), iter(TRANSACTIONS))
+    with gzip.open(tmp_path / "out.csv.gz", "rt", newline="") as file:
+        assert len(list(csv.reader(file))) == 5
+    write_export(str(tmp_path / "out.jsonl"), iter(TRANSACTIONS))
+    lines = (tmp_path / "out.jsonl").read_text().splitlines()
+    assert json.loads(lines[2]) == {"Date": "2024-03-07", "Type": "Expense", "Category": "tour", "Amount": 700.5}
+
+
+def test_reports_progress_and_stops_when_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setattr("dashboard3.PROGRESS_EVERY", 2)
+    seen = []
+    count = write_export(str(tmp_path / "out.csv"), iter(TRANSACTIONS * 3), progress=seen.append,
+                         cancelled=lambda: len(seen) == 2)
+    assert seen == [2, 4] and count == 4
+
+
+def test_cancelled_export_removes_the_partial_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("dashboard3.PROGRESS_EVERY", 2)
+    seen = []
+    assert export_or_discard(str(tmp_path / "out.csv"), iter(TRANSACTIONS * 3), progress=seen.append,
+                             cancelled=lambda: len(seen) == 2) is None
+    assert not (tmp_path / "out.csv").exists()
+    assert export_or_discard(str(tmp_path / "out.csv"), iter(TRANSACTIONS), cancelled=lambda: False) == 4
+
+
+def test_amounts_are_exact_cents():
+    assert [to_minor(text) for text in ("0.1", "19.99", " 3000 ")] == [10, 1999, 300000]
+    for text in ("abc", "nan", "inf", ""):
+        with pytest.raises(ValueError):
+            to_minor(text)
+
+
+def test_store_append_delete_and_iterate():
+    store = TransactionStore()
+    ids = [store.append(day, kind, category, to_minor(str(amount))) for day, kind, category, amount in TRANSACTIONS]
+    assert len(store) == 4 and store[ids[2]] == ("2024-03-07", "Expense", "tour", Decimal("700.50"))
+    assert store.delete(ids[1])[2] == "food"
+    with pytest.raises(KeyError):
+        store.delete(ids[1])
+    assert [row[2] for row in store] == ["salary", "tour", "bus"]
+    assert list(store.ids()) == [ids[0], ids[2], ids[3]] and len(store) == 3
+    assert store.strings.count("Expense") == 0 and len(store.strings) == 8
+
+
+def test_store_widens_for_large_amounts():
+    store = TransactionStore()
+    transaction_id = store.append("2024-01-01", "Income", "lottery", 10 ** 12)
+    assert store.minor(transaction_id) == 10 ** 12
+
+
+def test_totals_follow_appends_and_deletes():
+    store = TransactionStore()
+    ids = [store.append(day, kind, category, to_minor(str(amount))) for day, kind, category, amount in TRANSACTIONS]
+    assert (store.total("Income"), store.total("Expense"), store.balance()) == (900000, 127050, 772950)
+    assert store.by_category("Expense") == {"food": 55000, "tour": 70050, "bus": 2000}
+    store.delete(ids[3])
+    store.append("2024-03-09", "Expense", "food", 1000)
+    assert store.by_category("Expense") == {"food": 56000, "tour": 70050}
+    assert store.balance() == 900000 - 126050
+
+
+class FakeListbox:
+    def __init__(self):
+        self.rows = []
+        self.calls = 0
+
+    def size(self):
+        return len(self.rows)
+
+    def insert(self, index, text):
+        self.calls += 1
+        self.rows.insert(len(self.rows) if index == "end" else index, text)
+
+    def delete(self, first, last=None):
+        self.calls += 1
+        del self.rows[first:len(self.rows) if last == "end" else first + 1]
+
+
+def filled_history(count, page_size=3):
+    store = TransactionStore()
+    history = PagedHistory(FakeListbox(), store, page_size)
+    for i in range(count):
+        history.added(store.append(f"2024-01-{i + 1:02d}", "Income", f"job {i}", 100))
+    return store, history
+
+
+def test_history_adds_slide_the_newest_window():
+    store, history = filled_history(5)
+    assert [row.split(" - ")[1] for row in history.listbox.rows] == ["job 2", "job 3", "job 4"]
+    calls = history.listbox.calls
+    history.added(store.append("2024-01-06", "Expense", "bus", 100))
+    assert history.listbox.calls - calls == 2
+    assert history.position() == "4-6 of 6"
+
+
+def test_history_delete_pulls_in_a_neighbour():
+    store, history = filled_history(5)
+    history.older()
+    assert history.position() == "1-3 of 5"
+    store.delete(history.id_at(1))
+    history.deleted(1)
+    assert [row.split(" - ")[1] for row in history.listbox.rows] == ["job 0", "job 2", "job 3"]
+    history.newer()
+    store.delete(history.id_at(2))
+    history.deleted(2)
+    assert [row.split(" - ")[1] for row in history.listbox.rows] == ["job 0", "job 2", "job 3"]
+    assert history.position() == "1-3 of 3"
+
+
+def test_history_deletes_leave_tombstones_and_compact():
+    store, history = filled_history(40, page_size=4)
+    expected = [row.split(" - ")[1] for row in (history.format(position) for position in range(40))]
+    rng = random.Random(5)
+    for _ in range(120):
+        action = rng.random()
+        if action < 0.3:
+            history.older()
+        elif action < 0.5:
+            history.newer()
+        elif action < 0.6:
+            name = f"new {len(expected)}"
+            history.added(store.append("2024-02-01", "Expense", name, 100))
+            expected.append(name)
+        elif history.listbox.rows:
+            row = rng.randrange(len(history.listbox.rows))
+            expected.remove(store.delete(history.id_at(row))[2])
+            history.deleted(row)
+        shown = [row.split(" - ")[1] for row in history.listbox.rows]
+        assert shown == expected[history.before:history.before + len(shown)]
+        assert len(shown) == min(4, len(expected)) and history.live == len(expected)
+        assert len(history.ids) <= 2 * len(expected) + 4
+
+
+def test_history_does_not_touch_the_listbox_when_an_old_page_is_shown():
+    store, history = filled_history(5)
+    history.older()
+    calls = history.listbox.calls
+    history.added(store.append("2024-01-06", "Expense", "bus", 100))
+    assert history.listbox.calls == calls and history.position() == "1-3 of 6"
+
+
+def test_journal_survives_restart_without_snapshot(tmp_path):
+    journal = TransactionJournal(tmp_path)
+    first = journal.append("2024-02-20", "Income", "salary", 900000)
+    journal.append("2024-02-22", "Expense", "food, snacks", 55000)
+    journal.delete(first)
+    journal.writer.close()  # a crash: no snapshot written
+    reopened = TransactionJournal(tmp_path)
+    assert list(reopened.store) == [("2024-02-22", "Expense", "food, snacks", Decimal("550.00"))]
+    assert list(reopened.store.ids()) == [1] and reopened.store.balance() == -55000
+
+
+def test_journal_snapshots_and_replays_only_the_tail(tmp_path):
+    journal = TransactionJournal(tmp_path, snapshot_every=3)
+    for day in range(1, 6):
+        journal.append(f"2024-03-{day:02d}", "Income", "job", 100)
+    assert journal.generation == 1 and journal.pending == 2
+    assert sorted(path.name for path in tmp_path.glob("journal.*.csv")) == ["journal.0.csv", "journal.1.csv"]
+    journal.writer.close()
+    reopened = TransactionJournal(tmp_path, snapshot_every=3)
+    assert reopened.pending == 2 and len(reopened.store) == 5
+
+
+def test_journal_drops_a_torn_record(tmp_path):
+    journal = TransactionJournal(tmp_path)
+    journal.append("2024-02-20", "Income", "salary", 900000)
+    journal.writer.close()
+    with open(journal.journal_path(), "a") as file:
+        file.write("A,2024-02-21,Expen")
+    reopened = TransactionJournal(tmp_path)
+    reopened.append("2024-02-23", "Expense", "bus", 2000)
+    reopened.close()
+    assert [row[2] for row in TransactionJournal(tmp_path).store] == ["salary", "bus"]
+
+
+def test_snapshot_round_trips_the_store(tmp_path):
+    journal = TransactionJournal(tmp_path)
+    first = journal.append("2024-02-20", "Income", "salary", 900000)
+    journal.append("2024-02-22", "Expense", "food", 2 ** 40)
+    journal.delete(first)
+    journal.close()
+    assert (tmp_path / "snapshot.1.bin").exists() and not list(tmp_path.glob("*.pickle"))
+    store = TransactionJournal(tmp_path).store
+    assert list(store) == [("2024-02-22", "Expense", "food", from_minor(2 ** 40))]
+    assert list(store.ids()) == [1] and store.balance() == -2 ** 40
+    assert store.by_category("Expense") == {"food": 2 ** 40} and store.intern("food") == 2
+
+
+def test_unreadable_snapshot_falls_back_to_the_previous_one(tmp_path):
+    journal = TransactionJournal(tmp_path, snapshot_every=4)
+    for category in "abcd":
+        journal.append("2024-03-01", "Income", category, 100)
+    journal.append("2024-03-02", "Income", "x", 100)
+    journal.append("2024-03-02", "Income", "y", 100)
+    journal.delete(0)
+    journal.writer.close()
+    (tmp_path / "snapshot.1.bin").write_bytes(b'{"version": 99}\n')
+    reopened = TransactionJournal(tmp_path, snapshot_every=4)
+    assert [row[2] for row in reopened.store] == ["b", "c", "d", "x", "y"] and reopened.generation == 1
+    assert (tmp_path / "snapshot.1.unreadable").exists()
+
+
+def test_snapshots_older_than_the_previous_generation_are_removed(tmp_path):
+    journal = TransactionJournal(tmp_path, snapshot_every=2)
+    for day in range(1, 8):
+        journal.append(f"2024-03-{day:02d}", "Income", "job", 100)
+    assert journal.generation == 3
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["journal.2.csv", "journal.3.csv", "snapshot.2.bin",
+                                                                "snapshot.3.bin"]
+
+
+def test_deletes_are_not_replayed_without_a_base(tmp_path):
+    journal = TransactionJournal(tmp_path, snapshot_every=3)
+    for day in range(1, 6):
+        journal.append(f"2024-03-{day:02d}", "Income", "job", 100)
+    journal.delete(0)
+    journal.writer.close()
+    for path in tmp_path.glob("snapshot.*.bin"):
+        path.write_bytes(b"")
+    reopened = TransactionJournal(tmp_path, snapshot_every=3)
+    # only journal.1 (rows 4 and 5, then the delete of row 1) is left; id 0 would now be row 4
+    assert [row[0] for row in reopened.store] == ["2024-03-04", "2024-03-05"]